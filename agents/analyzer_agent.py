@@ -5,8 +5,15 @@ Analyzer Agent - Job description analysis and skills extraction.
 import asyncio
 from typing import Dict, Any, List, Optional
 from agents.base_agent import BaseAgent, AgentState
+from config import Config
 from utils.logger import setup_logger
-import re
+from utils.applied_job_index import get_applied_job_index
+from utils.skill_matcher import SKILL_TAXONOMY, get_skill_matcher
+from utils.jd_feature_extractor import EXPERIENCE_LEVELS, get_jd_feature_extractor
+from utils.batch_analysis import BatchJDAnalyzer
+from utils.skill_matrix import SkillMatrix
+from utils.salary_normalizer import SalaryIndex
+from utils.analysis_cache import get_analysis_cache
 import json
 
 class AnalyzerAgent(BaseAgent):
@@ -16,39 +23,24 @@ class AnalyzerAgent(BaseAgent):
         super().__init__("AnalyzerAgent")
         self.logger = setup_logger("AnalyzerAgent")
         
-        # Common skill categories and keywords
-        self.skill_categories = {
-            'programming_languages': [
-                'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust', 'php', 'ruby',
-                'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'html', 'css', 'bash', 'powershell'
-            ],
-            'frameworks': [
-                'react', 'angular', 'vue', 'node.js', 'django', 'flask', 'spring', 'express', 'laravel',
-                'asp.net', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'jquery'
-            ],
-            'databases': [
-                'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra', 'dynamodb',
-                'sqlite', 'oracle', 'sql server', 'firebase', 'supabase'
-            ],
-            'cloud_platforms': [
-                'aws', 'azure', 'gcp', 'heroku', 'digitalocean', 'linode', 'vultr', 'cloudflare'
-            ],
-            'tools': [
-                'git', 'docker', 'kubernetes', 'jenkins', 'github actions', 'gitlab ci', 'jira',
-                'confluence', 'slack', 'teams', 'zoom', 'figma', 'adobe creative suite'
-            ],
-            'methodologies': [
-                'agile', 'scrum', 'kanban', 'waterfall', 'devops', 'ci/cd', 'tdd', 'bdd', 'lean'
-            ]
-        }
+        # Skill taxonomy shared with the resume and report extractors
+        self.skill_categories = SKILL_TAXONOMY
+        self.skill_matcher = get_skill_matcher()
         
         # Experience level indicators
-        self.experience_levels = {
-            'entry_level': ['entry', 'junior', '0-2', '1-2', '2+', 'recent graduate', 'new grad'],
-            'mid_level': ['mid', 'intermediate', '3-5', '4-6', '5+', 'experienced'],
-            'senior_level': ['senior', 'lead', 'principal', '6+', '8+', '10+', 'expert'],
-            'management': ['manager', 'director', 'head', 'vp', 'cto', 'leadership']
-        }
+        self.experience_levels = EXPERIENCE_LEVELS
+        
+        # Single-pass feature extraction, memoized per description
+        self.feature_extractor = get_jd_feature_extractor()
+        
+        # Process pool for large batches (started on first use)
+        self.batch_analyzer: Optional[BatchJDAnalyzer] = None
+        
+        # Jobs x skills matrix of the last analyzed batch
+        self.skill_matrix: Optional[SkillMatrix] = None
+        
+        # Normalized salaries of the last analyzed batch
+        self.salary_index: Optional[SalaryIndex] = None
     
     async def execute(self, state: AgentState) -> AgentState:
         """Execute the analyzer agent workflow."""
@@ -61,11 +53,18 @@ class AnalyzerAgent(BaseAgent):
                 state.error = "Missing required input for analysis"
                 return state
             
+            # Skip jobs already applied to in earlier runs
+            if Config.SKIP_APPLIED_JOBS:
+                new_jds, known_jds = get_applied_job_index().filter_new(state.extracted_jds)
+                if known_jds:
+                    self.log_action("INFO", f"Skipping analysis of {len(known_jds)} jobs already applied to")
+                    state.extracted_jds = new_jds
+            
             # Analyze job descriptions
             analysis_results = await self._analyze_job_descriptions(state)
             
             # Extract skills and requirements
-            skills_analysis = await self._extract_skills_and_requirements(state)
+            skills_analysis = await self._extract_skills_and_requirements(state, analysis_results)
             
             # Generate analysis summary
             analysis_summary = self._generate_analysis_summary(analysis_results, skills_analysis)
@@ -75,6 +74,8 @@ class AnalyzerAgent(BaseAgent):
             state.skills_analysis = skills_analysis
             state.analysis_summary = analysis_summary
             
+            self._log_cache_stats()
+            
             self.log_action("SUCCESS", f"Analysis completed for {len(analysis_results)} job descriptions")
             return state
             
@@ -93,27 +94,37 @@ class AnalyzerAgent(BaseAgent):
         """Analyze individual job descriptions."""
         
         extracted_jds = getattr(state, 'extracted_jds', [])
+        self.skill_matrix = SkillMatrix()
+        self.salary_index = SalaryIndex.from_jobs(extracted_jds)
+        
+        # Large sets are analyzed off the event loop on the process pool
+        if Config.ANALYZER_BATCH_THRESHOLD and len(extracted_jds) >= Config.ANALYZER_BATCH_THRESHOLD:
+            analysis_results = await self.analyze_batch(extracted_jds)
+            for jd, analysis in zip(extracted_jds, analysis_results):
+                self._add_to_skill_matrix(jd, analysis['analysis'])
+            return analysis_results
+        
         analysis_results = []
         
-        for jd in extracted_jds:
+        # All features come from one pass over each description (memoized per description);
+        # with the spaCy backend every description's skill fragments share one nlp.pipe call
+        try:
+            batch_features = self.feature_extractor.extract_many([jd.get('description', '') for jd in extracted_jds])
+        except Exception as e:
+            self.log_action("WARNING", f"Batched JD analysis failed, analyzing one at a time: {str(e)}")
+            batch_features = [None] * len(extracted_jds)
+        
+        for jd, features in zip(extracted_jds, batch_features):
             try:
                 analysis = {
                     'job_id': jd.get('job_id'),
                     'title': jd.get('title'),
                     'company': jd.get('company'),
-                    'analysis': {
-                        'complexity_score': self._calculate_complexity_score(jd.get('description', '')),
-                        'experience_level': self._identify_experience_level(jd.get('description', '')),
-                        'required_skills': self._extract_required_skills(jd.get('description', '')),
-                        'preferred_skills': self._extract_preferred_skills(jd.get('description', '')),
-                        'responsibilities': self._extract_responsibilities(jd.get('description', '')),
-                        'qualifications': self._extract_qualifications(jd.get('description', '')),
-                        'benefits': self._extract_benefits(jd.get('description', '')),
-                        'company_culture': self._analyze_company_culture(jd.get('description', ''))
-                    }
+                    'analysis': features if features is not None else self.feature_extractor.extract(jd.get('description', ''))
                 }
                 
                 analysis_results.append(analysis)
+                self._add_to_skill_matrix(jd, analysis['analysis'])
                 
             except Exception as e:
                 self.log_action("WARNING", f"Failed to analyze JD for job {jd.get('job_id', 'Unknown')}: {str(e)}")
@@ -121,267 +132,156 @@ class AnalyzerAgent(BaseAgent):
         
         return analysis_results
     
-    async def _extract_skills_and_requirements(self, state: AgentState) -> Dict[str, Any]:
+    async def analyze_batch(self, jds: List[Dict[str, Any]], workers: Optional[int] = None,
+                            chunk_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Analyze a large set of job descriptions across a process pool.
+        
+        Descriptions are sharded into chunks and analyzed in worker processes that
+        compile the skill matcher once each, so the event loop stays responsive.
+        
+        Args:
+            jds: Job description dictionaries (as in ``state.extracted_jds``)
+            workers: Worker processes (defaults to Config.ANALYZER_WORKERS)
+            chunk_size: Descriptions per worker task (defaults to Config.ANALYZER_CHUNK_SIZE)
+            
+        Returns:
+            Analysis results in the same order as ``jds``
+        """
+        if workers is not None or chunk_size is not None:
+            batch_analyzer = BatchJDAnalyzer(workers, chunk_size)
+        else:
+            if self.batch_analyzer is None:
+                self.batch_analyzer = BatchJDAnalyzer()
+            batch_analyzer = self.batch_analyzer
+        
+        self.log_action("INFO", f"Analyzing {len(jds)} job descriptions on {batch_analyzer.workers} worker processes")
+        
+        try:
+            features = await batch_analyzer.analyze_async([jd.get('description', '') for jd in jds])
+        finally:
+            if batch_analyzer is not self.batch_analyzer:
+                batch_analyzer.close()
+        
+        return [
+            {
+                'job_id': jd.get('job_id'),
+                'title': jd.get('title'),
+                'company': jd.get('company'),
+                'analysis': analysis
+            }
+            for jd, analysis in zip(jds, features)
+        ]
+    
+    async def _extract_skills_and_requirements(self, state: AgentState,
+                                               analysis_results: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """Extract and categorize skills and requirements across all jobs."""
         
         extracted_jds = getattr(state, 'extracted_jds', [])
         
+        # Reuse skills and the skill matrix from the per-job analysis when it is available
+        if analysis_results is not None and self.skill_matrix is not None:
+            jd_skills = [
+                (result['analysis']['required_skills'], result['analysis']['preferred_skills'])
+                for result in analysis_results
+            ]
+            skill_matrix = self.skill_matrix
+        else:
+            jd_skills = []
+            skill_matrix = SkillMatrix()
+            batch_features = self.feature_extractor.extract_many([jd.get('description', '') for jd in extracted_jds])
+            for jd, features in zip(extracted_jds, batch_features):
+                jd_skills.append((features['required_skills'], features['preferred_skills']))
+                self._add_to_skill_matrix(jd, features, skill_matrix)
+        
         all_required_skills = set()
         all_preferred_skills = set()
-        skill_frequency = {}
-        category_breakdown = {}
         
-        for jd in extracted_jds:
-            description = jd.get('description', '').lower()
-            
-            # Extract required skills
-            required = self._extract_required_skills(description)
+        for required, preferred in jd_skills:
             all_required_skills.update(required)
-            
-            # Extract preferred skills
-            preferred = self._extract_preferred_skills(description)
             all_preferred_skills.update(preferred)
-            
-            # Count skill frequency
-            for skill in required + preferred:
-                skill_frequency[skill] = skill_frequency.get(skill, 0) + 1
-        
-        # Categorize skills
-        for skill in all_required_skills | all_preferred_skills:
-            category = self._categorize_skill(skill)
-            if category not in category_breakdown:
-                category_breakdown[category] = []
-            category_breakdown[category].append(skill)
         
+        # Frequencies and categories come from the vectorized skill matrix
         return {
             'required_skills': list(all_required_skills),
             'preferred_skills': list(all_preferred_skills),
-            'skill_frequency': skill_frequency,
-            'category_breakdown': category_breakdown,
-            'total_unique_skills': len(all_required_skills | all_preferred_skills)
+            'skill_frequency': skill_matrix.frequency_dict(weighted=True),
+            'category_breakdown': skill_matrix.category_breakdown(),
+            'top_skill_pairs': skill_matrix.top_pairs(10),
+            'total_unique_skills': skill_matrix.num_skills
         }
     
-    def _calculate_complexity_score(self, description: str) -> float:
-        """Calculate a complexity score for the job description."""
-        
-        if not description:
-            return 0.0
-        
-        # Factors that increase complexity
-        complexity_indicators = [
-            'senior', 'lead', 'principal', 'architect', 'expert', 'advanced',
-            'complex', 'challenging', 'strategic', 'leadership', 'management',
-            'mentor', 'coach', 'guide', 'oversee', 'coordinate'
-        ]
-        
-        # Factors that decrease complexity
-        simplicity_indicators = [
-            'entry', 'junior', 'basic', 'simple', 'routine', 'assist',
-            'support', 'learn', 'training', 'guidance', 'supervision'
-        ]
+    def _log_cache_stats(self) -> None:
+        """Log this run's persistent analysis cache hit rate."""
         
-        description_lower = description.lower()
+        analysis_cache = get_analysis_cache()
+        if analysis_cache is None:
+            return
         
-        complexity_score = 0.0
-        complexity_score += sum(description_lower.count(indicator) * 0.1 for indicator in complexity_indicators)
-        complexity_score -= sum(description_lower.count(indicator) * 0.05 for indicator in simplicity_indicators)
-        
-        # Normalize to 0-10 scale
-        complexity_score = max(0.0, min(10.0, complexity_score + 5.0))
+        stats = analysis_cache.get_stats(self.feature_extractor.CACHE_NAMESPACE)
+        if stats["lookups"]:
+            self.log_action("INFO", f"Analysis cache: {stats['hits']}/{stats['lookups']} descriptions reused ({stats['hit_rate']}% hit rate)")
+    
+    def _add_to_skill_matrix(self, jd: Dict[str, Any], features: Dict[str, Any],
+                             skill_matrix: Optional[SkillMatrix] = None) -> None:
+        """Add a job's required and preferred skills as a row of the skill matrix."""
+        
+        skill_matrix = skill_matrix or self.skill_matrix
+        skill_matrix.add_job(
+            features['required_skills'] + features['preferred_skills'],
+            source=jd.get('source'),
+            job_id=jd.get('job_id')
+        )
+    
+    def _calculate_complexity_score(self, description: str) -> float:
+        """Calculate a complexity score for the job description."""
         
-        return round(complexity_score, 2)
+        return self.feature_extractor.extract(description)['complexity_score']
     
     def _identify_experience_level(self, description: str) -> str:
         """Identify the experience level required for the job."""
         
-        if not description:
-            return 'unknown'
-        
-        description_lower = description.lower()
-        
-        for level, indicators in self.experience_levels.items():
-            if any(indicator in description_lower for indicator in indicators):
-                return level
-        
-        return 'unknown'
+        return self.feature_extractor.extract(description)['experience_level']
     
     def _extract_required_skills(self, description: str) -> List[str]:
         """Extract required skills from job description."""
         
-        if not description:
-            return []
-        
-        required_skills = []
-        description_lower = description.lower()
-        
-        # Look for required skills patterns
-        required_patterns = [
-            r'required[:\s]+([^.\n]+)',
-            r'must have[:\s]+([^.\n]+)',
-            r'requirements[:\s]+([^.\n]+)',
-            r'qualifications[:\s]+([^.\n]+)'
-        ]
-        
-        for pattern in required_patterns:
-            matches = re.findall(pattern, description_lower)
-            for match in matches:
-                skills = self._extract_skills_from_text(match)
-                required_skills.extend(skills)
-        
-        return list(set(required_skills))
+        return self.feature_extractor.extract(description)['required_skills']
     
     def _extract_preferred_skills(self, description: str) -> List[str]:
         """Extract preferred skills from job description."""
         
-        if not description:
-            return []
-        
-        preferred_skills = []
-        description_lower = description.lower()
-        
-        # Look for preferred skills patterns
-        preferred_patterns = [
-            r'preferred[:\s]+([^.\n]+)',
-            r'nice to have[:\s]+([^.\n]+)',
-            r'bonus[:\s]+([^.\n]+)',
-            r'plus[:\s]+([^.\n]+)'
-        ]
-        
-        for pattern in preferred_patterns:
-            matches = re.findall(pattern, description_lower)
-            for match in matches:
-                skills = self._extract_skills_from_text(match)
-                preferred_skills.extend(skills)
-        
-        return list(set(preferred_skills))
+        return self.feature_extractor.extract(description)['preferred_skills']
     
     def _extract_responsibilities(self, description: str) -> List[str]:
         """Extract job responsibilities from description."""
         
-        if not description:
-            return []
-        
-        responsibilities = []
-        description_lower = description.lower()
-        
-        # Look for responsibilities section
-        resp_patterns = [
-            r'responsibilities[:\s]+([^.\n]+)',
-            r'duties[:\s]+([^.\n]+)',
-            r'what you\'ll do[:\s]+([^.\n]+)',
-            r'key responsibilities[:\s]+([^.\n]+)'
-        ]
-        
-        for pattern in resp_patterns:
-            matches = re.findall(pattern, description_lower)
-            for match in matches:
-                responsibilities.append(match.strip())
-        
-        return responsibilities
+        return self.feature_extractor.extract(description)['responsibilities']
     
     def _extract_qualifications(self, description: str) -> List[str]:
         """Extract qualifications from job description."""
         
-        if not description:
-            return []
-        
-        qualifications = []
-        description_lower = description.lower()
-        
-        # Look for qualifications section
-        qual_patterns = [
-            r'qualifications[:\s]+([^.\n]+)',
-            r'requirements[:\s]+([^.\n]+)',
-            r'education[:\s]+([^.\n]+)',
-            r'experience[:\s]+([^.\n]+)'
-        ]
-        
-        for pattern in qual_patterns:
-            matches = re.findall(pattern, description_lower)
-            for match in matches:
-                qualifications.append(match.strip())
-        
-        return qualifications
+        return self.feature_extractor.extract(description)['qualifications']
     
     def _extract_benefits(self, description: str) -> List[str]:
         """Extract benefits from job description."""
         
-        if not description:
-            return []
-        
-        benefits = []
-        description_lower = description.lower()
-        
-        # Look for benefits section
-        benefit_patterns = [
-            r'benefits[:\s]+([^.\n]+)',
-            r'perks[:\s]+([^.\n]+)',
-            r'what we offer[:\s]+([^.\n]+)',
-            r'compensation[:\s]+([^.\n]+)'
-        ]
-        
-        for pattern in benefit_patterns:
-            matches = re.findall(pattern, description_lower)
-            for match in matches:
-                benefits.append(match.strip())
-        
-        return benefits
+        return self.feature_extractor.extract(description)['benefits']
     
     def _analyze_company_culture(self, description: str) -> Dict[str, Any]:
         """Analyze company culture indicators from job description."""
         
-        if not description:
-            return {}
-        
-        description_lower = description.lower()
-        
-        culture_indicators = {
-            'remote_friendly': ['remote', 'work from home', 'wfh', 'hybrid', 'flexible location'],
-            'collaborative': ['team', 'collaborate', 'collaboration', 'partnership', 'coordinate'],
-            'innovative': ['innovate', 'innovation', 'creative', 'cutting-edge', 'latest technology'],
-            'fast_paced': ['fast-paced', 'dynamic', 'agile', 'quick', 'rapid'],
-            'learning_focused': ['learn', 'learning', 'growth', 'development', 'training'],
-            'diverse': ['diversity', 'inclusive', 'inclusion', 'equal opportunity', 'diverse team']
-        }
-        
-        culture_analysis = {}
-        for aspect, indicators in culture_indicators.items():
-            culture_analysis[aspect] = any(indicator in description_lower for indicator in indicators)
-        
-        return culture_analysis
+        return self.feature_extractor.extract(description)['company_culture']
     
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """Extract individual skills from text."""
         
-        skills = []
-        text_lower = text.lower()
-        
-        # Check each skill category
-        for category, skill_list in self.skill_categories.items():
-            for skill in skill_list:
-                if skill in text_lower:
-                    skills.append(skill)
-        
-        # Also look for custom skills mentioned
-        # This is a simplified approach - in practice, you might use NLP or ML
-        custom_skills = re.findall(r'\b[a-zA-Z][a-zA-Z0-9\s&+.-]+\b', text)
-        for skill in custom_skills:
-            skill_clean = skill.strip().lower()
-            if len(skill_clean) > 2 and skill_clean not in skills:
-                skills.append(skill_clean)
-        
-        return skills
+        return self.feature_extractor.extract_skills_from_text(text)
     
     def _categorize_skill(self, skill: str) -> str:
         """Categorize a skill into predefined categories."""
         
-        skill_lower = skill.lower()
-        
-        for category, skills in self.skill_categories.items():
-            if skill_lower in skills:
-                return category
-        
-        return 'other'
+        return self.skill_matcher.categorize(skill)
     
     def _generate_analysis_summary(self, analysis_results: List[Dict], skills_analysis: Dict) -> Dict[str, Any]:
         """Generate a comprehensive analysis summary."""
@@ -406,11 +306,14 @@ class AnalyzerAgent(BaseAgent):
         most_common_level = max(experience_counts.items(), key=lambda x: x[1])[0] if experience_counts else 'unknown'
         
         # Top skills
-        top_skills = sorted(
-            skills_analysis.get('skill_frequency', {}).items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:10]
+        if self.skill_matrix is not None:
+            top_skills = self.skill_matrix.top_k(10, weighted=True)
+        else:
+            top_skills = sorted(
+                skills_analysis.get('skill_frequency', {}).items(),
+                key=lambda x: x[1],
+                reverse=True
+            )[:10]
         
         return {
             'total_jobs_analyzed': total_jobs,
@@ -419,10 +322,32 @@ class AnalyzerAgent(BaseAgent):
             'total_unique_skills': skills_analysis.get('total_unique_skills', 0),
             'top_required_skills': top_skills,
             'skill_categories': skills_analysis.get('category_breakdown', {}),
+            'salary_summary': self._generate_salary_summary(),
             'analysis_timestamp': asyncio.get_event_loop().time()
         }
     
+    def _generate_salary_summary(self) -> Dict[str, Any]:
+        """Summarize annualized salaries overall, per role and per location."""
+        
+        if self.salary_index is None:
+            return {}
+        
+        min_confidence = Config.SALARY_MIN_CONFIDENCE
+        overall = self.salary_index.percentiles(min_confidence=min_confidence)['all']
+        
+        return {
+            'currency': self.salary_index.normalizer.base_currency,
+            'jobs_with_salary': overall['count'],
+            'overall': overall,
+            'by_role': self.salary_index.percentiles(by='role', min_confidence=min_confidence),
+            'by_location': self.salary_index.percentiles(by='location', min_confidence=min_confidence)
+        }
+    
     async def close(self):
         """Clean up resources."""
         
+        if self.batch_analyzer is not None:
+            self.batch_analyzer.close()
+            self.batch_analyzer = None
+        
         self.log_action("INFO", "Analyzer agent resources cleaned up")
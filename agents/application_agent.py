@@ -12,15 +12,33 @@ from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 from agents.base_agent import BaseAgent, AgentState
 from config import Config
 from utils.logger import setup_logger
+from utils.web_utils import WebUtils
+from utils.browser_context_manager import BrowserContextManager
+from utils.url_liveness import URLLivenessChecker
+from utils.applied_job_index import get_applied_job_index
 
 class ApplicationAgent(BaseAgent):
     """Agent for automating job applications using web automation."""
     
+    # Selectors tried in order when looking for a job's apply button
+    APPLY_SELECTORS = [
+        "button[data-test='apply-button']",
+        "button:has-text('Apply')",
+        "button:has-text('Apply Now')",
+        "a[data-test='apply-link']",
+        "a:has-text('Apply')",
+        ".apply-button",
+        "[data-test='apply']",
+        "input[value*='Apply']",
+        "input[value*='Submit']"
+    ]
+    
     def __init__(self):
         super().__init__("ApplicationAgent")
         self.browser = None
-        self.context = None
+        self.context_manager = None
         self.page = None
+        self.memory_report = None
         self.logger = setup_logger("ApplicationAgent")
         
     async def execute(self, state: AgentState) -> AgentState:
@@ -62,13 +80,41 @@ class ApplicationAgent(BaseAgent):
         
         applications = []
         
-        for job in jobs[:min(len(jobs), 10)]:  # Limit to 10 applications
+        # Skip jobs applied to in earlier runs before any network or browser work
+        applied_index = get_applied_job_index() if Config.SKIP_APPLIED_JOBS else None
+        if applied_index is not None:
+            jobs, known_jobs = applied_index.filter_new(jobs)
+            if known_jobs:
+                self.log_action("INFO", f"Skipping {len(known_jobs)} jobs already applied to in earlier runs")
+        
+        # Drop expired or removed postings before they reach the browser
+        if Config.JOB_LIVENESS_CHECK:
+            jobs, dead_jobs = await URLLivenessChecker().filter_live_jobs(jobs)
+            for dead_job in dead_jobs:
+                self.log_action("INFO", f"Skipping {dead_job.get('title', 'Unknown')} at {dead_job.get('company', 'Unknown')}: "
+                              f"{dead_job['liveness']['reason']}")
+        
+        jobs_to_apply = jobs[:min(len(jobs), 10)]  # Limit to 10 applications
+        
+        for index, job in enumerate(jobs_to_apply):
+            next_job = jobs_to_apply[index + 1] if index + 1 < len(jobs_to_apply) else None
+            
             try:
                 self.log_action("INFO", f"Applying to: {job.get('title', 'Unknown')} at {job.get('company', 'Unknown')}")
                 
-                application_result = await self._apply_to_single_job(job, state)
+                application_result = await self._apply_to_single_job(job, state, next_job)
+                
+                # Restart a crashed renderer and retry this job once; earlier results are kept
+                if self.context_manager.page_crashed:
+                    self.log_action("WARNING", f"Page crashed while applying to {job.get('title', 'Unknown')} - restarting page")
+                    self.page = await self.context_manager.recover()
+                    application_result = await self._apply_to_single_job(job, state, next_job)
+                
                 applications.append(application_result)
                 
+                if applied_index is not None and application_result.get("status") == "success":
+                    applied_index.add(job)
+                
                 # Wait between applications to avoid being flagged as bot
                 await asyncio.sleep(random.uniform(3, 8))
                 
@@ -82,10 +128,14 @@ class ApplicationAgent(BaseAgent):
                     "timestamp": datetime.now().isoformat()
                 })
         
+        if applied_index is not None:
+            applied_index.save()
+        
         return applications
     
-    async def _apply_to_single_job(self, job: Dict[str, Any], state: AgentState) -> Dict[str, Any]:
-        """Apply to a single job."""
+    async def _apply_to_single_job(self, job: Dict[str, Any], state: AgentState,
+                                   next_job: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Apply to a single job, optionally prefetching the next one."""
         
         try:
             # Navigate to job page
@@ -98,30 +148,18 @@ class ApplicationAgent(BaseAgent):
                     "timestamp": datetime.now().isoformat()
                 }
             
-            await self.page.goto(job['url'])
-            await self.page.wait_for_load_state("networkidle")
+            # Use the page prefetched while the previous job was being submitted, if any
+            prefetched = await self.context_manager.take_prefetched(job['url'])
+            if prefetched:
+                self.page, apply_button = prefetched
+            else:
+                self.page = await self.context_manager.navigate(job['url'])
+                await self.page.wait_for_load_state("networkidle")
+                apply_button = await self._find_apply_button(self.page)
             
-            # Look for apply button
-            apply_selectors = [
-                "button[data-test='apply-button']",
-                "button:has-text('Apply')",
-                "button:has-text('Apply Now')",
-                "a[data-test='apply-link']",
-                "a:has-text('Apply')",
-                ".apply-button",
-                "[data-test='apply']",
-                "input[value*='Apply']",
-                "input[value*='Submit']"
-            ]
-            
-            apply_button = None
-            for selector in apply_selectors:
-                try:
-                    apply_button = await self.page.query_selector(selector)
-                    if apply_button:
-                        break
-                except:
-                    continue
+            # Start loading the next job in a background tab while this one is filled in
+            if Config.WEB_APPLY_PIPELINE and next_job and next_job.get('url'):
+                await self.context_manager.prefetch(next_job['url'], self._find_apply_button)
             
             if not apply_button:
                 return {
@@ -156,6 +194,11 @@ class ApplicationAgent(BaseAgent):
                 "timestamp": datetime.now().isoformat()
             }
     
+    async def _find_apply_button(self, page: Page):
+        """Find the apply button on a job page."""
+        
+        return await WebUtils.query_first(page, self.APPLY_SELECTORS)
+    
     async def _handle_application_form(self, job: Dict[str, Any], state: AgentState) -> bool:
         """Handle the job application form if it appears."""
         
@@ -336,33 +379,32 @@ class ApplicationAgent(BaseAgent):
                     ]
                 )
                 
-                # Create context with specific user agent and stealth settings
-                self.context = await self.browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    viewport={"width": 1920, "height": 1080},
-                    locale="en-US",
-                    timezone_id="America/New_York"
+                # Contexts are created and recycled by the context manager to cap memory
+                # growth on long application batches
+                self.context_manager = BrowserContextManager(
+                    self.browser,
+                    context_options={
+                        "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                        "viewport": {"width": 1920, "height": 1080},
+                        "locale": "en-US",
+                        "timezone_id": "America/New_York"
+                    },
+                    page_headers={
+                        "Accept-Language": "en-US,en;q=0.9",
+                        "Accept-Encoding": "gzip, deflate, br",
+                        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+                        "Sec-Fetch-Dest": "document",
+                        "Sec-Fetch-Mode": "navigate",
+                        "Sec-Fetch-Site": "none"
+                    },
+                    # Stealth script to avoid detection
+                    init_script="""
+                        Object.defineProperty(navigator, 'webdriver', {
+                            get: () => undefined,
+                        });
+                    """
                 )
-                
-                # Create new page
-                self.page = await self.context.new_page()
-                
-                # Set extra headers for better compatibility
-                await self.page.set_extra_http_headers({
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                    "Sec-Fetch-Dest": "document",
-                    "Sec-Fetch-Mode": "navigate",
-                    "Sec-Fetch-Site": "none"
-                })
-                
-                # Add stealth scripts to avoid detection
-                await self.page.add_init_script("""
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined,
-                    });
-                """)
+                self.page = await self.context_manager.start()
                 
                 self.log_action("SUCCESS", "Playwright browser initialization successful")
                 return
@@ -388,13 +430,12 @@ class ApplicationAgent(BaseAgent):
         """Close Playwright browser."""
         
         try:
-            if self.page:
-                await self.page.close()
-                self.page = None
+            if self.context_manager:
+                await self.context_manager.close()
+                self._log_memory_report()
+                self.context_manager = None
             
-            if self.context:
-                await self.context.close()
-                self.context = None
+            self.page = None
             
             if self.browser:
                 await self.browser.close()
@@ -404,3 +445,16 @@ class ApplicationAgent(BaseAgent):
             
         except Exception as e:
             self.log_action("WARNING", f"Error closing browser: {str(e)}")
+    
+    def _log_memory_report(self):
+        """Log navigation counts and peak browser memory for each context used in this run."""
+        
+        self.memory_report = self.context_manager.get_memory_report()
+        
+        for context_stats in self.memory_report["contexts"]:
+            self.log_action("INFO", f"Browser context {context_stats['context_id']}: "
+                          f"{context_stats['navigations']} navigations, {context_stats['crashes']} crashes, "
+                          f"peak memory {context_stats['peak_rss_mb']:.0f} MB (closed: {context_stats['close_reason']})")
+        
+        if not self.memory_report["memory_tracking"]:
+            self.log_action("WARNING", "psutil not installed - browser memory usage not tracked")
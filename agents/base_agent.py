@@ -36,6 +36,7 @@ class AgentState(BaseModel):
     all_jobs: list = Field(default_factory=list, description="All jobs found across sources")
     extracted_jds: list = Field(default_factory=list, description="Extracted job descriptions")
     job_links: list = Field(default_factory=list, description="Job application links")
+    filter_stats: Optional[Dict[str, Any]] = Field(default=None, description="Job filter pass and per-rule rejection counts")
     tracking_results: Optional[Dict[str, Any]] = Field(default=None, description="Application tracking results")
     monitoring_results: Optional[Dict[str, Any]] = Field(default=None, description="Monitoring results")
     tracking_report: Optional[Dict[str, Any]] = Field(default=None, description="Tracking report")
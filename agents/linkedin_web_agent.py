@@ -13,19 +13,38 @@ from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 from agents.base_agent import BaseAgent, AgentState
 from config import Config
 from utils.logger import setup_logger
+from utils.browser_context_manager import BrowserContextManager
+from utils.url_liveness import URLLivenessChecker
+from utils.applied_job_index import get_applied_job_index
 from utils.web_utils import WebUtils
+from utils.web_session_recorder import WebSessionRecorder
+from utils.relevance_engine import build_relevance_query, rank_jobs
+from utils.job_filter import get_job_filter
+from utils.location_normalizer import get_location_normalizer
 
 class LinkedInWebAgent(BaseAgent):
     """Agent for searching and applying to jobs on LinkedIn using web automation."""
     
+    # Selectors tried in order when looking for a job's apply button
+    APPLY_SELECTORS = [
+        "button[data-test='apply-button']",
+        "button:has-text('Apply')",
+        "a[data-test='apply-link']",
+        "a:has-text('Apply')",
+        ".apply-button",
+        "[data-test='apply']"
+    ]
+    
     def __init__(self):
         super().__init__("LinkedInWebAgent")
         self.base_url = "https://www.linkedin.com"
         self.browser = None
-        self.context = None
+        self.context_manager = None
         self.page = None
+        self.memory_report = None
         self.logger = setup_logger("LinkedInWebAgent")
         self.is_authenticated = False
+        self.recorder = WebSessionRecorder("linkedin")
         
     async def execute(self, state: AgentState) -> AgentState:
         """Execute LinkedIn job search and application workflow using web automation."""
@@ -34,7 +53,10 @@ class LinkedInWebAgent(BaseAgent):
             self.log_action("STARTING", "Starting LinkedIn web-based job search")
             
             # Step 1: Try to authenticate with LinkedIn
-            if not await self._authenticate_with_retry(state):
+            async with self.recorder.phase("login"):
+                authenticated = await self._authenticate_with_retry(state)
+            
+            if not authenticated:
                 # If authentication fails due to blocking, use fallback data
                 if await self._detect_access_block():
                     self.log_action("WARNING", "LinkedIn access blocked - using fallback data")
@@ -61,7 +83,8 @@ class LinkedInWebAgent(BaseAgent):
             
             # Step 4: Apply to selected jobs (if auto-apply is enabled)
             if state.auto_apply and filtered_jobs:
-                application_results = await self._apply_to_jobs_web(filtered_jobs, state)
+                async with self.recorder.phase("apply"):
+                    application_results = await self._apply_to_jobs_web(filtered_jobs, state)
                 state.linkedin_applications = application_results
                 state.steps_completed.append("linkedin_applications")
             
@@ -86,7 +109,7 @@ class LinkedInWebAgent(BaseAgent):
                 await self._init_browser()
             
             # Navigate to LinkedIn login page
-            await self.page.goto(f"{self.base_url}/login")
+            self.page = await self.context_manager.navigate(f"{self.base_url}/login")
             await WebUtils.wait_for_page_load(self.page, WebUtils.AUTH_TIMEOUT)
             
             # Wait for login form to be visible with multiple selector strategies
@@ -211,32 +234,36 @@ class LinkedInWebAgent(BaseAgent):
             if not self.is_authenticated:
                 return {"status": "error", "error": "Not authenticated"}
             
-            # Navigate to job search page
-            search_url = f"{self.base_url}/jobs"
-            await self.page.goto(search_url)
-            await WebUtils.wait_for_page_load(self.page, WebUtils.SEARCH_TIMEOUT)
+            async with self.recorder.phase("search"):
+                # Navigate to job search page
+                search_url = f"{self.base_url}/jobs"
+                self.page = await self.context_manager.navigate(search_url)
+                await WebUtils.wait_for_page_load(self.page, WebUtils.SEARCH_TIMEOUT)
             
-            # Fill in search criteria
-            await self._fill_search_form(state)
+                # Fill in search criteria
+                await self._fill_search_form(state)
             
-            # Submit search with multiple button strategies
-            submit_success = await WebUtils.click_element_smart(
-                self.page,
-                ["button[type='submit']", "input[type='submit']", "button:has-text('Search')", ".search-button"],
-                WebUtils.SEARCH_TIMEOUT
-            )
+                # Submit search with multiple button strategies
+                submit_success = await WebUtils.click_element_smart(
+                    self.page,
+                    ["button[type='submit']", "input[type='submit']", "button:has-text('Search')", ".search-button"],
+                    WebUtils.SEARCH_TIMEOUT
+                )
             
-            if not submit_success:
-                raise Exception("Search submit button not found or not clickable")
+                if not submit_success:
+                    raise Exception("Search submit button not found or not clickable")
             
-            # Wait for search results to load with extended timeout
-            await WebUtils.wait_for_page_load(self.page, WebUtils.SEARCH_TIMEOUT)
+                # Wait for search results to load with extended timeout
+                await WebUtils.wait_for_page_load(self.page, WebUtils.SEARCH_TIMEOUT)
+            
+                # Additional wait for job listings to appear
+                await asyncio.sleep(3)
             
-            # Additional wait for job listings to appear
-            await asyncio.sleep(3)
+            await self.recorder.snapshot_dom(self.page, "search_results")
             
             # Extract job listings
-            jobs = await self._extract_job_listings()
+            async with self.recorder.phase("extraction"):
+                jobs = await self._extract_job_listings()
             
             return {
                 "status": "success",
@@ -261,16 +288,16 @@ class LinkedInWebAgent(BaseAgent):
                 await self.page.fill("input[name='location'], input[placeholder*='location']", state.location)
             
             # Additional keywords
-            if hasattr(Config, 'KEYWORDS') and Config.KEYWORDS:
-                keywords_text = " ".join(Config.KEYWORDS)
+            if Config.JOB_SEARCH_KEYWORDS:
+                keywords_text = " ".join(Config.JOB_SEARCH_KEYWORDS)
                 # Look for additional keywords field or add to main search
                 keyword_inputs = await self.page.query_selector_all("input[name*='keyword'], input[placeholder*='skill']")
                 if keyword_inputs:
                     await keyword_inputs[0].fill(keywords_text)
             
             # Job type (if available)
-            if hasattr(Config, 'JOB_TYPES') and Config.JOB_TYPES:
-                job_type = Config.JOB_TYPES[0]  # Use first job type
+            if Config.JOB_TYPE:
+                job_type = Config.JOB_TYPE[0]  # Use first job type
                 job_type_selectors = [
                     "select[name='jobType']",
                     "select[name='employmentType']",
@@ -287,8 +314,8 @@ class LinkedInWebAgent(BaseAgent):
                         continue
             
             # Experience level (if available)
-            if hasattr(Config, 'EXPERIENCE_LEVELS') and Config.EXPERIENCE_LEVELS:
-                exp_level = Config.EXPERIENCE_LEVELS[0]  # Use first experience level
+            if Config.EXPERIENCE_LEVEL:
+                exp_level = Config.EXPERIENCE_LEVEL[0]  # Use first experience level
                 exp_selectors = [
                     "select[name='experienceLevel']",
                     "select[name='seniority']",
@@ -395,6 +422,14 @@ class LinkedInWebAgent(BaseAgent):
         if not jobs:
             return []
         
+        # Preference rules first, so rejected jobs are never scored or applied to
+        if Config.JOB_FILTER_ENABLED:
+            jobs, rejection_counts = get_job_filter().apply(jobs)
+            rejected = sum(rejection_counts.values())
+            if rejected:
+                details = ", ".join(f"{rule}: {count}" for rule, count in rejection_counts.items() if count)
+                self.log_action("INFO", f"Job filter rejected {rejected} jobs ({details})")
+        
         filtered_jobs = []
         
         for job in jobs:
@@ -410,6 +445,11 @@ class LinkedInWebAgent(BaseAgent):
         # Sort by score (highest first)
         filtered_jobs.sort(key=lambda x: x.get('score', 0), reverse=True)
         
+        # Order the jobs that passed the criteria by how well they match the resume
+        if Config.RELEVANCE_RANKING and filtered_jobs:
+            query = build_relevance_query(state.role, state.resume_path)
+            filtered_jobs = rank_jobs(filtered_jobs, query)
+        
         return filtered_jobs
     
     async def _calculate_job_score(self, job: Dict[str, Any], state: AgentState) -> float:
@@ -424,16 +464,15 @@ class LinkedInWebAgent(BaseAgent):
             
             if role in title:
                 score += 30
-            elif any(keyword.lower() in title for keyword in (Config.KEYWORDS or [])):
+            elif any(keyword.lower() in title for keyword in (Config.JOB_SEARCH_KEYWORDS or [])):
                 score += 20
             
-            # Location relevance
-            job_location = job.get('location', '').lower()
-            target_location = state.location.lower() if state.location else ""
+            # Location relevance on canonical places ("NYC" matches "New York, NY")
+            location_match = get_location_normalizer().match(job.get('location', ''), state.location or "")
             
-            if target_location in job_location:
+            if location_match >= 1.0:
                 score += 25
-            elif any(loc.lower() in job_location for loc in (Config.KEYWORDS or [])):
+            elif location_match >= 0.5:
                 score += 15
             
             # Company quality (basic scoring)
@@ -462,15 +501,44 @@ class LinkedInWebAgent(BaseAgent):
         
         applications = []
         
-        for job in jobs[:min(len(jobs), 5)]:  # Limit to 5 applications
+        # Skip jobs applied to in earlier runs before any network or browser work
+        applied_index = get_applied_job_index() if Config.SKIP_APPLIED_JOBS and not self.recorder.is_replaying else None
+        if applied_index is not None:
+            jobs, known_jobs = applied_index.filter_new(jobs)
+            if known_jobs:
+                self.log_action("INFO", f"Skipping {len(known_jobs)} jobs already applied to in earlier runs")
+        
+        # Drop expired or removed postings before they reach the browser
+        if Config.JOB_LIVENESS_CHECK and not self.recorder.is_replaying:
+            jobs, dead_jobs = await URLLivenessChecker().filter_live_jobs(jobs)
+            for dead_job in dead_jobs:
+                self.log_action("INFO", f"Skipping {dead_job.get('title', 'Unknown')} at {dead_job.get('company', 'Unknown')}: "
+                              f"{dead_job['liveness']['reason']}")
+        
+        jobs_to_apply = jobs[:min(len(jobs), 5)]  # Limit to 5 applications
+        
+        for index, job in enumerate(jobs_to_apply):
+            next_job = jobs_to_apply[index + 1] if index + 1 < len(jobs_to_apply) else None
+            
             try:
                 self.log_action("INFO", f"Applying to: {job.get('title', 'Unknown')} at {job.get('company', 'Unknown')}")
                 
-                application_result = await self._apply_to_single_job(job, state)
+                application_result = await self._apply_to_single_job(job, state, next_job)
+                
+                # Restart a crashed renderer and retry this job once; earlier results are kept
+                if self.context_manager.page_crashed:
+                    self.log_action("WARNING", f"Page crashed while applying to {job.get('title', 'Unknown')} - restarting page")
+                    self.page = await self.context_manager.recover()
+                    application_result = await self._apply_to_single_job(job, state, next_job)
+                
                 applications.append(application_result)
                 
-                # Wait between applications
-                await asyncio.sleep(random.uniform(2, 5))
+                if applied_index is not None and application_result.get("status") == "success":
+                    applied_index.add(job)
+                
+                # Wait between applications (skipped when replaying a recorded session)
+                if not self.recorder.is_replaying:
+                    await asyncio.sleep(random.uniform(2, 5))
                 
             except Exception as e:
                 self.log_action("ERROR", f"Error applying to job {job.get('title', 'Unknown')}: {str(e)}")
@@ -481,10 +549,14 @@ class LinkedInWebAgent(BaseAgent):
                     "error": str(e)
                 })
         
+        if applied_index is not None:
+            applied_index.save()
+        
         return applications
     
-    async def _apply_to_single_job(self, job: Dict[str, Any], state: AgentState) -> Dict[str, Any]:
-        """Apply to a single job."""
+    async def _apply_to_single_job(self, job: Dict[str, Any], state: AgentState,
+                                   next_job: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Apply to a single job, optionally prefetching the next one."""
         
         try:
             # Navigate to job page
@@ -496,27 +568,20 @@ class LinkedInWebAgent(BaseAgent):
                     "error": "No job URL available"
                 }
             
-            await self.page.goto(job['url'])
-            await self.page.wait_for_load_state("networkidle")
+            # Use the page prefetched while the previous job was being submitted, if any
+            prefetched = await self.context_manager.take_prefetched(job['url'])
+            if prefetched:
+                self.page, apply_button = prefetched
+            else:
+                self.page = await self.context_manager.navigate(job['url'])
+                await self.page.wait_for_load_state("networkidle")
+                apply_button = await self._find_apply_button(self.page)
             
-            # Look for apply button
-            apply_selectors = [
-                "button[data-test='apply-button']",
-                "button:has-text('Apply')",
-                "a[data-test='apply-link']",
-                "a:has-text('Apply')",
-                ".apply-button",
-                "[data-test='apply']"
-            ]
+            await self.recorder.snapshot_dom(self.page, f"job_{job.get('id', 'page')}")
             
-            apply_button = None
-            for selector in apply_selectors:
-                try:
-                    apply_button = await self.page.query_selector(selector)
-                    if apply_button:
-                        break
-                except:
-                    continue
+            # Start loading the next job in a background tab while this one is filled in
+            if Config.WEB_APPLY_PIPELINE and next_job and next_job.get('url'):
+                await self.context_manager.prefetch(next_job['url'], self._find_apply_button)
             
             if not apply_button:
                 return {
@@ -548,6 +613,11 @@ class LinkedInWebAgent(BaseAgent):
                 "error": str(e)
             }
     
+    async def _find_apply_button(self, page: Page):
+        """Find the apply button on a job page."""
+        
+        return await WebUtils.query_first(page, self.APPLY_SELECTORS)
+    
     async def _handle_application_form(self, state: AgentState) -> bool:
         """Handle the job application form if it appears."""
         
@@ -641,7 +711,7 @@ class LinkedInWebAgent(BaseAgent):
                 
                 # Launch browser with options
                 self.browser = await playwright.chromium.launch(
-                    headless=False,  # Set to True for production
+                    headless=Config.WEB_AUTOMATION_HEADLESS,
                     args=[
                         "--no-sandbox",
                         "--disable-dev-shm-usage",
@@ -652,21 +722,22 @@ class LinkedInWebAgent(BaseAgent):
                     ]
                 )
                 
-                # Create context with specific user agent
-                self.context = await self.browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    viewport={"width": 1920, "height": 1080}
+                # Contexts are created and recycled by the context manager, which also routes
+                # them through the recorder when recording or replaying
+                self.context_manager = BrowserContextManager(
+                    self.browser,
+                    context_options={
+                        "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                        "viewport": {"width": 1920, "height": 1080}
+                    },
+                    page_headers={
+                        "Accept-Language": "en-US,en;q=0.9",
+                        "Accept-Encoding": "gzip, deflate, br",
+                        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8"
+                    },
+                    recorder=self.recorder
                 )
-                
-                # Create new page
-                self.page = await self.context.new_page()
-                
-                # Set extra headers for better compatibility
-                await self.page.set_extra_http_headers({
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8"
-                })
+                self.page = await self.context_manager.start()
                 
                 self.log_action("SUCCESS", "Playwright browser initialization successful")
                 return
@@ -692,13 +763,13 @@ class LinkedInWebAgent(BaseAgent):
         """Close Playwright browser."""
         
         try:
-            if self.page:
-                await self.page.close()
-                self.page = None
+            if self.context_manager:
+                await self.context_manager.close()
+                self._log_memory_report()
+                self.context_manager = None
+                self.recorder.save_manifest()
             
-            if self.context:
-                await self.context.close()
-                self.context = None
+            self.page = None
             
             if self.browser:
                 await self.browser.close()
@@ -709,6 +780,20 @@ class LinkedInWebAgent(BaseAgent):
         except Exception as e:
             self.log_action("WARNING", f"Error closing browser: {str(e)}")
     
+    
+    def _log_memory_report(self):
+        """Log navigation counts and peak browser memory for each context used in this run."""
+        
+        self.memory_report = self.context_manager.get_memory_report()
+        
+        for context_stats in self.memory_report["contexts"]:
+            self.log_action("INFO", f"Browser context {context_stats['context_id']}: "
+                          f"{context_stats['navigations']} navigations, {context_stats['crashes']} crashes, "
+                          f"peak memory {context_stats['peak_rss_mb']:.0f} MB (closed: {context_stats['close_reason']})")
+        
+        if not self.memory_report["memory_tracking"]:
+            self.log_action("WARNING", "psutil not installed - browser memory usage not tracked")
+    
     async def _detect_access_block(self) -> bool:
         """Detect if we're facing access blocking or security challenges."""
         
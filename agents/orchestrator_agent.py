@@ -17,6 +17,7 @@ from agents.resume_agent import ResumeAgent
 from agents.application_agent import ApplicationAgent
 from agents.tracker_agent import TrackerAgent
 from config import Config
+from utils.llm_scheduler import get_llm_scheduler
 from utils.logger import setup_logger
 
 class OrchestratorAgent(BaseAgent):
@@ -401,6 +402,9 @@ class OrchestratorAgent(BaseAgent):
             state.current_step = "orchestrator_start"
             state.status = "running"
             
+            # LLM token and cost ceilings apply per workflow run
+            get_llm_scheduler().reset_stats()
+            
             # Compile and run the workflow
             app = self.workflow.compile()
             
@@ -4,6 +4,9 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 from agents.base_agent import BaseAgent, AgentState
 from job_config import JobConfig
+from config import Config
+from utils.relevance_engine import build_relevance_query, rank_jobs
+from utils.job_filter import get_job_filter
 import logging
 
 class ParallelJobSearchOrchestrator(BaseAgent):
@@ -46,7 +49,8 @@ class ParallelJobSearchOrchestrator(BaseAgent):
             all_jobs, search_results = await self._execute_parallel_searches(search_tasks)
             
             # Remove duplicates and rank results
-            unique_jobs = self._remove_duplicates_and_rank(all_jobs)
+            query = build_relevance_query(role, state.resume_path) if Config.RELEVANCE_RANKING else ""
+            unique_jobs = self._remove_duplicates_and_rank(all_jobs, query)
             
             self.log_action("COMPLETE", f"Found {len(unique_jobs)} unique jobs from {len(search_results)} sources")
             
@@ -201,8 +205,8 @@ class ParallelJobSearchOrchestrator(BaseAgent):
             self.log_action("ERROR", f"Failed to execute search for {source_name}: {str(e)}")
             return []
     
-    def _remove_duplicates_and_rank(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicates and rank jobs by relevance."""
+    def _remove_duplicates_and_rank(self, jobs: List[Dict[str, Any]], query: str = "") -> List[Dict[str, Any]]:
+        """Remove duplicates and rank jobs by resume match, then by source relevance."""
         seen = set()
         unique_jobs = []
         
@@ -217,9 +221,20 @@ class ParallelJobSearchOrchestrator(BaseAgent):
                 job['relevance_score'] = self._calculate_relevance_score(job)
                 unique_jobs.append(job)
         
+        if Config.JOB_FILTER_ENABLED:
+            unique_jobs, rejection_counts = get_job_filter().apply(unique_jobs)
+            rejected = sum(rejection_counts.values())
+            if rejected:
+                details = ", ".join(f"{rule}: {count}" for rule, count in rejection_counts.items() if count)
+                self.log_action("INFO", f"Job filter rejected {rejected} jobs ({details})")
+        
         # Sort by relevance score (higher is better)
         unique_jobs.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
         
+        # Resume match decides the order; source relevance breaks ties
+        if query:
+            unique_jobs = rank_jobs(unique_jobs, query)
+        
         return unique_jobs
     
     def _calculate_relevance_score(self, job: Dict[str, Any]) -> float:
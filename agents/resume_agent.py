@@ -7,6 +7,8 @@ from typing import Dict, Any, List, Optional
 from agents.base_agent import BaseAgent, AgentState
 from utils.logger import setup_logger
 from utils.resume_editor import ResumeEditor
+from utils.resume_cache import get_resume_cache
+from utils.resume_renderer import get_resume_renderer
 import os
 import json
 
@@ -97,7 +99,9 @@ class ResumeAgent(BaseAgent):
                 'areas_for_improvement': analysis.get('improvement_areas', [])
             }
             
-            self.log_action("SUCCESS", f"Resume analysis completed - {len(resume_analysis['sections'])} sections found")
+            stats = get_resume_cache().get_stats()
+            self.log_action("SUCCESS", f"Resume analysis completed - {len(resume_analysis['sections'])} sections found "
+                                       f"(resume cache: {stats['lookups'] - stats['parses']}/{stats['lookups']} reused)")
             return resume_analysis
             
         except Exception as e:
@@ -444,4 +448,7 @@ class ResumeAgent(BaseAgent):
         if hasattr(self.resume_editor, 'close'):
             await self.resume_editor.close()
         
+        # Shut down the resume rendering workers (restarted on the next render)
+        get_resume_renderer().close()
+        
         self.log_action("INFO", "Resume agent resources cleaned up")
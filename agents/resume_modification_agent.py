@@ -1,24 +1,37 @@
 import asyncio
 import os
-import re
-import json
+import sys
+import time
 from typing import Dict, Any, List, Optional
-from docx import Document
 from docx.shared import Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.shared import OxmlElement, qn
 from datetime import datetime
 import openai
 from openai import AsyncOpenAI
 from agents.base_agent import BaseAgent, AgentState
 from config import Config
+from utils.applied_job_index import get_applied_job_index
+from utils.skill_matcher import SKILL_TAXONOMY, SkillMatcher, get_skill_matcher
+from utils.analysis_cache import content_fingerprint, get_analysis_cache, source_fingerprint
+from utils.llm_cache import get_llm_cache
+from utils.llm_scheduler import get_llm_scheduler
+from utils.structured_output import StructuredOutputError, get_optimization_output
+from utils.model_router import get_model_router
+from utils.prompt_builder import get_prompt_builder
+from utils.resume_renderer import get_resume_renderer
+from utils.tailoring_reuse import get_tailoring_reuse
 
 class ResumeModificationAgent(BaseAgent):
     """Agent responsible for modifying resumes to match job requirements."""
     
+    # Persistent analysis cache namespace; the version includes the source of this module
+    # and the skill matcher, so changing skill extraction invalidates cached results
+    SKILLS_CACHE_NAMESPACE = "resume_modification_required_skills"
+    SKILLS_VERSION = content_fingerprint("1", SKILL_TAXONOMY, source_fingerprint(sys.modules[__name__], SkillMatcher))
+    
     def __init__(self):
         super().__init__("ResumeModificationAgent")
-        self.client = AsyncOpenAI(api_key=Config.OPENAI_API_KEY) if Config.OPENAI_API_KEY else None
+        self.client = AsyncOpenAI(api_key=Config.OPENAI_API_KEY, base_url=Config.OPENAI_BASE_URL or None) if Config.OPENAI_API_KEY else None
     
     async def execute(self, state: AgentState) -> AgentState:
         """Modify resume to match job requirements."""
@@ -35,6 +48,12 @@ class ResumeModificationAgent(BaseAgent):
                 state.error = "No current job information for resume modification"
                 return state
             
+            # Don't spend LLM tokens tailoring a resume for a job already applied to
+            if Config.SKIP_APPLIED_JOBS and get_applied_job_index().contains(job_info):
+                self.log_action("INFO", f"Skipping resume modification for {job_info.get('title', 'Unknown')}: already applied")
+                state.current_step = "resume_modification_skipped"
+                return state
+            
             job_title = job_info.get("title", "")
             job_description = job_info.get("description", "")
             company_name = job_info.get("company", "")
@@ -50,9 +69,42 @@ class ResumeModificationAgent(BaseAgent):
                 job_title,
                 job_description,
                 company_name,
-                state.resume_path
+                state.resume_path,
+                match_score=job_info.get("match_score"),
+                priority=job_info.get("priority", "normal")
             )
             
+            analysis_cache = get_analysis_cache()
+            if analysis_cache:
+                stats = analysis_cache.get_stats(self.SKILLS_CACHE_NAMESPACE)
+                self.log_action("INFO", f"Analysis cache: {stats['hits']}/{stats['lookups']} skill extractions reused ({stats['hit_rate']}% hit rate)")
+            
+            llm_cache = get_llm_cache()
+            if llm_cache:
+                stats = llm_cache.get_stats()
+                self.log_action("INFO", f"LLM cache: {stats['hits']}/{stats['lookups']} responses reused, {stats['seconds_saved']}s saved")
+            
+            usage = get_llm_scheduler().get_stats()
+            if usage["requests"]:
+                self.log_action("INFO", f"LLM usage: {usage['requests']} requests ({usage['retries']} retries), "
+                                        f"{usage['prompt_tokens'] + usage['completion_tokens']} tokens, ${usage['cost']:.4f}")
+                output = get_optimization_output().get_stats()
+                self.log_action("INFO", f"Structured output: {output['valid_first_pass']}/{output['requests']} valid first time, "
+                                        f"{output['repaired']} repaired, {output['failed']} failed "
+                                        f"({output['parse_failure_rate']}% parse failure rate, {output['wasted_seconds']}s wasted)")
+            
+            if self.client:
+                routing = get_model_router().get_stats()
+                self.log_action("INFO", "Model routing: " + "; ".join(
+                    f"{tier} {stats['requests']} requests ({stats['escalated']} escalated), {stats['avg_seconds']}s avg, ${stats['cost']:.4f}"
+                    for tier, stats in routing.items()
+                ))
+            
+            reuse = get_tailoring_reuse().get_stats()
+            if reuse["reused"]:
+                self.log_action("INFO", f"Tailoring reuse: {reuse['reused']}/{reuse['jobs']} jobs reused a near-duplicate's "
+                                        f"tailoring ({reuse['clusters']} clusters, {reuse['reuse_rate']}% reuse rate)")
+            
             if modification_result.get("status") == "success":
                 # Update state with modification results
                 state.resume_modification = modification_result
@@ -85,8 +137,14 @@ class ResumeModificationAgent(BaseAgent):
     
     async def modify_resume_for_job(self, resume_analysis: Dict[str, Any], 
                                   job_title: str, job_description: str, 
-                                  company_name: str, original_resume_path: str) -> Dict[str, Any]:
-        """Modify resume to match specific job requirements."""
+                                  company_name: str, original_resume_path: str,
+                                  use_llm_cache: bool = True,
+                                  match_score: Optional[float] = None,
+                                  priority: str = "normal") -> Dict[str, Any]:
+        """Modify resume to match specific job requirements (use_llm_cache=False forces a fresh AI response).
+        
+        match_score (0-100) and priority ("high", "normal", "low") steer which model, if any, is used.
+        """
         
         try:
             self.log_action("MODIFYING", f"Modifying resume for {job_title} at {company_name}")
@@ -94,10 +152,18 @@ class ResumeModificationAgent(BaseAgent):
             # Analyze skill gaps
             skill_gaps = self._analyze_skill_gaps(resume_analysis, job_description)
             
-            # Generate optimized content
-            optimized_content = await self._generate_optimized_content(
-                resume_analysis, skill_gaps, job_description, job_title
+            # Generate optimized content once per cluster of near-duplicate jobs
+            optimized_content, tailoring_reuse = await get_tailoring_reuse().tailor(
+                resume_analysis.get("content_hash") or os.path.abspath(original_resume_path),
+                job_title, company_name, skill_gaps,
+                lambda: self._generate_optimized_content(
+                    resume_analysis, skill_gaps, job_description, job_title, use_cache=use_llm_cache,
+                    match_score=match_score, priority=priority
+                ),
+                job_description, reuse=use_llm_cache
             )
+            if tailoring_reuse["decision"] == "reused":
+                self.log_action("INFO", f"Reusing tailored content for {job_title} at {company_name}: {tailoring_reuse['reason']}")
             
             # Create modification plan
             modification_plan = self._create_modification_plan(
@@ -117,6 +183,7 @@ class ResumeModificationAgent(BaseAgent):
                 "optimized_content": optimized_content,
                 "modification_plan": modification_plan,
                 "ats_recommendations": ats_recommendations,
+                "tailoring_reuse": tailoring_reuse,
                 "modification_timestamp": datetime.now().isoformat(),
                 "original_resume_path": original_resume_path
             }
@@ -193,50 +260,34 @@ class ResumeModificationAgent(BaseAgent):
     def _extract_required_skills(self, job_description: str) -> List[Dict[str, Any]]:
         """Extract required skills from job description."""
         
-        # Common technical skills patterns
-        skill_patterns = {
-            "programming_languages": [
-                r"python", r"java", r"javascript", r"typescript", r"c\+\+", r"c#", r"go", r"rust", r"php", r"ruby"
-            ],
-            "frameworks": [
-                r"django", r"flask", r"react", r"angular", r"vue", r"node\.js", r"spring", r"laravel", r"rails"
-            ],
-            "databases": [
-                r"postgresql", r"mysql", r"mongodb", r"redis", r"elasticsearch", r"dynamodb", r"sqlite"
-            ],
-            "cloud_platforms": [
-                r"aws", r"azure", r"gcp", r"docker", r"kubernetes", r"terraform", r"ansible"
-            ],
-            "tools": [
-                r"git", r"jenkins", r"jira", r"confluence", r"slack", r"figma", r"sketch"
-            ]
-        }
+        # Reposted or re-scraped descriptions reuse the stored skills
+        analysis_cache = get_analysis_cache()
+        if analysis_cache:
+            cached = analysis_cache.get(self.SKILLS_CACHE_NAMESPACE, self.SKILLS_VERSION, job_description)
+            if cached is not None:
+                return cached
         
         extracted_skills = []
         
-        for category, patterns in skill_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, job_description.lower())
-                for match in matches:
-                    skill_name = match.group()
-                    # Calculate confidence based on context
-                    context_start = max(0, match.start() - 50)
-                    context_end = min(len(job_description), match.end() + 50)
-                    context = job_description[context_start:context_end].lower()
-                    
-                    # Higher confidence if skill is mentioned in requirements section
-                    confidence = 0.7
-                    if any(word in context for word in ["required", "must", "essential", "minimum"]):
-                        confidence = 0.9
-                    elif any(word in context for word in ["preferred", "nice to have", "bonus"]):
-                        confidence = 0.6
-                    
-                    extracted_skills.append({
-                        "skill": skill_name.title(),
-                        "confidence": confidence,
-                        "categories": [category],
-                        "context": context.strip()
-                    })
+        for match in get_skill_matcher().find_all(job_description):
+            # Calculate confidence based on context
+            context_start = max(0, match["start"] - 50)
+            context_end = min(len(job_description), match["end"] + 50)
+            context = job_description[context_start:context_end].lower()
+            
+            # Higher confidence if skill is mentioned in requirements section
+            confidence = 0.7
+            if any(word in context for word in ["required", "must", "essential", "minimum"]):
+                confidence = 0.9
+            elif any(word in context for word in ["preferred", "nice to have", "bonus"]):
+                confidence = 0.6
+            
+            extracted_skills.append({
+                "skill": match["skill"].title(),
+                "confidence": confidence,
+                "categories": [match["category"]],
+                "context": context.strip()
+            })
         
         # Remove duplicates and sort by confidence
         unique_skills = {}
@@ -245,17 +296,32 @@ class ResumeModificationAgent(BaseAgent):
             if skill_name not in unique_skills or skill["confidence"] > unique_skills[skill_name]["confidence"]:
                 unique_skills[skill_name] = skill
         
-        return sorted(unique_skills.values(), key=lambda x: x["confidence"], reverse=True)
+        required_skills = sorted(unique_skills.values(), key=lambda x: x["confidence"], reverse=True)
+        
+        if analysis_cache:
+            analysis_cache.put(self.SKILLS_CACHE_NAMESPACE, self.SKILLS_VERSION, job_description, required_skills)
+        
+        return required_skills
     
     async def _generate_optimized_content(self, resume_analysis: Dict[str, Any], 
                                         skill_gaps: Dict[str, Any],
                                         job_description: str, 
-                                        job_title: str) -> Dict[str, Any]:
-        """Generate optimized resume content using AI."""
+                                        job_title: str,
+                                        use_cache: bool = True,
+                                        match_score: Optional[float] = None,
+                                        priority: str = "normal") -> Dict[str, Any]:
+        """Generate optimized resume content using the model the router picks for this job."""
         
         if not self.client:
             return self._generate_basic_optimized_content(resume_analysis, skill_gaps)
         
+        router = get_model_router()
+        decision = router.route(skill_gaps, match_score, priority)
+        self.log_action("INFO", f"Model routing: {decision['tier']} ({decision['reason']})")
+        if decision["tier"] == "skip":
+            router.record_skip()
+            return self._generate_basic_optimized_content(resume_analysis, skill_gaps)
+        
         try:
             # Extract key information from current resume
             resume_content = resume_analysis.get("resume_content", "")
@@ -270,81 +336,52 @@ class ResumeModificationAgent(BaseAgent):
                 if skill.get("confidence", 0) > 0.7
             ]
             
-            prompt = f"""
-            Optimize this resume for a {job_title} position. The goal is to better align the resume with the job requirements while maintaining truthfulness and professionalism.
-            
-            Current Resume Content:
-            {resume_content[:2000]}
-            
-            Job Description:
-            {job_description[:1000]}
-            
-            Required Skills: {', '.join(required_skill_names)}
-            High Priority Skills: {', '.join(high_priority_skills)}
-            Current Skills: {', '.join(current_skills)}
-            
-            Please provide optimized content in JSON format:
-            {{
-                "optimized_summary": "Professional summary optimized for this role...",
-                "enhanced_experience": [
-                    {{
-                        "title": "Job Title",
-                        "company": "Company Name", 
-                        "description": "Enhanced job description with relevant keywords...",
-                        "achievements": ["Achievement 1", "Achievement 2"]
-                    }}
-                ],
-                "skills_section": {{
-                    "technical_skills": ["skill1", "skill2", ...],
-                    "core_competencies": ["competency1", "competency2", ...]
-                }},
-                "keywords_added": ["keyword1", "keyword2", ...],
-                "modifications_summary": ["modification1", "modification2", ...],
-                "ats_optimization_tips": ["tip1", "tip2", ...]
-            }}
-            
-            Guidelines:
-            1. Keep all information truthful - only enhance presentation, don't fabricate
-            2. Incorporate high-priority required skills naturally into existing experience
-            3. Use action verbs and quantifiable achievements
-            4. Optimize for ATS (Applicant Tracking Systems)
-            5. Maintain professional tone and format
-            6. Focus on relevant experience and skills
-            """
-            
-            response = await self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert resume writer and career coach. Create compelling, truthful, and ATS-optimized resume content."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=2000,
-                temperature=0.3
+            prompt = get_prompt_builder().build(
+                job_title,
+                resume_content,
+                job_description,
+                required_skills=required_skill_names,
+                high_priority_skills=high_priority_skills,
+                current_skills=current_skills
             )
+            messages = prompt["messages"]
+            tokens = prompt["tokens"]
+            self.log_action("INFO", f"Optimization prompt: {tokens['total']} tokens (system {tokens['system']}, "
+                                    f"JD {tokens['job_description']}, resume {tokens['resume']}, budget {tokens['budget']}, "
+                                    f"dropped: {', '.join(tokens['dropped_sections']) or 'none'})")
+            
+            params = {"max_tokens": decision["max_tokens"], "temperature": 0.3}
+            
+            # An identical prompt (same resume, same JD) routed the same way reuses the earlier response
+            llm_cache = get_llm_cache()
+            if llm_cache:
+                if use_cache:
+                    cached = llm_cache.get(decision["model"], messages, params)
+                    if cached is not None:
+                        cached["optimization_timestamp"] = datetime.now().isoformat()
+                        return cached
+                else:
+                    llm_cache.record_bypass()
             
-            # Parse the AI response
-            ai_response = response.choices[0].message.content
+            # Schema-validated response; low-confidence fast-tier output is retried on the strong model
+            start_time = time.perf_counter()
+            optimized_data = await router.generate(self.client, messages, decision, skill_gaps, temperature=params["temperature"])
+            optimized_data["source"] = "ai"
+            optimized_data["optimization_timestamp"] = datetime.now().isoformat()
             
-            # Extract JSON from the response
-            try:
-                json_start = ai_response.find('{')
-                json_end = ai_response.rfind('}') + 1
-                
-                if json_start != -1 and json_end != -1:
-                    json_str = ai_response[json_start:json_end]
-                    optimized_data = json.loads(json_str)
-                    
-                    # Add metadata
-                    optimized_data["source"] = "ai"
-                    optimized_data["optimization_timestamp"] = datetime.now().isoformat()
-                    
-                    return optimized_data
-                
-            except json.JSONDecodeError as e:
-                self.log_action("WARNING", f"Failed to parse AI response as JSON: {str(e)}")
-                
-            # Fallback to basic optimization
-            return self._generate_basic_optimized_content(resume_analysis, skill_gaps)
+            if llm_cache and use_cache:
+                llm_cache.put(decision["model"], messages, params, optimized_data, time.perf_counter() - start_time)
+            
+            return optimized_data
+            
+        except StructuredOutputError as e:
+            basic_content = self._generate_basic_optimized_content(resume_analysis, skill_gaps)
+            if not e.cancelled:
+                self.log_action("ERROR", f"AI optimization failed: {str(e)}")
+                return basic_content
+            # Cancelled at the stream timeout: keep the sections that were complete
+            self.log_action("WARNING", f"{str(e)}; keeping {len(e.fields)} streamed section(s)")
+            return {**basic_content, **e.fields, "source": "ai_partial"}
             
         except Exception as e:
             self.log_action("ERROR", f"AI optimization failed: {str(e)}")
@@ -466,96 +503,21 @@ class ResumeModificationAgent(BaseAgent):
         """Create a modified resume file based on the modification results."""
         
         try:
-            # Create output directory
-            output_dir = os.path.join(os.path.dirname(original_resume_path), "modified_resumes")
-            os.makedirs(output_dir, exist_ok=True)
-            
-            # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_job_title = re.sub(r'[^\w\s-]', '', job_title).replace(' ', '_')[:30]
-            safe_company = re.sub(r'[^\w\s-]', '', company_name).replace(' ', '_')[:20]
-            
-            filename = f"resume_{safe_job_title}_{safe_company}_{timestamp}.docx"
-            output_path = os.path.join(output_dir, filename)
-            
-            # Create the modified document
-            doc = Document()
-            
-            # Add title
-            title = doc.add_heading(f'Resume - {job_title}', 0)
-            title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            # Add modification info
-            doc.add_paragraph(f'Modified for: {job_title} at {company_name}')
-            doc.add_paragraph(f'Modification date: {datetime.now().strftime("%B %d, %Y")}')
-            doc.add_paragraph('')
-            
-            # Add optimized content
-            optimized_content = modification_result.get("optimized_content", {})
-            
-            # Summary section
-            if optimized_content.get("optimized_summary"):
-                doc.add_heading('Professional Summary', level=1)
-                doc.add_paragraph(optimized_content["optimized_summary"])
-                doc.add_paragraph('')
-            
-            # Skills section
-            skills_section = optimized_content.get("skills_section", {})
-            if skills_section:
-                doc.add_heading('Technical Skills', level=1)
-                
-                if skills_section.get("technical_skills"):
-                    doc.add_paragraph(', '.join(skills_section["technical_skills"]))
-                
-                if skills_section.get("core_competencies"):
-                    doc.add_paragraph('')
-                    doc.add_paragraph('Core Competencies:')
-                    doc.add_paragraph(', '.join(skills_section["core_competencies"]))
-                
-                doc.add_paragraph('')
-            
-            # Experience section (enhanced)
-            enhanced_experience = optimized_content.get("enhanced_experience", [])
-            if enhanced_experience:
-                doc.add_heading('Professional Experience', level=1)
-                
-                for exp in enhanced_experience:
-                    # Job title and company
-                    job_header = doc.add_heading(f'{exp.get("title", "Job Title")} - {exp.get("company", "Company")}', level=2)
-                    
-                    # Description
-                    if exp.get("description"):
-                        doc.add_paragraph(exp["description"])
-                    
-                    # Achievements
-                    if exp.get("achievements"):
-                        for achievement in exp["achievements"]:
-                            p = doc.add_paragraph()
-                            p.add_run('• ').bold = True
-                            p.add_run(achievement)
-                    
-                    doc.add_paragraph('')
-            
-            # Add modification summary
+            # Render from the shared template; modifications and ATS tips come from the plan
             modifications = modification_result.get("modification_plan", {}).get("priority_changes", [])
-            if modifications:
-                doc.add_heading('Modifications Made', level=1)
-                for mod in modifications:
-                    doc.add_paragraph(f'• {mod["description"]}')
-                doc.add_paragraph('')
-            
-            # Add ATS recommendations
-            ats_recs = modification_result.get("ats_recommendations", [])
-            if ats_recs:
-                doc.add_heading('ATS Optimization Tips', level=1)
-                for rec in ats_recs[:5]:  # Top 5 recommendations
-                    doc.add_paragraph(f'• {rec}')
-            
-            # Save the document
-            doc.save(output_path)
+            content = {
+                **modification_result.get("optimized_content", {}),
+                "modifications_summary": [mod["description"] for mod in modifications],
+                "ats_optimization_tips": modification_result.get("ats_recommendations", [])
+            }
             
-            self.log_action("SUCCESS", f"Modified resume saved to: {output_path}")
-            return output_path
+            # Content-addressed in OUTPUT_RESUME_DIR and built on the renderer's process pool
+            rendered = await get_resume_renderer().render(job_title, company_name, content)
+            if rendered["reused"]:
+                self.log_action("INFO", f"Identical tailored content, reusing: {rendered['path']}")
+            else:
+                self.log_action("SUCCESS", f"Modified resume saved to: {rendered['path']}")
+            return rendered["path"]
             
         except Exception as e:
             self.log_action("ERROR", f"Failed to create modified resume: {str(e)}")
@@ -602,3 +564,11 @@ class ResumeModificationAgent(BaseAgent):
                 }
             }
         ]
+
+    async def close(self):
+        """Clean up resources."""
+        
+        # Shut down the resume rendering workers (restarted on the next render)
+        get_resume_renderer().close()
+        
+        self.log_action("INFO", "Resume modification agent resources cleaned up")
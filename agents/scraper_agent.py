@@ -10,6 +10,9 @@ from agents.glassdoor_web_agent import GlassdoorWebAgent
 from agents.linkedin_web_agent import LinkedInWebAgent
 from agents.parallel_job_search_orchestrator import ParallelJobSearchOrchestrator
 from config import Config
+from utils.job_filter import get_job_filter
+from utils.salary_normalizer import get_salary_normalizer
+from utils.location_normalizer import get_location_normalizer
 from utils.logger import setup_logger
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import ToolNode
@@ -40,16 +43,18 @@ class ScraperAgent(BaseAgent):
         workflow.add_node("general_search", self._execute_general_search)
         workflow.add_node("glassdoor_search", self._execute_glassdoor_search)
         workflow.add_node("linkedin_search", self._execute_linkedin_search)
-        workflow.add_node("extract_jd_details", self._extract_job_details)
         workflow.add_node("merge_results", self._merge_search_results)
+        workflow.add_node("filter_jobs", self._filter_jobs)
+        workflow.add_node("extract_jd_details", self._extract_job_details)
         
-        # Define the workflow
+        # Define the workflow (dedupe and filter before any per-job work)
         workflow.set_entry_point("general_search")
         workflow.add_edge("general_search", "glassdoor_search")
         workflow.add_edge("glassdoor_search", "linkedin_search")
-        workflow.add_edge("linkedin_search", "extract_jd_details")
-        workflow.add_edge("extract_jd_details", "merge_results")
-        workflow.add_edge("merge_results", END)
+        workflow.add_edge("linkedin_search", "merge_results")
+        workflow.add_edge("merge_results", "filter_jobs")
+        workflow.add_edge("filter_jobs", "extract_jd_details")
+        workflow.add_edge("extract_jd_details", END)
         
         return workflow.compile()
     
@@ -74,6 +79,8 @@ class ScraperAgent(BaseAgent):
                 state.extracted_jds = result_state.extracted_jds
             if hasattr(result_state, 'job_links'):
                 state.job_links = result_state.job_links
+            if hasattr(result_state, 'filter_stats'):
+                state.filter_stats = result_state.filter_stats
             
             self.log_action("SUCCESS", f"Job search completed - found {len(getattr(state, 'all_jobs', []))} jobs")
             return state
@@ -182,6 +189,10 @@ class ScraperAgent(BaseAgent):
                         'requirements': self._extract_requirements(job.get('description', '')),
                         'location': job.get('location'),
                         'salary': job.get('salary'),
+                        'salary_min': job.get('salary_min'),
+                        'salary_max': job.get('salary_max'),
+                        'location_id': job.get('location_id'),
+                        'work_mode': job.get('work_mode'),
                         'posted_date': job.get('posted_date')
                     })
                 
@@ -225,6 +236,40 @@ class ScraperAgent(BaseAgent):
             self.log_action("ERROR", f"Result merging failed: {str(e)}")
             return state
     
+    async def _filter_jobs(self, state: AgentState) -> AgentState:
+        """Normalize salaries and locations, then drop jobs that fail the configured preferences."""
+        
+        all_jobs = getattr(state, 'all_jobs', [])
+        
+        # Numeric salary columns and canonical location ids for filtering and statistics
+        salary_normalizer = get_salary_normalizer()
+        location_normalizer = get_location_normalizer()
+        for job in all_jobs:
+            salary_normalizer.annotate(job)
+            location_normalizer.annotate(job)
+        
+        if not Config.JOB_FILTER_ENABLED:
+            return state
+        
+        try:
+            passed_jobs, rejection_counts = get_job_filter().apply(all_jobs)
+            
+            state.all_jobs = passed_jobs
+            state.filter_stats = {
+                "checked": len(all_jobs),
+                "passed": len(passed_jobs),
+                "rejected": rejection_counts
+            }
+            
+            rejected = ", ".join(f"{rule}: {count}" for rule, count in rejection_counts.items() if count)
+            self.log_action("SUCCESS", f"Job filter kept {len(passed_jobs)}/{len(all_jobs)} jobs"
+                            + (f" (rejected {rejected})" if rejected else ""))
+            return state
+            
+        except Exception as e:
+            self.log_action("ERROR", f"Job filtering failed: {str(e)}")
+            return state
+    
     def _extract_requirements(self, description: str) -> List[str]:
         """Extract key requirements from job description."""
         
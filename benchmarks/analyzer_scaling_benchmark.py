@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Analyzer Scaling Benchmark
+Measures batch job description analysis throughput on the process pool for an
+increasing number of worker processes.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.batch_analysis import BatchJDAnalyzer
+from utils.jd_feature_extractor import get_jd_feature_extractor
+from benchmarks.skill_matcher_benchmark import generate_corpus, load_corpus
+from benchmarks.jd_feature_benchmark import add_sections
+
+def main():
+    """Main function."""
+
+    cpu_count = os.cpu_count() or 1
+
+    parser = argparse.ArgumentParser(description="Benchmark batch JD analysis across worker processes")
+    parser.add_argument("--documents", type=int, default=4000, help="Synthetic documents to generate")
+    parser.add_argument("--words", type=int, default=400, help="Words per synthetic document")
+    parser.add_argument("--corpus", help="JSON or text file with real job descriptions")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, 8, cpu_count} & set(range(1, cpu_count + 1))),
+                        help="Worker counts to measure")
+    parser.add_argument("--chunk-size", type=int, default=64, help="Descriptions per worker task")
+
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else add_sections(generate_corpus(args.documents, args.words))
+
+    print("🚀 Analyzer Scaling Benchmark")
+    print("=" * 50)
+    print(f"Documents: {len(corpus)} | CPUs: {cpu_count} | Chunk size: {args.chunk_size}")
+
+    baseline = None
+    for workers in args.workers:
+        # Forked workers inherit the parent's memo, so start every run cold
+        get_jd_feature_extractor().clear_cache()
+
+        with BatchJDAnalyzer(workers=workers, chunk_size=args.chunk_size) as analyzer:
+            # Start the pool and compile the matchers before timing
+            analyzer.analyze([f"warm-up {i}" for i in range(workers)])
+
+            start = time.perf_counter()
+            analyzer.analyze(corpus)
+            elapsed = time.perf_counter() - start
+
+        throughput = len(corpus) / elapsed
+        baseline = baseline or throughput
+        speedup = throughput / baseline
+        print(f"   • {workers:>2} workers  {elapsed:8.3f}s  {throughput:8.0f} JDs/s  "
+              f"{speedup:5.2f}x  ({speedup / workers * 100:3.0f}% efficiency)")
+
+if __name__ == "__main__":
+    main()
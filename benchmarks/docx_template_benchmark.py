@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Docx Template Benchmark
+Renders many tailored resume variants by building each document with python-docx
+from an empty Document() (the previous approach) and by cloning the parsed resume
+template, checks that both produce the same paragraphs, and compares throughput.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, Any, List
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from utils.resume_document import ResumeDocumentAssembler
+from utils.resume_template import ResumeTemplate
+
+SKILLS = [
+    "Python", "Go", "Java", "TypeScript", "React", "AWS", "GCP", "Docker", "Kubernetes", "Terraform",
+    "PostgreSQL", "Redis", "Kafka", "Spark", "Airflow", "TensorFlow", "PyTorch", "CI/CD", "GraphQL", "Linux"
+]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises"]
+TITLES = ["Software Engineer", "Backend Engineer", "Data Engineer", "ML Engineer", "Platform Engineer"]
+
+def generate_variants(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Generate optimization results shaped like the LLM response schema."""
+
+    rng = random.Random(seed)
+    variants = []
+    for index in range(count):
+        skills = rng.sample(SKILLS, 8)
+        variants.append({
+            "job_title": rng.choice(TITLES),
+            "company_name": rng.choice(COMPANIES),
+            "content": {
+                "optimized_summary": f"Engineer with {rng.randint(3, 12)} years building services in "
+                                     f"{', '.join(skills[:3])}. Variant {index}.",
+                "enhanced_experience": [{
+                    "title": rng.choice(TITLES),
+                    "company": rng.choice(COMPANIES),
+                    "description": f"Built and operated systems with {skills[3]} and {skills[4]}.",
+                    "achievements": [f"Improved {rng.choice(['latency', 'throughput', 'cost'])} by {rng.randint(10, 60)}%"
+                                     for _ in range(rng.randint(2, 4))]
+                } for _ in range(rng.randint(2, 4))],
+                "skills_section": {"technical_skills": skills, "core_competencies": ["Leadership", "Mentoring"]},
+                "modifications_summary": [f"Highlighted {skill}" for skill in skills[:3]],
+                "ats_optimization_tips": ["Use standard section headings", "Mirror the job's keywords"]
+            }
+        })
+    return variants
+
+def build_with_python_docx(variant: Dict[str, Any], output_path: str) -> None:
+    """Previous approach: build and style every paragraph of a new Document()."""
+
+    job_title, company_name, content = variant["job_title"], variant["company_name"], variant["content"]
+    doc = Document()
+    title = doc.add_heading(f'Resume - {job_title}', 0)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    doc.add_paragraph(f'Modified for: {job_title} at {company_name}')
+    doc.add_paragraph(f'Modification date: {datetime.now().strftime("%B %d, %Y")}')
+    doc.add_paragraph('')
+
+    doc.add_heading('Professional Summary', level=1)
+    doc.add_paragraph(content["optimized_summary"])
+    doc.add_paragraph('')
+
+    skills_section = content["skills_section"]
+    doc.add_heading('Technical Skills', level=1)
+    doc.add_paragraph(', '.join(skills_section["technical_skills"]))
+    doc.add_paragraph('')
+    doc.add_paragraph('Core Competencies:')
+    doc.add_paragraph(', '.join(skills_section["core_competencies"]))
+    doc.add_paragraph('')
+
+    doc.add_heading('Professional Experience', level=1)
+    for exp in content["enhanced_experience"]:
+        doc.add_heading(f'{exp["title"]} - {exp["company"]}', level=2)
+        doc.add_paragraph(exp["description"])
+        for achievement in exp["achievements"]:
+            p = doc.add_paragraph()
+            p.add_run('• ').bold = True
+            p.add_run(achievement)
+        doc.add_paragraph('')
+
+    doc.add_heading('Modifications Made', level=1)
+    for mod in content["modifications_summary"]:
+        doc.add_paragraph(f'• {mod}')
+    doc.add_paragraph('')
+
+    doc.add_heading('ATS Optimization Tips', level=1)
+    for rec in content["ats_optimization_tips"][:5]:
+        doc.add_paragraph(f'• {rec}')
+
+    doc.save(output_path)
+
+def build_with_template(template: ResumeTemplate, variant: Dict[str, Any], output_path: str) -> None:
+    """Clone the parsed template's prototype paragraphs and write only the document part."""
+
+    document = ResumeDocumentAssembler(variant["job_title"], variant["company_name"], template)
+    document.finish(variant["content"])
+    document.save(output_path)
+
+def paragraphs(path: str) -> List[Any]:
+    """Style, alignment, text and bold runs of every paragraph of a .docx file."""
+
+    return [
+        (p.style.name, p.alignment, p.text, [run.bold for run in p.runs])
+        for p in Document(path).paragraphs
+    ]
+
+def timed(label: str, render, variants: List[Dict[str, Any]], output_dir: str) -> float:
+    """Render every variant and print the duration and throughput."""
+
+    start = time.perf_counter()
+    for index, variant in enumerate(variants):
+        render(variant, os.path.join(output_dir, f"{label}_{index}.docx"))
+    elapsed = time.perf_counter() - start
+    print(f"   • {label:<20} {elapsed:8.2f} s  ({len(variants) / elapsed * 60:9.0f} variants/min)")
+    return elapsed
+
+def main():
+    """Main function."""
+
+    parser = argparse.ArgumentParser(description="Benchmark template-cloned resume docx rendering")
+    parser.add_argument("--variants", type=int, default=300, help="Tailored resumes to render")
+    parser.add_argument("--template", default="", help="Base .docx to use as the template (default styles otherwise)")
+
+    args = parser.parse_args()
+    variants = generate_variants(args.variants)
+
+    print("🚀 Docx Template Benchmark")
+    print("=" * 50)
+    print(f"Variants: {len(variants)} | Template: {args.template or 'python-docx default'}\n")
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        template = ResumeTemplate(args.template)
+        print(f"   Template parsed once in {(time.perf_counter() - start) * 1000:.1f} ms\n")
+
+        baseline = timed("python-docx", build_with_python_docx, variants, output_dir)
+        cloned = timed("template clone", lambda variant, path: build_with_template(template, variant, path),
+                       variants, output_dir)
+
+        if not args.template:
+            same = paragraphs(os.path.join(output_dir, "python-docx_0.docx")) == \
+                   paragraphs(os.path.join(output_dir, "template clone_0.docx"))
+            print(f"\n   Same paragraphs, styles and runs: {'yes' if same else 'NO'}")
+
+    print(f"\n📊 Speedup: {baseline / cloned:.1f}x")
+
+if __name__ == "__main__":
+    main()
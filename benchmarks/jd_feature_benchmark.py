@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+JD Feature Benchmark
+Compares the per-JD cost of the analyzer's previous eight independent scans with the
+single-pass feature extractor, both cold and memoized.
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from typing import Dict, Any, List
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.jd_feature_extractor import (
+    COMPLEXITY_INDICATORS, SIMPLICITY_INDICATORS, EXPERIENCE_LEVELS, CULTURE_INDICATORS,
+    SECTION_HEADINGS, JDFeatureExtractor
+)
+from benchmarks.skill_matcher_benchmark import generate_corpus, load_corpus
+
+SECTION_LINES = [
+    "Required: {a}, {b} and strong experience: 5+ years building services.",
+    "Must have: {a} with {b}.",
+    "Preferred: {b}, {a}. Nice to have: {a}.",
+    "Responsibilities: design, build and operate {a} systems.",
+    "What you'll do: mentor engineers and coordinate releases.",
+    "Qualifications: degree in computer science. Education: bachelor's or equivalent.",
+    "Benefits: health insurance, remote work and learning budget.",
+    "What we offer: competitive compensation: salary plus equity."
+]
+
+def add_sections(corpus: List[str]) -> List[str]:
+    """Append heading-style sections so every extractor has something to find."""
+
+    documents = []
+    for i, text in enumerate(corpus):
+        words = text.split()
+        lines = [line.format(a=words[(i + j) % len(words)], b=words[(i + 2 * j) % len(words)])
+                 for j, line in enumerate(SECTION_LINES)]
+        documents.append(text + "\n" + "\n".join(lines))
+    return documents
+
+class LegacyAnalyzer:
+    """The previous AnalyzerAgent feature methods, each lowercasing and scanning the full text."""
+
+    def __init__(self, extractor: JDFeatureExtractor):
+        self.extract_skills_from_text = extractor.extract_skills_from_text
+
+    def analyze(self, description: str) -> Dict[str, Any]:
+        return {
+            'complexity_score': self.complexity_score(description),
+            'experience_level': self.experience_level(description),
+            'required_skills': self.section_skills(description, SECTION_HEADINGS['required_skills']),
+            'preferred_skills': self.section_skills(description, SECTION_HEADINGS['preferred_skills']),
+            'responsibilities': self.section_text(description, SECTION_HEADINGS['responsibilities']),
+            'qualifications': self.section_text(description, SECTION_HEADINGS['qualifications']),
+            'benefits': self.section_text(description, SECTION_HEADINGS['benefits']),
+            'company_culture': self.company_culture(description)
+        }
+
+    def complexity_score(self, description: str) -> float:
+        description_lower = description.lower()
+        score = 0.0
+        score += sum(description_lower.count(indicator) * 0.1 for indicator in COMPLEXITY_INDICATORS)
+        score -= sum(description_lower.count(indicator) * 0.05 for indicator in SIMPLICITY_INDICATORS)
+        return round(max(0.0, min(10.0, score + 5.0)), 2)
+
+    def experience_level(self, description: str) -> str:
+        description_lower = description.lower()
+        for level, indicators in EXPERIENCE_LEVELS.items():
+            if any(indicator in description_lower for indicator in indicators):
+                return level
+        return 'unknown'
+
+    def section_skills(self, description: str, headings: List[str]) -> List[str]:
+        description_lower = description.lower()
+        skills = []
+        for heading in headings:
+            for match in re.findall(re.escape(heading) + r'[:\s]+([^.\n]+)', description_lower):
+                skills.extend(self.extract_skills_from_text(match))
+        return list(set(skills))
+
+    def section_text(self, description: str, headings: List[str]) -> List[str]:
+        description_lower = description.lower()
+        fragments = []
+        for heading in headings:
+            for match in re.findall(re.escape(heading) + r'[:\s]+([^.\n]+)', description_lower):
+                fragments.append(match.strip())
+        return fragments
+
+    def company_culture(self, description: str) -> Dict[str, bool]:
+        description_lower = description.lower()
+        return {aspect: any(indicator in description_lower for indicator in indicators)
+                for aspect, indicators in CULTURE_INDICATORS.items()}
+
+def legacy_run(corpus: List[str], legacy: LegacyAnalyzer) -> None:
+    """Analysis pass plus the second required/preferred pass of _extract_skills_and_requirements."""
+
+    for text in corpus:
+        legacy.analyze(text)
+    for text in corpus:
+        legacy.section_skills(text, SECTION_HEADINGS['required_skills'])
+        legacy.section_skills(text, SECTION_HEADINGS['preferred_skills'])
+
+# A company intro followed by a role section that SECTION_HEADINGS does not name;
+# only the intro may be labeled boilerplate
+BOILERPLATE_CASE = (
+    "About Acme\nAcme builds payments infrastructure.\n\n"
+    "The Role\nYou will design and own high-throughput APIs in Go and Kafka.\nMentor two junior engineers.\n\n"
+    "Requirements\n- 5 years Python"
+)
+
+def check_boilerplate(extractor: JDFeatureExtractor) -> bool:
+    """Whether the role text after a company intro stays out of the dropped about block."""
+
+    blocks = extractor.segment_blocks(BOILERPLATE_CASE)
+    about = "\n".join(text for section, text in blocks if section == "about")
+    return about == "About Acme\nAcme builds payments infrastructure." and any(
+        section == "required_skills" for section, _ in blocks)
+
+def extractor_run(corpus: List[str], extractor: JDFeatureExtractor, cold: bool) -> None:
+    """Same two passes through the extractor; the second pass is served from the memo."""
+
+    if cold:
+        extractor.clear_cache()
+    for text in corpus:
+        extractor.extract(text)
+    for text in corpus:
+        extractor.extract(text)
+
+def check_parity(corpus: List[str], legacy: LegacyAnalyzer, extractor: JDFeatureExtractor) -> int:
+    """Count documents whose features differ from the legacy implementation."""
+
+    mismatches = 0
+    for text in corpus:
+        expected = legacy.analyze(text)
+        actual = extractor.extract(text)
+        for key in ('required_skills', 'preferred_skills'):
+            expected[key] = sorted(expected[key])
+            actual[key] = sorted(actual[key])
+        if expected != actual:
+            mismatches += 1
+    return mismatches
+
+def time_run(label: str, func, documents: int, repeats: int) -> float:
+    """Run a pass several times and print the best per-JD cost."""
+
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    print(f"   • {label:<18} {best:8.3f}s  {best / documents * 1e6:9.1f} µs/JD")
+    return best
+
+def main():
+    """Main function."""
+
+    parser = argparse.ArgumentParser(description="Benchmark per-JD analyzer feature extraction")
+    parser.add_argument("--documents", type=int, default=1000, help="Synthetic documents to generate")
+    parser.add_argument("--words", type=int, default=400, help="Words per synthetic document")
+    parser.add_argument("--corpus", help="JSON or text file with real job descriptions")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per implementation")
+
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else add_sections(generate_corpus(args.documents, args.words))
+
+    print("🚀 JD Feature Benchmark")
+    print("=" * 50)
+    print(f"Documents: {len(corpus)} | Characters: {sum(len(text) for text in corpus):,}")
+
+    extractor = JDFeatureExtractor(max_cache_entries=len(corpus) + 1, persistent=False)
+    legacy = LegacyAnalyzer(extractor)
+
+    mismatches = check_parity(corpus, legacy, extractor)
+    print(f"Parity: {len(corpus) - mismatches}/{len(corpus)} documents identical to the legacy scans")
+    print(f"Boilerplate segmentation: {'ok' if check_boilerplate(extractor) else 'FAILED (role text labeled about)'}")
+
+    baseline = time_run("legacy (8 scans)", lambda: legacy_run(corpus, legacy), len(corpus), args.repeats)
+    cold = time_run("single-pass", lambda: extractor_run(corpus, extractor, cold=True), len(corpus), args.repeats)
+    warm = time_run("memoized", lambda: extractor_run(corpus, extractor, cold=False), len(corpus), args.repeats)
+
+    print(f"\n📊 Speedup: {baseline / cold:.1f}x single-pass, {baseline / warm:.0f}x memoized")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+LLM Scheduler Benchmark
+Sends resume optimization requests to the local OpenAI-compatible stub server one at
+a time (the previous per-job loop) and through the concurrent, budget-aware scheduler,
+then compares throughput, retries and token accounting. Runs fully offline.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openai import AsyncOpenAI
+from utils.llm_scheduler import LLMScheduler, estimate_prompt_tokens
+from benchmarks.llm_stub_server import start_stub_server
+from benchmarks.skill_matcher_benchmark import generate_corpus
+
+def build_messages(description: str):
+    """Build a chat request shaped like the resume optimization prompt."""
+
+    return [
+        {"role": "system", "content": "You are an expert resume writer and career coach. Create compelling, truthful, and ATS-optimized resume content."},
+        {"role": "user", "content": f"Optimize this resume for the following job.\n\nJob Description:\n{description}"}
+    ]
+
+async def run_serial(client: AsyncOpenAI, requests):
+    """Previous approach: await each request inside the per-job loop."""
+
+    for messages in requests:
+        await client.chat.completions.create(model="gpt-4", messages=messages, max_tokens=2000, temperature=0.3)
+
+async def run_scheduled(scheduler: LLMScheduler, client: AsyncOpenAI, requests):
+    """Send every request through the scheduler at once."""
+
+    await asyncio.gather(*[
+        scheduler.complete(client, "gpt-4", messages, max_tokens=2000, temperature=0.3) for messages in requests
+    ])
+
+async def timed(label: str, coroutine, requests: int):
+    """Await a coroutine and print its duration and throughput."""
+
+    start = time.perf_counter()
+    await coroutine
+    elapsed = time.perf_counter() - start
+    print(f"   • {label:<32} {elapsed:8.2f} s  ({requests / elapsed * 60:7.1f} requests/min)")
+    return elapsed
+
+async def benchmark(args):
+    """Run both modes against one stub server."""
+
+    server = start_stub_server(latency=args.latency, requests_per_minute=args.server_rpm, error_rate=args.error_rate)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    client = AsyncOpenAI(api_key="stub", base_url=base_url)
+
+    requests = [build_messages(description) for description in generate_corpus(args.requests, args.words)]
+
+    print("🚀 LLM Scheduler Benchmark")
+    print("=" * 50)
+    print(f"Requests: {len(requests)} | Stub latency: {args.latency}s | Stub RPM: {args.server_rpm or 'unlimited'} "
+          f"| Error rate: {args.error_rate:.0%}")
+
+    estimated = sum(estimate_prompt_tokens(messages) for messages in requests)
+    print(f"Estimated prompt tokens: {estimated:,}\n")
+
+    scheduler = LLMScheduler(max_concurrency=args.concurrency, requests_per_minute=args.rpm,
+                             tokens_per_minute=args.tpm, max_retries=8)
+
+    serial_time = None
+    if not args.skip_serial:
+        serial_time = await timed("serial (one at a time)", run_serial(client, requests), len(requests))
+    scheduled_time = await timed(f"scheduler (concurrency {args.concurrency})",
+                                 run_scheduled(scheduler, client, requests), len(requests))
+
+    stats = scheduler.get_stats()
+    print(f"\n   Requests sent: {stats['requests']} ({stats['retries']} retries, {stats['rate_limited']} rate limited)")
+    print(f"   Tokens: {stats['prompt_tokens']:,} prompt (estimated {stats['estimated_prompt_tokens']:,}), "
+          f"{stats['completion_tokens']:,} completion, ${stats['cost']:.2f} at gpt-4 prices")
+    if serial_time:
+        print(f"\n📊 Speedup: {serial_time / scheduled_time:.1f}x")
+
+    server.shutdown()
+
+def main():
+    """Main function."""
+
+    parser = argparse.ArgumentParser(description="Benchmark the LLM scheduler against a local stub server")
+    parser.add_argument("--requests", type=int, default=50, help="Requests to send (one per tailored job)")
+    parser.add_argument("--words", type=int, default=250, help="Words per synthetic job description")
+    parser.add_argument("--latency", type=float, default=0.5, help="Stub seconds per response")
+    parser.add_argument("--server-rpm", type=int, default=0, help="Stub requests per minute before 429s")
+    parser.add_argument("--error-rate", type=float, default=0.05, help="Fraction of stub responses that are 500s")
+    parser.add_argument("--concurrency", type=int, default=8, help="Scheduler requests in flight")
+    parser.add_argument("--rpm", type=int, default=0, help="Scheduler requests per minute (0 = no limit)")
+    parser.add_argument("--tpm", type=int, default=0, help="Scheduler tokens per minute (0 = no limit)")
+    parser.add_argument("--skip-serial", action="store_true", help="Only run the scheduler")
+
+    args = parser.parse_args()
+    asyncio.run(benchmark(args))
+
+if __name__ == "__main__":
+    main()
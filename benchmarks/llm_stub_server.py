@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+LLM Stub Server
+Local OpenAI-compatible chat completions endpoint for exercising the LLM scheduler
+offline. Responses take a configurable latency, follow a requests-per-minute limit
+with 429 + retry-after like the real API, and can fail with 5xx at a given rate.
+Streaming (SSE) is supported, and a fraction of unconstrained responses can carry
+an invalid field to exercise structured-output repair.
+
+Point the system at it with OPENAI_BASE_URL=http://127.0.0.1:8765/v1 and any API key.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any
+
+# Content shaped like the resume optimization schema, so callers parse it normally
+STUB_CONTENT = {
+    "optimized_summary": "Engineer with a track record of shipping reliable backend services.",
+    "enhanced_experience": [{
+        "title": "Software Engineer",
+        "company": "Example Corp",
+        "description": "Built Python services on AWS with Docker and Kubernetes.",
+        "achievements": ["Reduced API latency by 40%", "Led migration to CI/CD"]
+    }],
+    "skills_section": {"technical_skills": ["Python", "AWS", "Docker"], "core_competencies": ["Leadership"]},
+    "keywords_added": ["Kubernetes", "CI/CD"],
+    "modifications_summary": ["Highlighted cloud experience"],
+    "ats_optimization_tips": ["Use standard section headings"]
+}
+
+class StubState:
+    """Shared settings and counters of the stub server."""
+
+    def __init__(self, latency: float, requests_per_minute: int, error_rate: float,
+                 malformed_rate: float = 0.0, seed: int = 42):
+        self.latency = latency
+        self.requests_per_minute = requests_per_minute
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.recent = deque()
+        self.counts = {"ok": 0, "rate_limited": 0, "errors": 0, "malformed": 0}
+
+    def admit(self) -> float:
+        """Get 0 when a request is admitted, else the seconds until a slot frees up."""
+
+        with self.lock:
+            now = time.monotonic()
+            while self.recent and now - self.recent[0] >= 60:
+                self.recent.popleft()
+            if self.requests_per_minute and len(self.recent) >= self.requests_per_minute:
+                self.counts["rate_limited"] += 1
+                return 60 - (now - self.recent[0])
+            self.recent.append(now)
+            return 0.0
+
+    def fail(self) -> bool:
+        """Decide whether to answer with a server error."""
+
+        with self.lock:
+            failed = self.random.random() < self.error_rate
+            self.counts["errors" if failed else "ok"] += 1
+            return failed
+
+    def content(self, request: Dict[str, Any]) -> str:
+        """Build the response text; schema-constrained requests are always valid."""
+
+        body = dict(STUB_CONTENT)
+        constrained = (request.get("response_format") or {}).get("type") == "json_schema"
+        with self.lock:
+            malformed = not constrained and self.random.random() < self.malformed_rate
+            if malformed:
+                self.counts["malformed"] += 1
+        if malformed:
+            # A common failure: a list field returned as one comma-separated string
+            body["keywords_added"] = ", ".join(body["keywords_added"])
+        return json.dumps(body, indent=2)
+
+def make_handler(state: StubState):
+    """Build a request handler bound to a stub state."""
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"{}")
+
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                return self._send(404, {"error": {"message": "Not found", "type": "invalid_request_error"}})
+
+            retry_after = state.admit()
+            if retry_after:
+                return self._send(429, {"error": {"message": "Rate limit reached", "type": "rate_limit_exceeded"}},
+                                  {"retry-after-ms": str(int(retry_after * 1000))})
+
+            if not request.get("stream"):
+                time.sleep(state.latency)
+            if state.fail():
+                return self._send(500, {"error": {"message": "Stub server error", "type": "server_error"}})
+
+            prompt_tokens = sum(len(m.get("content") or "") for m in request.get("messages", [])) // 4
+            content = state.content(request)
+            usage = {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": len(content) // 4,
+                "total_tokens": prompt_tokens + len(content) // 4
+            }
+            if request.get("stream"):
+                return self._stream(request, content, usage)
+
+            self._send(200, {
+                "id": f"chatcmpl-stub-{time.time_ns()}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request.get("model", "stub"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop"
+                }],
+                "usage": usage
+            })
+
+        def _stream(self, request: Dict[str, Any], content: str, usage: Dict[str, int]):
+            """Send the content as server-sent events, spreading the latency over the chunks."""
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+
+            chunk_id = f"chatcmpl-stub-{time.time_ns()}"
+            pieces = [content[i:i + 24] for i in range(0, len(content), 24)]
+
+            def event(choices, extra=None):
+                payload = {"id": chunk_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                           "model": request.get("model", "stub"), "choices": choices, **(extra or {})}
+                self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+
+            try:
+                for piece in pieces:
+                    time.sleep(state.latency / len(pieces))
+                    event([{"index": 0, "delta": {"content": piece}, "finish_reason": None}])
+                event([{"index": 0, "delta": {}, "finish_reason": "stop"}])
+                if (request.get("stream_options") or {}).get("include_usage"):
+                    event([], {"usage": usage})
+                self.wfile.write(b"data: [DONE]\n\n")
+            except (BrokenPipeError, ConnectionResetError):
+                # The client cancelled the generation
+                pass
+
+        def _send(self, status: int, body: Dict[str, Any], headers: Dict[str, str] = None):
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubHandler
+
+def start_stub_server(port: int = 0, latency: float = 0.5, requests_per_minute: int = 0,
+                      error_rate: float = 0.0, malformed_rate: float = 0.0) -> ThreadingHTTPServer:
+    """
+    Start the stub server on a background thread.
+
+    Args:
+        port: Port to listen on (0 picks a free one, see server.server_address)
+        latency: Seconds each successful response takes
+        requests_per_minute: Requests admitted per rolling minute before 429s (0 = no limit)
+        error_rate: Fraction of admitted requests answered with a 500
+        malformed_rate: Fraction of responses without a JSON schema that carry an invalid field
+
+    Returns:
+        The running server; call shutdown() to stop it
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(StubState(latency, requests_per_minute, error_rate, malformed_rate)))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def main():
+    """Main function."""
+
+    parser = argparse.ArgumentParser(description="Run a local OpenAI-compatible stub server")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument("--latency", type=float, default=0.5, help="Seconds per response")
+    parser.add_argument("--rpm", type=int, default=0, help="Requests per minute before 429s (0 = no limit)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with a 500")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Fraction of unconstrained responses with an invalid field")
+
+    args = parser.parse_args()
+
+    server = start_stub_server(args.port, args.latency, args.rpm, args.error_rate, args.malformed_rate)
+    print(f"🚀 LLM stub server on http://127.0.0.1:{server.server_address[1]}/v1 (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
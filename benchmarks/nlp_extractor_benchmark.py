@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+NLP Extractor Benchmark
+Compares skill extraction throughput and output size of the regex path with the
+batched spaCy pipeline.
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import List
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.jd_feature_extractor import JDFeatureExtractor
+from utils.nlp_extractor import NLPSkillExtractor
+from benchmarks.skill_matcher_benchmark import generate_corpus, load_corpus
+
+def report(label: str, elapsed: float, results: List[List[str]]) -> None:
+    """Print throughput and the average number of skills per document."""
+
+    average = sum(len(skills) for skills in results) / max(len(results), 1)
+    print(f"   • {label:<24} {elapsed:8.3f}s  {len(results) / elapsed:9.0f} docs/s  "
+          f"{average:6.1f} skills/doc")
+
+def main():
+    """Main function."""
+
+    parser = argparse.ArgumentParser(description="Benchmark regex and spaCy skill extraction")
+    parser.add_argument("--documents", type=int, default=2000, help="Synthetic documents to generate")
+    parser.add_argument("--words", type=int, default=60, help="Words per synthetic document (a section fragment)")
+    parser.add_argument("--corpus", help="JSON or text file with real job descriptions")
+    parser.add_argument("--model", help="spaCy model (defaults to Config.SPACY_MODEL)")
+    parser.add_argument("--batch-size", type=int, default=64, help="nlp.pipe batch size")
+    parser.add_argument("--n-process", type=int, nargs="+", default=[1, 2], help="nlp.pipe process counts to measure")
+
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else generate_corpus(args.documents, args.words)
+
+    print("🚀 NLP Extractor Benchmark")
+    print("=" * 50)
+    print(f"Documents: {len(corpus)} | Characters: {sum(len(text) for text in corpus):,}")
+
+    regex_extractor = JDFeatureExtractor(persistent=False, nlp_backend="regex")
+    start = time.perf_counter()
+    regex_results = [regex_extractor.extract_skills_from_text(text.lower()) for text in corpus]
+    report("regex", time.perf_counter() - start, regex_results)
+
+    nlp_extractor = NLPSkillExtractor(model=args.model, batch_size=args.batch_size)
+    start = time.perf_counter()
+    nlp_extractor.nlp
+    print(f"   • spaCy load ({nlp_extractor.model if nlp_extractor.has_tagger else 'blank en'}): "
+          f"{time.perf_counter() - start:.2f}s")
+
+    for n_process in args.n_process:
+        start = time.perf_counter()
+        nlp_results = nlp_extractor.pipe_skills(corpus, n_process=n_process)
+        report(f"spaCy pipe (n_process={n_process})", time.perf_counter() - start, nlp_results)
+
+    single = [nlp_extractor.extract_skills(text) for text in corpus[:200]]
+    start = time.perf_counter()
+    for text in corpus[:200]:
+        nlp_extractor.extract_skills(text)
+    report("spaCy one doc at a time", time.perf_counter() - start, single)
+
+if __name__ == "__main__":
+    main()
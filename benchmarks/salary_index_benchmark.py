@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Salary Index Benchmark
+Times salary parsing and compares range queries and per-role percentiles on the
+columnar salary index with filtering job dictionaries in Python.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Dict, Any, List
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.salary_normalizer import SalaryIndex, SalaryNormalizer
+
+ROLES = ["software engineer", "data scientist", "ml engineer", "product manager", "devops engineer"]
+LOCATIONS = ["new york, ny", "san francisco, ca", "london", "remote", "berlin"]
+
+def generate_jobs(jobs: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Generate jobs with salaries in the formats the sources use."""
+
+    rng = random.Random(seed)
+    formats = [
+        lambda: f"${rng.randint(60, 160)}k - ${rng.randint(161, 250)}k",
+        lambda: f"£{rng.randint(35, 90)},000 a year",
+        lambda: f"${rng.randint(25, 95)}/hr",
+        lambda: f"€{rng.randint(3, 9)}.{rng.randint(100, 999)} monthly",
+        lambda: f"USD {rng.randint(70, 140)},000 - {rng.randint(141, 220)},000 per year",
+        lambda: "Competitive",
+        lambda: None
+    ]
+    return [{
+        "title": rng.choice(ROLES),
+        "location": rng.choice(LOCATIONS),
+        "salary": rng.choice(formats)()
+    } for _ in range(jobs)]
+
+def timed(label: str, func):
+    """Run a function once and print its duration."""
+
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"   • {label:<32} {elapsed * 1000:10.1f} ms")
+    return result, elapsed
+
+def python_queries(jobs: List[Dict[str, Any]], normalizer: SalaryNormalizer, low: float, high: float):
+    """Previous approach: parse and filter job dictionaries one at a time."""
+
+    matches = 0
+    by_role: Dict[str, List[float]] = {}
+    for job in jobs:
+        parsed = normalizer.parse(job["salary"]) if job["salary"] else None
+        if not parsed:
+            continue
+        if parsed["max"] >= low and parsed["min"] <= high:
+            matches += 1
+        by_role.setdefault(job["title"], []).append((parsed["min"] + parsed["max"]) / 2)
+    medians = {role: statistics.median(values) for role, values in by_role.items()}
+    return matches, medians
+
+def main():
+    """Main function."""
+
+    parser = argparse.ArgumentParser(description="Benchmark salary parsing and salary queries")
+    parser.add_argument("--jobs", type=int, default=100000, help="Synthetic jobs to generate")
+    parser.add_argument("--min-salary", type=float, default=80000, help="Range query lower bound")
+    parser.add_argument("--max-salary", type=float, default=150000, help="Range query upper bound")
+
+    args = parser.parse_args()
+
+    jobs = generate_jobs(args.jobs)
+
+    print("🚀 Salary Index Benchmark")
+    print("=" * 50)
+    print(f"Jobs: {len(jobs):,}")
+
+    normalizer = SalaryNormalizer()
+    distinct = list({job["salary"] for job in jobs if job["salary"]})
+    timed(f"parse {len(distinct):,} distinct salaries", lambda: [normalizer.parse(text) for text in distinct])
+
+    index = SalaryIndex(normalizer)
+    timed("index build (cached parses)", lambda: [index.add_job(job) for job in jobs])
+
+    print("\nQueries:")
+    (legacy_matches, legacy_medians), legacy_time = timed(
+        "per-job Python filter + medians", lambda: python_queries(jobs, normalizer, args.min_salary, args.max_salary))
+
+    def vectorized():
+        return index.in_range(args.min_salary, args.max_salary), index.percentiles(by="role", q=(50,))
+
+    (rows, percentiles), index_time = timed("index range query + percentiles", vectorized)
+
+    same = len(rows) == legacy_matches and all(
+        abs(percentiles[role]["p50"] - median) < 0.01 for role, median in legacy_medians.items())
+    print(f"\n📊 Speedup: {legacy_time / index_time:.1f}x ({len(rows):,} jobs in range, results identical: {same})")
+
+if __name__ == "__main__":
+    main()
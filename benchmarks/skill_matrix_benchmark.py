@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Skill Matrix Benchmark
+Compares dictionary-based skill aggregation with the sparse jobs x skills matrix
+on a large set of synthetic jobs.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.skill_matcher import SKILL_TAXONOMY, get_skill_matcher
+from utils.skill_matrix import SkillMatrix
+
+SOURCES = ["linkedin", "glassdoor", "indeed", "google_jobs"]
+
+def generate_jobs(jobs: int, custom_skills: int, seed: int = 42) -> List[Tuple[List[str], str]]:
+    """Generate (skills, source) pairs with a skewed skill popularity."""
+
+    rng = random.Random(seed)
+    skills = [skill for skill_list in SKILL_TAXONOMY.values() for skill in skill_list]
+    skills += [f"custom skill {i}" for i in range(custom_skills)]
+    weights = [1.0 / (rank + 1) for rank in range(len(skills))]
+
+    return [(rng.choices(skills, weights=weights, k=rng.randint(3, 15)), rng.choice(SOURCES))
+            for _ in range(jobs)]
+
+def dict_aggregates(jobs: List[Tuple[List[str], str]], source: str) -> Dict[str, object]:
+    """Previous approach: dictionary increments and repeated sorts."""
+
+    matcher = get_skill_matcher()
+    frequency: Dict[str, int] = {}
+    source_frequency: Dict[str, int] = {}
+    pairs: Dict[Tuple[str, str], int] = {}
+
+    for skills, job_source in jobs:
+        for skill in skills:
+            frequency[skill] = frequency.get(skill, 0) + 1
+            if job_source == source:
+                source_frequency[skill] = source_frequency.get(skill, 0) + 1
+        unique = sorted(set(skills))
+        for i, first in enumerate(unique):
+            for second in unique[i + 1:]:
+                pairs[(first, second)] = pairs.get((first, second), 0) + 1
+
+    categories: Dict[str, List[str]] = {}
+    for skill in frequency:
+        categories.setdefault(matcher.categorize(skill), []).append(skill)
+
+    return {
+        "top_skills": sorted(frequency.items(), key=lambda x: x[1], reverse=True)[:10],
+        "top_source_skills": sorted(source_frequency.items(), key=lambda x: x[1], reverse=True)[:10],
+        "top_pairs": sorted(pairs.items(), key=lambda x: x[1], reverse=True)[:10],
+        "categories": categories
+    }
+
+def matrix_aggregates(matrix: SkillMatrix, source: str) -> Dict[str, object]:
+    """Same questions answered from the sparse matrix."""
+
+    return {
+        "top_skills": matrix.top_k(10, weighted=True),
+        "top_source_skills": matrix.top_k(10, weighted=True, source=source),
+        "top_pairs": matrix.top_pairs(10),
+        "categories": matrix.category_breakdown()
+    }
+
+def timed(label: str, func):
+    """Run a function once and print its duration."""
+
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"   • {label:<32} {elapsed * 1000:10.1f} ms")
+    return result, elapsed
+
+def main():
+    """Main function."""
+
+    parser = argparse.ArgumentParser(description="Benchmark skill aggregation over many jobs")
+    parser.add_argument("--jobs", type=int, default=100000, help="Synthetic jobs to generate")
+    parser.add_argument("--custom-skills", type=int, default=2000, help="Skills outside the taxonomy")
+
+    args = parser.parse_args()
+
+    jobs = generate_jobs(args.jobs, args.custom_skills)
+
+    print("🚀 Skill Matrix Benchmark")
+    print("=" * 50)
+    print(f"Jobs: {len(jobs):,} | Skill mentions: {sum(len(skills) for skills, _ in jobs):,}")
+
+    matrix = SkillMatrix()
+
+    def build():
+        for skills, source in jobs:
+            matrix.add_job(skills, source=source)
+        matrix.to_csr()
+
+    timed("matrix build (incremental)", build)
+    print(f"     {matrix.num_jobs:,} jobs x {matrix.num_skills:,} skills, {matrix.to_csr().nnz:,} entries")
+
+    print("\nAggregates:")
+    legacy, legacy_time = timed("dict increments + sorts", lambda: dict_aggregates(jobs, SOURCES[0]))
+    vectorized, matrix_time = timed("sparse matrix", lambda: matrix_aggregates(matrix, SOURCES[0]))
+
+    print("\nPer query on the matrix:")
+    timed("frequency top-10", lambda: matrix.top_k(10, weighted=True))
+    timed(f"top-10 for source '{SOURCES[0]}'", lambda: matrix.top_k(10, weighted=True, source=SOURCES[0]))
+    timed("co-occurring with 'python'", lambda: matrix.co_occurring("python", 10))
+    timed("category totals", lambda: matrix.category_totals(weighted=True))
+
+    same_top = legacy["top_skills"] == vectorized["top_skills"]
+    print(f"\n📊 Speedup: {legacy_time / matrix_time:.1f}x (top skills identical: {same_top})")
+
+if __name__ == "__main__":
+    main()
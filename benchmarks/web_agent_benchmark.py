@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Web Agent Benchmark Runner
+Replays recorded LinkedIn/Glassdoor sessions offline and times the login, search,
+extraction and apply phases so browser-path performance can be compared across commits.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime
+from typing import Dict, Any, List
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.base_agent import AgentState
+from agents.linkedin_web_agent import LinkedInWebAgent
+from agents.glassdoor_web_agent import GlassdoorWebAgent
+from config import Config
+from job_config import JobConfig
+from utils.web_session_recorder import WebSessionRecorder
+
+AGENTS = {
+    "linkedin": LinkedInWebAgent,
+    "glassdoor": GlassdoorWebAgent
+}
+
+PHASES = ["login", "search", "extraction", "apply"]
+
+def get_git_revision() -> str:
+    """Get the short git commit hash of the working tree."""
+
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return "unknown"
+
+def create_state() -> AgentState:
+    """Create the workflow state used for every benchmark run."""
+
+    return AgentState(
+        session_id="benchmark",
+        start_time=datetime.now().isoformat(),
+        current_step="benchmark",
+        role=JobConfig.ROLE,
+        resume_path=JobConfig.RESUME_PATH,
+        location=JobConfig.LOCATION,
+        max_jobs=JobConfig.MAX_JOBS,
+        auto_apply=True
+    )
+
+async def run_agent(agent_name: str, mode: str, archive_dir: str, iterations: int) -> Dict[str, Any]:
+    """Run a web agent against a recorded (or live, when recording) session and collect phase timings."""
+
+    runs = []
+    phase_samples: Dict[str, List[float]] = {phase: [] for phase in PHASES}
+
+    for iteration in range(iterations):
+        agent = AGENTS[agent_name]()
+        agent.recorder = WebSessionRecorder(agent_name, mode=mode, archive_dir=archive_dir)
+
+        state = await agent.execute(create_state())
+        summary = agent.recorder.get_phase_summary()
+
+        for phase in PHASES:
+            if phase in summary:
+                phase_samples[phase].append(summary[phase]["total"])
+
+        runs.append({
+            "iteration": iteration + 1,
+            "phases": summary,
+            "memory": agent.memory_report,
+            "error": state.error
+        })
+        print(f"   • {agent_name} run {iteration + 1}/{iterations}: "
+              + ", ".join(f"{name} {stats['total']:.3f}s" for name, stats in summary.items()))
+
+    phases = {}
+    for phase, samples in phase_samples.items():
+        if not samples:
+            continue
+        ordered = sorted(samples)
+        phases[phase] = {
+            "runs": len(samples),
+            "mean": round(sum(samples) / len(samples), 4),
+            "median": round(ordered[len(ordered) // 2], 4),
+            "min": round(ordered[0], 4),
+            "max": round(ordered[-1], 4)
+        }
+
+    return {"phases": phases, "runs": runs}
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Print per-phase median deltas between two benchmark result files."""
+
+    print(f"\n📊 Comparison: {baseline.get('revision')} → {current.get('revision')}")
+
+    for agent_name, agent_results in current.get("agents", {}).items():
+        baseline_phases = baseline.get("agents", {}).get(agent_name, {}).get("phases", {})
+
+        for phase, stats in agent_results.get("phases", {}).items():
+            if phase not in baseline_phases:
+                print(f"   • {agent_name}/{phase}: {stats['median']:.3f}s (no baseline)")
+                continue
+
+            before = baseline_phases[phase]["median"]
+            after = stats["median"]
+            change = ((after - before) / before * 100) if before else 0.0
+            print(f"   • {agent_name}/{phase}: {before:.3f}s → {after:.3f}s ({change:+.1f}%)")
+
+def main():
+    """Main function."""
+
+    parser = argparse.ArgumentParser(description="Benchmark web agents against recorded sessions")
+    parser.add_argument("--agents", nargs="+", choices=list(AGENTS), default=list(AGENTS), help="Agents to benchmark")
+    parser.add_argument("--iterations", type=int, default=5, help="Replay runs per agent")
+    parser.add_argument("--record", action="store_true", help="Record a live session instead of replaying")
+    parser.add_argument("--archive-dir", default=Config.WEB_SESSION_ARCHIVE_DIR, help="HAR/DOM archive directory")
+    parser.add_argument("--output-dir", default=os.path.join(Config.APPLICATION_LOG_DIR, "benchmarks"), help="Results directory")
+    parser.add_argument("--compare", help="Baseline results file to compare against")
+
+    args = parser.parse_args()
+    mode = "record" if args.record else "replay"
+    iterations = 1 if args.record else args.iterations
+
+    print("🚀 Web Agent Benchmark")
+    print("=" * 50)
+    print(f"Mode: {mode} | Iterations: {iterations} | Archive: {args.archive_dir}")
+
+    revision = get_git_revision()
+    results = {
+        "revision": revision,
+        "timestamp": datetime.now().isoformat(),
+        "mode": mode,
+        "iterations": iterations,
+        "agents": {}
+    }
+
+    for agent_name in args.agents:
+        results["agents"][agent_name] = asyncio.run(run_agent(agent_name, mode, args.archive_dir, iterations))
+
+    if args.record:
+        print("\n✅ Session recorded. Run again without --record to benchmark the replay.")
+        return
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    output_path = os.path.join(args.output_dir, f"web_agents_{revision}.json")
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\n💾 Results saved to {output_path}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        compare_results(results, baseline)
+
+if __name__ == "__main__":
+    main()
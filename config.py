@@ -10,6 +10,7 @@ class Config:
     
     # API Keys
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
+    OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "")  # OpenAI-compatible endpoint (empty = api.openai.com)
     
     # Job Board Credentials (for web automation)
     LINKEDIN_EMAIL: str = os.getenv("LINKEDIN_EMAIL", "")
@@ -34,6 +35,104 @@ class Config:
     WEB_AUTOMATION_TIMEOUT: int = int(os.getenv("WEB_AUTOMATION_TIMEOUT", "60"))  # Default 60 seconds
     WEB_AUTOMATION_MAX_RETRIES: int = int(os.getenv("WEB_AUTOMATION_MAX_RETRIES", "3"))
     WEB_AUTOMATION_DELAY: float = float(os.getenv("WEB_AUTOMATION_DELAY", "2.0"))
+    WEB_AUTOMATION_HEADLESS: bool = os.getenv("WEB_AUTOMATION_HEADLESS", "false").lower() == "true"
+    
+    # Browser Context Lifecycle Settings
+    BROWSER_MAX_NAVIGATIONS_PER_CONTEXT: int = int(os.getenv("BROWSER_MAX_NAVIGATIONS_PER_CONTEXT", "25"))  # Recycle context after N navigations (0 disables)
+    BROWSER_MAX_RSS_MB: float = float(os.getenv("BROWSER_MAX_RSS_MB", "1500"))  # Recycle context above this browser memory (0 disables)
+    WEB_APPLY_PIPELINE: bool = os.getenv("WEB_APPLY_PIPELINE", "true").lower() == "true"  # Prefetch the next job page in a second tab while applying
+    
+    # Job URL Pre-flight Check Settings
+    JOB_LIVENESS_CHECK: bool = os.getenv("JOB_LIVENESS_CHECK", "true").lower() == "true"  # Drop dead postings before applying
+    JOB_LIVENESS_CONCURRENCY: int = int(os.getenv("JOB_LIVENESS_CONCURRENCY", "10"))  # Parallel HTTP checks
+    JOB_LIVENESS_TIMEOUT: float = float(os.getenv("JOB_LIVENESS_TIMEOUT", "10"))  # Seconds per URL
+    JOB_LIVENESS_CHECK_MARKERS: bool = os.getenv("JOB_LIVENESS_CHECK_MARKERS", "true").lower() == "true"  # GET pages to find "no longer accepting" markers
+    
+    # Applied Job Index Settings
+    SKIP_APPLIED_JOBS: bool = os.getenv("SKIP_APPLIED_JOBS", "true").lower() == "true"  # Skip jobs applied to in earlier runs
+    APPLIED_INDEX_PATH: str = os.getenv("APPLIED_INDEX_PATH", "./data/applied_jobs.idx")  # Fingerprint index file
+    
+    # Job Description Analysis Settings
+    ANALYZER_WORKERS: int = int(os.getenv("ANALYZER_WORKERS", "0"))  # Worker processes for batch analysis (0 = one per CPU)
+    ANALYZER_CHUNK_SIZE: int = int(os.getenv("ANALYZER_CHUNK_SIZE", "64"))  # Job descriptions per worker task
+    ANALYZER_BATCH_THRESHOLD: int = int(os.getenv("ANALYZER_BATCH_THRESHOLD", "200"))  # Use the process pool from this many JDs (0 disables)
+    
+    # NLP Extraction Settings
+    NLP_BACKEND: str = os.getenv("NLP_BACKEND", "regex")  # regex or spacy for skill extraction
+    SPACY_MODEL: str = os.getenv("SPACY_MODEL", "en_core_web_sm")  # Loaded once, on first use
+    SPACY_BATCH_SIZE: int = int(os.getenv("SPACY_BATCH_SIZE", "64"))  # Texts per nlp.pipe batch
+    SPACY_N_PROCESS: int = int(os.getenv("SPACY_N_PROCESS", "1"))  # Processes for nlp.pipe on large batches
+    
+    # Job Filter Settings
+    JOB_FILTER_ENABLED: bool = os.getenv("JOB_FILTER_ENABLED", "true").lower() == "true"  # Drop jobs failing the exclude/salary/type/level preferences right after dedupe
+    
+    # Salary Normalization Settings
+    SALARY_BASE_CURRENCY: str = os.getenv("SALARY_BASE_CURRENCY", "USD")  # Salaries are annualized and converted to this currency
+    SALARY_MIN_CONFIDENCE: float = float(os.getenv("SALARY_MIN_CONFIDENCE", "0.5"))  # Salary filtering ignores less certain parses
+    
+    # Location Normalization Settings
+    GAZETTEER_PATH: str = os.getenv("GAZETTEER_PATH", "")  # Place table (empty = bundled utils/gazetteer.tsv)
+    LOCATION_CACHE_SIZE: int = int(os.getenv("LOCATION_CACHE_SIZE", "4096"))  # Normalized location strings kept in memory
+    
+    # Relevance Ranking Settings
+    RELEVANCE_RANKING: bool = os.getenv("RELEVANCE_RANKING", "true").lower() == "true"  # Order jobs by resume match
+    RELEVANCE_METHOD: str = os.getenv("RELEVANCE_METHOD", "bm25")  # bm25 or tfidf
+    RELEVANCE_TITLE_WEIGHT: int = int(os.getenv("RELEVANCE_TITLE_WEIGHT", "3"))  # Job title terms count this many times
+    
+    # Analysis Cache Settings
+    ANALYSIS_CACHE_ENABLED: bool = os.getenv("ANALYSIS_CACHE_ENABLED", "true").lower() == "true"  # Reuse JD analysis across runs
+    ANALYSIS_CACHE_PATH: str = os.getenv("ANALYSIS_CACHE_PATH", "./data/analysis_cache.sqlite")  # SQLite cache file
+    ANALYSIS_CACHE_MAX_ENTRIES: int = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "50000"))  # LRU limit (0 = unbounded)
+    
+    # Prompt Settings
+    PROMPT_TOKEN_BUDGET: int = int(os.getenv("PROMPT_TOKEN_BUDGET", "2500"))  # Tokens for the per-job part of a prompt
+    PROMPT_RESUME_SHARE: float = float(os.getenv("PROMPT_RESUME_SHARE", "0.6"))  # Minimum budget share kept for the resume
+    
+    # LLM Scheduler Settings
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))  # Requests in flight at once
+    LLM_REQUESTS_PER_MINUTE: int = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "60"))  # 0 = no limit
+    LLM_TOKENS_PER_MINUTE: int = int(os.getenv("LLM_TOKENS_PER_MINUTE", "40000"))  # Prompt + max_tokens, 0 = no limit
+    LLM_MAX_RETRIES: int = int(os.getenv("LLM_MAX_RETRIES", "5"))  # Retries for 429 and 5xx responses
+    LLM_RUN_TOKEN_LIMIT: int = int(os.getenv("LLM_RUN_TOKEN_LIMIT", "0"))  # Tokens per run (0 = unlimited)
+    LLM_RUN_COST_LIMIT: float = float(os.getenv("LLM_RUN_COST_LIMIT", "0"))  # USD per run (0 = unlimited)
+    
+    # Structured Output Settings
+    LLM_STREAMING: bool = os.getenv("LLM_STREAMING", "true").lower() == "true"  # Stream and parse responses field by field
+    LLM_REPAIR_ATTEMPTS: int = int(os.getenv("LLM_REPAIR_ATTEMPTS", "1"))  # Follow-up requests for invalid fields only
+    LLM_STREAM_TIMEOUT: float = float(os.getenv("LLM_STREAM_TIMEOUT", "0"))  # Cancel a streamed generation after N seconds (0 = no limit)
+    
+    # Model Routing Settings
+    LLM_ROUTING_ENABLED: bool = os.getenv("LLM_ROUTING_ENABLED", "true").lower() == "true"  # false = always the strong model
+    LLM_FAST_MODEL: str = os.getenv("LLM_FAST_MODEL", "gpt-4o-mini")  # Default tier
+    LLM_STRONG_MODEL: str = os.getenv("LLM_STRONG_MODEL", "gpt-4")  # Large gaps, high-priority jobs, escalations
+    LLM_FAST_MAX_TOKENS: int = int(os.getenv("LLM_FAST_MAX_TOKENS", "1500"))
+    LLM_STRONG_MAX_TOKENS: int = int(os.getenv("LLM_STRONG_MAX_TOKENS", "2000"))
+    LLM_SKIP_MAX_MISSING: int = int(os.getenv("LLM_SKIP_MAX_MISSING", "0"))  # Skip the LLM at or below this many missing skills...
+    LLM_SKIP_MIN_COVERAGE: float = float(os.getenv("LLM_SKIP_MIN_COVERAGE", "90"))  # ...when skill coverage (%) is at least this
+    LLM_SKIP_BELOW_MATCH: float = float(os.getenv("LLM_SKIP_BELOW_MATCH", "20"))  # Skip jobs matching below this (0-100) unless high priority
+    LLM_STRONG_MIN_MISSING: int = int(os.getenv("LLM_STRONG_MIN_MISSING", "8"))  # Missing skills that need the strong model
+    LLM_STRONG_MIN_HIGH_MISSING: int = int(os.getenv("LLM_STRONG_MIN_HIGH_MISSING", "4"))  # High-priority missing skills that do too
+    LLM_ESCALATE_BELOW_CONFIDENCE: float = float(os.getenv("LLM_ESCALATE_BELOW_CONFIDENCE", "0.6"))  # Retry fast output on the strong model
+
+    # LLM Cache Settings
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"  # Reuse parsed LLM responses across runs
+    LLM_CACHE_PATH: str = os.getenv("LLM_CACHE_PATH", "./data/llm_cache.sqlite")  # SQLite cache file
+    LLM_CACHE_TTL_HOURS: float = float(os.getenv("LLM_CACHE_TTL_HOURS", "168"))  # Entry lifetime (0 = never expires)
+    LLM_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))  # LRU limit (0 = unbounded)
+    
+    # Resume Rendering Settings
+    RESUME_RENDER_WORKERS: int = int(os.getenv("RESUME_RENDER_WORKERS", "2"))  # Docx build processes (0 = one per CPU)
+    RESUME_RETENTION_DAYS: float = float(os.getenv("RESUME_RETENTION_DAYS", "30"))  # Remove unused resumes after N days (0 = keep)
+    RESUME_MAX_FILES: int = int(os.getenv("RESUME_MAX_FILES", "500"))  # Resumes kept in OUTPUT_RESUME_DIR, LRU (0 = unlimited)
+    
+    # Tailoring Reuse Settings
+    TAILORING_REUSE_ENABLED: bool = os.getenv("TAILORING_REUSE_ENABLED", "true").lower() == "true"  # Tailor near-duplicate jobs once
+    TAILORING_REUSE_THRESHOLD: float = float(os.getenv("TAILORING_REUSE_THRESHOLD", "0.95"))  # Requirement vector cosine similarity (0-1)
+    TAILORING_REUSE_AUDIT_PATH: str = os.getenv("TAILORING_REUSE_AUDIT_PATH", "./logs/tailoring_reuse.jsonl")  # Reuse decisions
+    
+    # Web Session Record/Replay Settings
+    WEB_SESSION_MODE: str = os.getenv("WEB_SESSION_MODE", "live")  # live, record or replay
+    WEB_SESSION_ARCHIVE_DIR: str = os.getenv("WEB_SESSION_ARCHIVE_DIR", "./data/web_sessions/")  # HAR and DOM archives
     
     # Enhanced Timeout Settings (in seconds)
     AUTH_TIMEOUT: int = int(os.getenv("AUTH_TIMEOUT", "45"))  # Authentication timeout
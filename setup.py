@@ -49,6 +49,6 @@ setup(
     },
     include_package_data=True,
     package_data={
-        "": ["*.md", "*.txt", "*.json"],
+        "": ["*.md", "*.txt", "*.json", "*.tsv"],
     },
 )
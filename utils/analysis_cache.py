@@ -0,0 +1,267 @@
+"""
+Analysis cache utilities for reusing job description analysis across runs.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import inspect
+import threading
+from typing import Dict, Any, List, Optional
+from config import Config
+
+def normalize_cache_text(text: str) -> str:
+    """
+    Normalize a job description for cache keys.
+
+    Case, line endings and trailing whitespace are ignored; line breaks are kept
+    because section extraction depends on them.
+    """
+    lines = (text or "").strip().lower().splitlines()
+    return "\n".join(line.rstrip() for line in lines)
+
+def content_fingerprint(*parts: Any) -> str:
+    """
+    Hash the inputs an analysis depends on (taxonomies, keyword lists, version strings).
+
+    Cached results are keyed by this fingerprint, so changing any of the inputs
+    invalidates them automatically.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+def source_fingerprint(*objects: Any) -> str:
+    """
+    Hash the source code of the modules, classes or functions an analysis runs.
+
+    Folded into cache versions so that editing the extraction code invalidates
+    its cached results without a manual version bump. Objects whose source is
+    not available (frozen builds) contribute their qualified name instead.
+    """
+    sources = []
+    for obj in objects:
+        try:
+            sources.append(inspect.getsource(obj))
+        except (OSError, TypeError):
+            sources.append(getattr(obj, "__qualname__", getattr(obj, "__name__", repr(obj))))
+    return content_fingerprint(*sources)
+
+class AnalysisCache:
+    """Size-bounded LRU key-value store for analysis results, kept in a local SQLite file."""
+
+    # Eviction runs after this many writes instead of on every write
+    EVICTION_INTERVAL = 100
+
+    def __init__(self, cache_path: Optional[str] = None, max_entries: Optional[int] = None):
+        self.cache_path = cache_path or Config.ANALYSIS_CACHE_PATH
+        self.max_entries = max_entries if max_entries is not None else Config.ANALYSIS_CACHE_MAX_ENTRIES
+
+        directory = os.path.dirname(self.cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Shared with executor threads, so access is serialized with a lock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.cache_path, timeout=30, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS analysis_cache (
+                key TEXT PRIMARY KEY,
+                namespace TEXT NOT NULL,
+                version TEXT NOT NULL,
+                result TEXT NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._connection.execute("CREATE INDEX IF NOT EXISTS idx_analysis_cache_access ON analysis_cache(last_access)")
+        self._connection.commit()
+
+        self._checked_versions: Dict[str, str] = {}
+        self._writes = 0
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def get(self, namespace: str, version: str, text: str) -> Optional[Any]:
+        """
+        Look up a cached result.
+
+        Args:
+            namespace: Kind of analysis (e.g. "jd_features")
+            version: Fingerprint of the extractor and taxonomy that produced the result
+            text: Job description text
+
+        Returns:
+            The cached result, or None on a miss
+        """
+        results = self.get_many(namespace, version, [text])
+        return results[0]
+
+    def get_many(self, namespace: str, version: str, texts: List[str]) -> List[Optional[Any]]:
+        """Look up several texts at once; misses are None."""
+
+        self._drop_stale_versions(namespace, version)
+
+        keys = [self._key(namespace, version, text) for text in texts]
+        found: Dict[str, Any] = {}
+
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                batch = list(set(keys[start:start + 500]))
+                placeholders = ",".join("?" * len(batch))
+                rows = self._connection.execute(
+                    f"SELECT key, result FROM analysis_cache WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                found.update((key, json.loads(result)) for key, result in rows)
+
+            if found:
+                now = time.time()
+                self._connection.executemany(
+                    "UPDATE analysis_cache SET last_access = ? WHERE key = ?",
+                    [(now, key) for key in found]
+                )
+                self._connection.commit()
+
+        results = [found.get(key) for key in keys]
+        hits = sum(1 for result in results if result is not None)
+        self._record(namespace, hits, len(results) - hits)
+        return results
+
+    def put(self, namespace: str, version: str, text: str, result: Any) -> None:
+        """Store a result for a text."""
+
+        self.put_many(namespace, version, [text], [result])
+
+    def put_many(self, namespace: str, version: str, texts: List[str], results: List[Any]) -> None:
+        """Store results for several texts at once."""
+
+        now = time.time()
+        rows = [
+            (self._key(namespace, version, text), namespace, version, json.dumps(result), now)
+            for text, result in zip(texts, results)
+        ]
+
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO analysis_cache (key, namespace, version, result, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._connection.commit()
+
+            self._writes += len(rows)
+            if self._writes >= self.EVICTION_INTERVAL:
+                self._writes = 0
+                self._evict()
+
+    def get_stats(self, namespace: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get hit and miss counts for this run.
+
+        Args:
+            namespace: Only report this namespace (all namespaces combined otherwise)
+
+        Returns:
+            Dictionary with hits, misses, lookups and hit_rate (percent)
+        """
+        counters = [self.stats.get(namespace)] if namespace else list(self.stats.values())
+        counters = [c for c in counters if c]
+
+        hits = sum(c["hits"] for c in counters)
+        misses = sum(c["misses"] for c in counters)
+        lookups = hits + misses
+
+        return {
+            "hits": hits,
+            "misses": misses,
+            "lookups": lookups,
+            "hit_rate": round(hits / lookups * 100, 1) if lookups else 0.0
+        }
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+
+        with self._lock:
+            self._connection.execute("DELETE FROM analysis_cache")
+            self._connection.commit()
+        self._checked_versions = {}
+
+    def close(self) -> None:
+        """Close the database connection."""
+
+        with self._lock:
+            self._connection.close()
+
+    def count(self) -> int:
+        """Get the number of cached results."""
+
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0]
+
+    def _drop_stale_versions(self, namespace: str, version: str) -> None:
+        """Delete results of a namespace produced by another extractor or taxonomy version (once per run)."""
+
+        if self._checked_versions.get(namespace) == version:
+            return
+
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM analysis_cache WHERE namespace = ? AND version != ?", (namespace, version)
+            )
+            self._connection.commit()
+        self._checked_versions[namespace] = version
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries above the size limit (caller holds the lock)."""
+
+        if not self.max_entries:
+            return
+
+        count = self._connection.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._connection.execute(
+                "DELETE FROM analysis_cache WHERE key IN "
+                "(SELECT key FROM analysis_cache ORDER BY last_access LIMIT ?)",
+                (excess,)
+            )
+            self._connection.commit()
+
+    def _record(self, namespace: str, hits: int, misses: int) -> None:
+        """Add to this run's counters."""
+
+        counters = self.stats.setdefault(namespace, {"hits": 0, "misses": 0})
+        counters["hits"] += hits
+        counters["misses"] += misses
+
+    @staticmethod
+    def _key(namespace: str, version: str, text: str) -> str:
+        """Content address of a text for one analysis version."""
+
+        payload = f"{namespace}\0{version}\0{normalize_cache_text(text)}"
+        return hashlib.blake2b(payload.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+_analysis_cache: Optional[AnalysisCache] = None
+_analysis_cache_pid: Optional[int] = None
+
+def get_analysis_cache() -> Optional[AnalysisCache]:
+    """
+    Get the process-wide analysis cache, or None when it is disabled or cannot be opened.
+
+    Forked worker processes open their own connection instead of reusing the parent's.
+    """
+    global _analysis_cache, _analysis_cache_pid
+
+    if not Config.ANALYSIS_CACHE_ENABLED:
+        return None
+
+    if _analysis_cache is None or _analysis_cache_pid != os.getpid():
+        try:
+            _analysis_cache = AnalysisCache()
+            _analysis_cache_pid = os.getpid()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not open analysis cache: {e}")
+            return None
+
+    return _analysis_cache
@@ -0,0 +1,236 @@
+"""
+Applied job index utilities for skipping jobs that were already applied to in earlier runs.
+"""
+
+import os
+import re
+import hashlib
+from array import array
+from bisect import bisect_left
+from typing import Dict, Any, List, Optional, Set, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from config import Config
+
+# Query parameters that identify a posting; all others (tracking, search context) are dropped
+JOB_ID_PARAMS = {"currentjobid", "jobid", "job_id", "jl", "jk", "id", "gh_jid", "lever-source"}
+
+# Company suffixes ignored when comparing company names
+COMPANY_SUFFIXES = re.compile(r"\b(inc|incorporated|llc|ltd|limited|corp|corporation|co|company|gmbh|plc)\b\.?")
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a job URL so tracking parameters and cosmetic differences do not matter."""
+
+    if not url:
+        return ""
+
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+
+    path = re.sub(r"/+$", "", parts.path) or "/"
+    query = urlencode(sorted((k.lower(), v) for k, v in parse_qsl(parts.query) if k.lower() in JOB_ID_PARAMS))
+
+    return urlunsplit(("https", host, path, query, ""))
+
+def normalize_company_title(company: str, title: str) -> str:
+    """Normalize a company and title pair for fuzzy duplicate detection."""
+
+    def normalize(text: str) -> str:
+        text = (text or "").lower()
+        text = re.sub(r"[^a-z0-9+#]+", " ", text)
+        return " ".join(text.split())
+
+    company_key = " ".join(COMPANY_SUFFIXES.sub(" ", normalize(company)).split())
+    title_key = normalize(title)
+
+    if not company_key or not title_key:
+        return ""
+    return f"{company_key}|{title_key}"
+
+def normalize_location(location: str) -> str:
+    """Normalize a location by case, punctuation and whitespace ("Austin, TX" == "austin tx")."""
+
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", (location or "").lower()).split())
+
+def normalize_description(description: str) -> str:
+    """Normalize a job description by case and whitespace so reposts hash the same."""
+
+    return " ".join((description or "").lower().split())
+
+class AppliedJobIndex:
+    """Compact on-disk set of 64-bit fingerprints for jobs that were already applied to."""
+
+    def __init__(self, index_path: Optional[str] = None):
+        self.index_path = index_path or Config.APPLIED_INDEX_PATH
+        self._fingerprints = array('Q')  # sorted, loaded from disk
+        self._pending: Set[int] = set()  # added this run, merged on save
+        self.loaded = False
+
+    def load(self) -> bool:
+        """
+        Load the index file if it exists.
+
+        Returns:
+            True if an index file was loaded
+        """
+        self._fingerprints = array('Q')
+        self._pending = set()
+        self.loaded = True
+
+        if not os.path.exists(self.index_path):
+            return False
+
+        with open(self.index_path, "rb") as f:
+            data = f.read()
+
+        # Ignore a truncated trailing entry from an interrupted write
+        usable = len(data) - len(data) % self._fingerprints.itemsize
+        self._fingerprints.frombytes(data[:usable])
+        return True
+
+    def save(self) -> None:
+        """Merge entries added this run and write the index atomically."""
+
+        if self._pending:
+            merged = sorted(set(self._fingerprints) | self._pending)
+            self._fingerprints = array('Q', merged)
+            self._pending = set()
+
+        directory = os.path.dirname(self.index_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temp_path = f"{self.index_path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(self._fingerprints.tobytes())
+        os.replace(temp_path, self.index_path)
+
+    def fingerprints(self, job: Dict[str, Any]) -> List[int]:
+        """
+        Compute the fingerprints of a job.
+
+        Accepts both scraped job dictionaries (``url``, ``title``, ``company``) and
+        database rows (``job_url``, ``job_title``, ``company_name``).
+
+        The company+title and description fingerprints include the location, so the
+        same role posted for another city is not taken as already applied; without
+        a location only the URL identifies the job.
+
+        Returns:
+            Up to three fingerprints: canonical URL, company+title+location and
+            location+description hash
+        """
+        url = canonicalize_url(job.get("url") or job.get("job_url") or "")
+        company_title = normalize_company_title(
+            job.get("company") or job.get("company_name") or "",
+            job.get("title") or job.get("job_title") or ""
+        )
+        location = normalize_location(job.get("location") or job.get("job_location") or "")
+        description = normalize_description(job.get("description") or "")
+
+        keys = []
+        if url:
+            keys.append(f"url:{url}")
+        if company_title and location:
+            keys.append(f"ct:{company_title}|{location}")
+        if description and location:
+            keys.append(f"desc:{location}|{description}")
+
+        return [self._hash(key) for key in keys]
+
+    def contains(self, job: Dict[str, Any]) -> bool:
+        """Check whether any fingerprint of the job is in the index."""
+
+        self._ensure_loaded()
+        return any(self._has(fingerprint) for fingerprint in self.fingerprints(job))
+
+    def add(self, job: Dict[str, Any]) -> None:
+        """Record a job as applied (persisted on the next ``save``)."""
+
+        self._ensure_loaded()
+        self._pending.update(self.fingerprints(job))
+
+    def filter_new(self, jobs: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split jobs into ones not seen before and ones already applied to.
+
+        Returns:
+            Tuple of (new jobs, already applied jobs)
+        """
+        new_jobs = []
+        known_jobs = []
+        for job in jobs:
+            if self.contains(job):
+                known_jobs.append(job)
+            else:
+                new_jobs.append(job)
+        return new_jobs, known_jobs
+
+    def seed_from_database(self, database=None) -> int:
+        """
+        Add every previously saved application from the database.
+
+        Args:
+            database: ApplicationDatabase instance (created if not given)
+
+        Returns:
+            Number of applications added
+        """
+        if database is None:
+            from utils.database import ApplicationDatabase
+            database = ApplicationDatabase()
+
+        applications = database.get_applied_jobs()
+        for application in applications:
+            job_data = application.get("job_data") or {}
+            self.add({**job_data, **{k: v for k, v in application.items() if v}})
+
+        return len(applications)
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._fingerprints) + len(self._pending)
+
+    def _ensure_loaded(self) -> None:
+        """Load the index on first use."""
+
+        if not self.loaded:
+            self.load()
+
+    def _has(self, fingerprint: int) -> bool:
+        """Binary search the sorted fingerprints, then check this run's additions."""
+
+        position = bisect_left(self._fingerprints, fingerprint)
+        if position < len(self._fingerprints) and self._fingerprints[position] == fingerprint:
+            return True
+        return fingerprint in self._pending
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        """Hash a fingerprint key to an unsigned 64-bit integer."""
+
+        return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+_applied_job_index: Optional[AppliedJobIndex] = None
+
+def get_applied_job_index() -> AppliedJobIndex:
+    """
+    Get the process-wide applied job index, loading it on first use.
+
+    When no index file exists yet and Supabase is configured, the index is seeded
+    from previously saved applications and written to disk.
+    """
+    global _applied_job_index
+
+    if _applied_job_index is None:
+        index = AppliedJobIndex()
+        if not index.load() and Config.USE_SUPABASE:
+            try:
+                index.seed_from_database()
+                index.save()
+            except Exception as e:
+                print(f"Warning: Could not seed applied job index from database: {e}")
+        _applied_job_index = index
+
+    return _applied_job_index
@@ -0,0 +1,135 @@
+"""
+Batch job description analysis utilities that spread feature extraction across processes.
+"""
+
+import os
+import asyncio
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional
+from config import Config
+from utils.jd_feature_extractor import JDFeatureExtractor, copy_features, get_jd_feature_extractor
+from utils.analysis_cache import get_analysis_cache
+
+# Extractor owned by each worker process (set by the pool initializer)
+_worker_extractor: Optional[JDFeatureExtractor] = None
+
+def _init_worker() -> None:
+    """Compile the skill matcher and section patterns once per worker process."""
+
+    global _worker_extractor
+    # The parent reads and writes the persistent cache, so workers never contend for it
+    _worker_extractor = JDFeatureExtractor(persistent=False)
+
+def _extract_chunk(descriptions: List[str], n_process: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Extract features for one chunk of descriptions inside a worker (or in-process with one worker).
+
+    The chunk's skill fragments go through one batched ``nlp.pipe`` call; pool
+    workers pass n_process=1 since the pool already uses every core.
+    """
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = JDFeatureExtractor(persistent=False)
+    return _worker_extractor.extract_many(descriptions, n_process=n_process)
+
+class BatchJDAnalyzer:
+    """Extracts JD features for large batches on a process pool, keeping input order."""
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: Optional[int] = None):
+        self.workers = workers or Config.ANALYZER_WORKERS or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size or Config.ANALYZER_CHUNK_SIZE)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def analyze(self, descriptions: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract features for every description, blocking until all chunks are done.
+
+        Args:
+            descriptions: Job description texts
+
+        Returns:
+            Feature dictionaries in the same order as ``descriptions``
+        """
+        cached, chunks = self._plan(descriptions)
+        if self.workers <= 1:
+            results = [_extract_chunk(chunk) for chunk in chunks]
+        else:
+            results = list(self._get_executor().map(partial(_extract_chunk, n_process=1), chunks))
+        return self._assemble(descriptions, cached, chunks, results)
+
+    async def analyze_async(self, descriptions: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract features without blocking the event loop.
+
+        Chunks run on the process pool (or a worker thread with one worker) while
+        other coroutines keep running.
+
+        Returns:
+            Feature dictionaries in the same order as ``descriptions``
+        """
+        loop = asyncio.get_running_loop()
+
+        if self.workers <= 1:
+            return await loop.run_in_executor(None, self.analyze, descriptions)
+
+        cached, chunks = self._plan(descriptions)
+        executor = self._get_executor()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(executor, _extract_chunk, chunk, 1) for chunk in chunks
+        ])
+        return self._assemble(descriptions, cached, chunks, results)
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "BatchJDAnalyzer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the pool on first use so the workers are reused across batches."""
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        return self._executor
+
+    def _plan(self, descriptions: List[str]):
+        """
+        Deduplicate descriptions (reposts are common), serve what the persistent
+        cache already has and split the rest into chunks.
+        """
+        unique = list(dict.fromkeys(description or "" for description in descriptions))
+
+        cached: Dict[str, Dict[str, Any]] = {}
+        analysis_cache = get_analysis_cache()
+        if analysis_cache:
+            extractor = get_jd_feature_extractor()
+            found = analysis_cache.get_many(extractor.CACHE_NAMESPACE, extractor.version, unique)
+            cached = {description: features for description, features in zip(unique, found) if features is not None}
+
+        pending = [description for description in unique if description not in cached]
+        chunks = [pending[i:i + self.chunk_size] for i in range(0, len(pending), self.chunk_size)]
+        return cached, chunks
+
+    @staticmethod
+    def _assemble(descriptions: List[str], cached: Dict[str, Dict[str, Any]],
+                  chunks: List[List[str]], results: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Store new results in the persistent cache and map everything back onto the original order."""
+
+        computed = dict(zip((d for chunk in chunks for d in chunk), (f for chunk in results for f in chunk)))
+
+        analysis_cache = get_analysis_cache()
+        if analysis_cache and computed:
+            extractor = get_jd_feature_extractor()
+            analysis_cache.put_many(extractor.CACHE_NAMESPACE, extractor.version,
+                                    list(computed), list(computed.values()))
+
+        features = {**cached, **computed}
+        return [copy_features(features[description or ""]) for description in descriptions]
@@ -0,0 +1,363 @@
+"""
+Browser context lifecycle utilities for long-running web automation sessions.
+"""
+
+import os
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable
+from datetime import datetime
+from playwright.async_api import Browser, BrowserContext, Page
+from config import Config
+
+class BrowserContextManager:
+    """Owns the active browser context and page, recycling them to cap memory and recover from crashes."""
+
+    def __init__(self, browser: Browser, context_options: Optional[Dict[str, Any]] = None,
+                 page_headers: Optional[Dict[str, str]] = None, init_script: Optional[str] = None,
+                 recorder=None, max_navigations: Optional[int] = None, max_rss_mb: Optional[float] = None):
+        self.browser = browser
+        self.context_options = context_options or {}
+        self.page_headers = page_headers or {}
+        self.init_script = init_script
+        self.recorder = recorder
+        self.max_navigations = max_navigations if max_navigations is not None else Config.BROWSER_MAX_NAVIGATIONS_PER_CONTEXT
+        self.max_rss_mb = max_rss_mb if max_rss_mb is not None else Config.BROWSER_MAX_RSS_MB
+
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+        self.page_crashed = False
+
+        self._prefetch: Optional[Dict[str, Any]] = None
+        self.prefetch_hits = 0
+        self.prefetch_misses = 0
+
+        self._storage_state: Optional[Dict[str, Any]] = None
+        self._current_stats: Optional[Dict[str, Any]] = None
+        self._context_stats: List[Dict[str, Any]] = []
+        self._psutil_warned = False
+
+    async def start(self) -> Page:
+        """
+        Open the first context and page.
+
+        Returns:
+            The active page
+        """
+        await self._open_context()
+        return self.page
+
+    async def new_page(self) -> Page:
+        """Open an additional page in the active context with the same headers and init script."""
+
+        page = await self.context.new_page()
+        await self._prepare_page(page)
+        return page
+
+    async def navigate(self, url: str, **kwargs) -> Page:
+        """
+        Navigate the active page, recycling the context first when a limit has been reached.
+
+        Args:
+            url: URL to open
+            **kwargs: Extra arguments for ``page.goto``
+
+        Returns:
+            The page that performed the navigation (may differ from the previous page)
+        """
+        await self.recycle_if_needed()
+
+        await self.page.goto(url, **kwargs)
+        self.record_navigation()
+        return self.page
+
+    def record_navigation(self) -> None:
+        """Count a navigation made directly on the active page and sample memory."""
+
+        if self._current_stats is None:
+            return
+
+        self._current_stats["navigations"] += 1
+        rss_mb = self.get_browser_rss_mb()
+        if rss_mb is not None:
+            self._current_stats["peak_rss_mb"] = max(self._current_stats["peak_rss_mb"], rss_mb)
+            self._current_stats["last_rss_mb"] = rss_mb
+
+    async def recycle_if_needed(self) -> bool:
+        """
+        Recycle the context if it exceeded the navigation or memory limit.
+
+        Returns:
+            True if the context was recycled
+        """
+        reason = self._limit_reason()
+        if reason is None:
+            return False
+
+        await self.recycle(reason)
+        return True
+
+    async def prefetch(self, url: str, on_load: Optional[Callable[[Page], Awaitable[Any]]] = None) -> bool:
+        """
+        Start loading a URL in a background tab so it can be swapped in later.
+
+        Only one prefetch is kept; starting a new one cancels the previous one.
+        Nothing is prefetched once the context is due for recycling, so the next
+        navigation goes through ``navigate`` and recycles it.
+
+        Args:
+            url: URL to load
+            on_load: Optional coroutine run on the loaded page (e.g. resolving a button);
+                its result is returned by ``take_prefetched``
+
+        Returns:
+            True if the prefetch was started
+        """
+        await self.cancel_prefetch()
+
+        if self.context is None or self._limit_reason() is not None:
+            return False
+
+        page = await self.new_page()
+
+        async def load():
+            await page.goto(url)
+            await page.wait_for_load_state("networkidle")
+            return await on_load(page) if on_load else None
+
+        self._prefetch = {"url": url, "page": page, "task": asyncio.create_task(load())}
+        return True
+
+    async def take_prefetched(self, url: str) -> Optional[Tuple[Page, Any]]:
+        """
+        Swap a prefetched page in as the active page.
+
+        Args:
+            url: URL the caller is about to open
+
+        Returns:
+            Tuple of (page, on_load result), or None if the URL was not prefetched
+            or loading it failed
+        """
+        prefetch = self._prefetch
+        if prefetch is None:
+            return None
+
+        if prefetch["url"] != url:
+            await self.cancel_prefetch()
+            self.prefetch_misses += 1
+            return None
+
+        self._prefetch = None
+        try:
+            result = await prefetch["task"]
+        except Exception:
+            await self._close_page(prefetch["page"])
+            self.prefetch_misses += 1
+            return None
+
+        previous_page = self.page
+        self.page = prefetch["page"]
+        self.page_crashed = False
+        await self._close_page(previous_page)
+
+        self.record_navigation()
+        self.prefetch_hits += 1
+        return self.page, result
+
+    async def cancel_prefetch(self) -> None:
+        """Stop a pending prefetch and close its tab."""
+
+        prefetch = self._prefetch
+        self._prefetch = None
+        if prefetch is None:
+            return
+
+        prefetch["task"].cancel()
+        try:
+            await prefetch["task"]
+        except (asyncio.CancelledError, Exception):
+            pass
+        await self._close_page(prefetch["page"])
+
+    async def recycle(self, reason: str) -> Page:
+        """
+        Replace the active context with a fresh one that carries over cookies and local storage.
+
+        Args:
+            reason: Why the context is being recycled (kept in the memory report)
+
+        Returns:
+            The new active page
+        """
+        try:
+            self._storage_state = await self.context.storage_state()
+        except Exception:
+            # Keep the last known storage state if the context is no longer responsive
+            pass
+
+        await self._close_context(reason)
+        await self._open_context()
+        return self.page
+
+    async def recover(self) -> Page:
+        """
+        Restart the active page after a renderer crash.
+
+        The crashed page is replaced within the same context; if the context itself
+        is unusable it is recycled instead.
+
+        Returns:
+            The new active page
+        """
+        if self._current_stats is not None:
+            self._current_stats["crashes"] += 1
+
+        await self._close_page(self.page)
+
+        try:
+            self.page = await self.new_page()
+            self.page_crashed = False
+        except Exception:
+            await self.recycle("page crash")
+
+        return self.page
+
+    async def close(self) -> None:
+        """Close the active page and context."""
+
+        if self.context:
+            await self._close_context("session end")
+
+    def get_browser_rss_mb(self) -> Optional[float]:
+        """
+        Get the combined resident memory of the browser processes.
+
+        Returns:
+            Memory in MB, or None when psutil is unavailable
+        """
+        try:
+            import psutil
+        except ImportError:
+            self._psutil_warned = True
+            return None
+
+        total = 0
+        try:
+            for process in psutil.Process(os.getpid()).children(recursive=True):
+                try:
+                    name = process.name().lower()
+                    if "chrom" in name or "headless_shell" in name:
+                        total += process.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+        except Exception:
+            return None
+
+        return total / (1024 * 1024)
+
+    def get_memory_report(self) -> Dict[str, Any]:
+        """Get per-context navigation counts, peak memory and recycle reasons for this run."""
+
+        contexts = list(self._context_stats)
+        if self._current_stats is not None:
+            contexts.append(dict(self._current_stats))
+
+        return {
+            "contexts": contexts,
+            "total_contexts": len(contexts),
+            "total_navigations": sum(c["navigations"] for c in contexts),
+            "total_crashes": sum(c["crashes"] for c in contexts),
+            "peak_rss_mb": max((c["peak_rss_mb"] for c in contexts), default=0.0),
+            "prefetch_hits": self.prefetch_hits,
+            "prefetch_misses": self.prefetch_misses,
+            "memory_tracking": not self._psutil_warned
+        }
+
+    def _limit_reason(self) -> Optional[str]:
+        """Get why the active context should be recycled, or None if it is within limits."""
+
+        if self._current_stats is None:
+            return None
+
+        navigations = self._current_stats["navigations"]
+        if self.max_navigations and navigations >= self.max_navigations:
+            return f"navigation limit ({navigations})"
+
+        rss_mb = self._current_stats.get("last_rss_mb")
+        if self.max_rss_mb and rss_mb is not None and rss_mb >= self.max_rss_mb:
+            return f"memory limit ({rss_mb:.0f} MB)"
+
+        return None
+
+    async def _open_context(self) -> None:
+        """Create a context and page, restoring any saved storage state."""
+
+        options = dict(self.context_options)
+        if self._storage_state:
+            options["storage_state"] = self._storage_state
+        if self.recorder:
+            options.update(self.recorder.context_options())
+
+        self.context = await self.browser.new_context(**options)
+
+        if self.recorder:
+            await self.recorder.attach(self.context)
+
+        self.page = await self.context.new_page()
+        await self._prepare_page(self.page)
+        self.page_crashed = False
+
+        self._current_stats = {
+            "context_id": len(self._context_stats) + 1,
+            "opened_at": datetime.now().isoformat(),
+            "closed_at": None,
+            "navigations": 0,
+            "crashes": 0,
+            "peak_rss_mb": 0.0,
+            "last_rss_mb": None,
+            "close_reason": None
+        }
+
+    async def _prepare_page(self, page: Page) -> None:
+        """Apply headers, init script and crash tracking to a new page."""
+
+        if self.page_headers:
+            await page.set_extra_http_headers(self.page_headers)
+        if self.init_script:
+            await page.add_init_script(self.init_script)
+
+        def on_crash(crashed_page):
+            if crashed_page is self.page:
+                self.page_crashed = True
+
+        page.on("crash", on_crash)
+
+    async def _close_context(self, reason: str) -> None:
+        """Close the active context and archive its statistics."""
+
+        await self.cancel_prefetch()
+        await self._close_page(self.page)
+
+        try:
+            if self.context:
+                await self.context.close()
+        except Exception:
+            pass
+
+        self.page = None
+        self.context = None
+
+        if self._current_stats is not None:
+            self._current_stats["closed_at"] = datetime.now().isoformat()
+            self._current_stats["close_reason"] = reason
+            self._context_stats.append(self._current_stats)
+            self._current_stats = None
+
+    async def _close_page(self, page: Optional[Page]) -> None:
+        """Close a page, ignoring pages that are already closed or crashed."""
+
+        try:
+            if page:
+                await page.close()
+        except Exception:
+            pass
@@ -34,6 +34,10 @@ class ApplicationDatabase:
         """Get all applications for a session."""
         return self.db.get_applications_by_session(session_id)
     
+    def get_applied_jobs(self) -> List[Dict[str, Any]]:
+        """Get identifying fields of all past applications."""
+        return self.db.get_applied_jobs()
+    
     def get_application_statistics(self, days: int = 30) -> Dict[str, Any]:
         """Get application statistics for the last N days."""
         return self.db.get_application_statistics(days)
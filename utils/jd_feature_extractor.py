@@ -0,0 +1,401 @@
+"""
+Job description feature extraction utilities shared by the analyzer.
+"""
+
+import re
+import sys
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+from utils.skill_matcher import SkillMatcher, get_skill_matcher
+from utils.analysis_cache import content_fingerprint, get_analysis_cache, source_fingerprint
+from config import Config
+
+# Factors that increase complexity
+COMPLEXITY_INDICATORS = [
+    'senior', 'lead', 'principal', 'architect', 'expert', 'advanced',
+    'complex', 'challenging', 'strategic', 'leadership', 'management',
+    'mentor', 'coach', 'guide', 'oversee', 'coordinate'
+]
+
+# Factors that decrease complexity
+SIMPLICITY_INDICATORS = [
+    'entry', 'junior', 'basic', 'simple', 'routine', 'assist',
+    'support', 'learn', 'training', 'guidance', 'supervision'
+]
+
+# Experience level indicators (first matching level wins)
+EXPERIENCE_LEVELS = {
+    'entry_level': ['entry', 'junior', '0-2', '1-2', '2+', 'recent graduate', 'new grad'],
+    'mid_level': ['mid', 'intermediate', '3-5', '4-6', '5+', 'experienced'],
+    'senior_level': ['senior', 'lead', 'principal', '6+', '8+', '10+', 'expert'],
+    'management': ['manager', 'director', 'head', 'vp', 'cto', 'leadership']
+}
+
+CULTURE_INDICATORS = {
+    'remote_friendly': ['remote', 'work from home', 'wfh', 'hybrid', 'flexible location'],
+    'collaborative': ['team', 'collaborate', 'collaboration', 'partnership', 'coordinate'],
+    'innovative': ['innovate', 'innovation', 'creative', 'cutting-edge', 'latest technology'],
+    'fast_paced': ['fast-paced', 'dynamic', 'agile', 'quick', 'rapid'],
+    'learning_focused': ['learn', 'learning', 'growth', 'development', 'training'],
+    'diverse': ['diversity', 'inclusive', 'inclusion', 'equal opportunity', 'diverse team']
+}
+
+# Section headings whose following fragment ("<heading>: ...") feeds each feature.
+# A heading may feed several features (e.g. "qualifications" is both a required-skill
+# section and a qualification).
+SECTION_HEADINGS = {
+    'required_skills': ['required', 'must have', 'requirements', 'qualifications'],
+    'preferred_skills': ['preferred', 'nice to have', 'bonus', 'plus'],
+    'responsibilities': ['responsibilities', 'duties', "what you'll do", 'key responsibilities'],
+    'qualifications': ['qualifications', 'requirements', 'education', 'experience'],
+    'benefits': ['benefits', 'perks', 'what we offer', 'compensation']
+}
+
+# Block headings for company boilerplate and legal statements, which carry no requirements
+ABOUT_HEADING_PATTERN = re.compile(
+    r"(?:about\s+(?!the\s+(?:role|position|job|opportunity)\b)|who we are|our (?:company|mission|story|values)|why join)",
+    re.IGNORECASE
+)
+LEGAL_PATTERN = re.compile(
+    r"\b(?:equal (?:employment )?opportunity|eeo\b|without regard to|reasonable accommodations?|e-verify|affirmative action)",
+    re.IGNORECASE
+)
+BLOCK_BULLETS = "#*-•·> \t"
+# About and legal blocks end at a blank line or at a short title-like line (a heading
+# not in SECTION_HEADINGS, like "The Role"), so they never swallow the next section
+BOILERPLATE_SECTIONS = ("about", "legal")
+TITLE_MAX_WORDS = 5
+
+# Simplified custom skill pattern - in practice, you might use NLP or ML
+CUSTOM_SKILL_PATTERN = re.compile(r'\b[a-zA-Z][a-zA-Z0-9\s&+.-]+\b')
+
+def copy_features(features: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy list and dict values so callers cannot mutate a shared feature entry."""
+
+    return {key: value.copy() if isinstance(value, (list, dict)) else value
+            for key, value in features.items()}
+
+class JDFeatureExtractor:
+    """
+    Extracts every analyzer feature from a job description in one pass.
+
+    Results are memoized per description in memory and, when enabled, in the
+    persistent analysis cache.
+    """
+
+    MAX_CACHE_ENTRIES = 2048
+
+    # Namespace and version of results in the persistent analysis cache. The version
+    # includes the source of the extraction code, so changing it invalidates results.
+    CACHE_NAMESPACE = "jd_features"
+    VERSION = "1"
+
+    def __init__(self, skill_matcher: Optional[SkillMatcher] = None, max_cache_entries: Optional[int] = None,
+                 persistent: bool = True, nlp_backend: Optional[str] = None):
+        self.skill_matcher = skill_matcher or get_skill_matcher()
+        self.max_cache_entries = max_cache_entries or self.MAX_CACHE_ENTRIES
+        self.persistent = persistent
+
+        # "regex" (default) or "spacy" for skill extraction from section fragments
+        self.nlp_backend = (nlp_backend or Config.NLP_BACKEND).lower()
+        self.nlp_extractor = None
+        if self.nlp_backend == "spacy":
+            from utils.nlp_extractor import get_nlp_skill_extractor
+            self.nlp_extractor = get_nlp_skill_extractor()
+
+        self.version = content_fingerprint(
+            self.VERSION, self.skill_matcher.taxonomy, COMPLEXITY_INDICATORS, SIMPLICITY_INDICATORS,
+            EXPERIENCE_LEVELS, CULTURE_INDICATORS, SECTION_HEADINGS, CUSTOM_SKILL_PATTERN.pattern,
+            self.nlp_backend, self.nlp_extractor.model if self.nlp_extractor else None,
+            source_fingerprint(sys.modules[__name__], SkillMatcher,
+                               *([type(self.nlp_extractor)] if self.nlp_extractor else []))
+        )
+        self._cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # Heading occurrences are found with one prefix-factored pattern; the fragment after
+        # each one is matched in place
+        headings = list(dict.fromkeys(h for hs in SECTION_HEADINGS.values() for h in hs))
+        self.heading_pattern = re.compile(SkillMatcher._build_trie_pattern(headings))
+        self.fragment_pattern = re.compile(r"[:\s]+([^.\n]+)")
+
+    def extract(self, description: str) -> Dict[str, Any]:
+        """
+        Extract all features of a job description.
+
+        Args:
+            description: Job description text (case does not matter)
+
+        Returns:
+            Dictionary with complexity_score, experience_level, required_skills,
+            preferred_skills, responsibilities, qualifications, benefits and company_culture
+        """
+        if not description:
+            return self._empty_features()
+
+        key = hashlib.blake2b(description.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return copy_features(cached)
+
+        self.cache_misses += 1
+
+        # Then the persistent cache shared across runs
+        analysis_cache = get_analysis_cache() if self.persistent else None
+        features = analysis_cache.get(self.CACHE_NAMESPACE, self.version, description) if analysis_cache else None
+        if features is None:
+            features = self._extract(description.lower())
+            if analysis_cache:
+                analysis_cache.put(self.CACHE_NAMESPACE, self.version, description, features)
+
+        self._remember(key, features)
+        return copy_features(features)
+
+    def extract_many(self, descriptions: List[str], n_process: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Extract the features of many job descriptions.
+
+        With the spaCy backend, the skill fragments of every description not already
+        cached go through one ``nlp.pipe`` call instead of one call per description.
+
+        Args:
+            descriptions: Job description texts
+            n_process: Processes for ``nlp.pipe`` (defaults to Config.SPACY_N_PROCESS)
+
+        Returns:
+            Feature dictionaries in the same order as ``descriptions``
+        """
+        features: Dict[str, Dict[str, Any]] = {"": self._empty_features()}
+        keys: Dict[str, bytes] = {}
+        pending = []
+        for description in dict.fromkeys(description or "" for description in descriptions):
+            if not description:
+                continue
+            key = keys[description] = hashlib.blake2b(description.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                features[description] = cached
+            else:
+                self.cache_misses += 1
+                pending.append(description)
+
+        analysis_cache = get_analysis_cache() if self.persistent else None
+        if analysis_cache and pending:
+            found = analysis_cache.get_many(self.CACHE_NAMESPACE, self.version, pending)
+            for description, cached in zip(pending, found):
+                if cached is not None:
+                    features[description] = cached
+                    self._remember(keys[description], cached)
+            pending = [description for description in pending if description not in features]
+
+        if pending:
+            texts = [description.lower() for description in pending]
+            sections = [self._segment_sections(text) for text in texts]
+
+            fragment_skills: Dict[str, List[str]] = {}
+            if self.nlp_extractor is not None:
+                fragments = list(dict.fromkeys(
+                    fragment for section in sections
+                    for fragment in section['required_skills'] + section['preferred_skills']
+                ))
+                fragment_skills = dict(zip(fragments, self.nlp_extractor.pipe_skills(fragments, n_process=n_process)))
+
+            computed = [self._extract(text, section, fragment_skills) for text, section in zip(texts, sections)]
+            if analysis_cache:
+                analysis_cache.put_many(self.CACHE_NAMESPACE, self.version, pending, computed)
+            for description, result in zip(pending, computed):
+                features[description] = result
+                self._remember(keys[description], result)
+
+        return [copy_features(features[description or ""]) for description in descriptions]
+
+    def extract_skills_from_text(self, text: str) -> List[str]:
+        """Extract known taxonomy skills and custom skill phrases from a text fragment."""
+
+        if self.nlp_extractor is not None:
+            return self.nlp_extractor.extract_skills(text)
+
+        # Known skills from the shared taxonomy in a single pass
+        skills = self.skill_matcher.find_skills(text)
+        seen = set(skills)
+
+        # Also look for custom skills mentioned
+        for skill in CUSTOM_SKILL_PATTERN.findall(text):
+            skill_clean = skill.strip().lower()
+            if len(skill_clean) > 2 and skill_clean not in seen:
+                skills.append(skill_clean)
+                seen.add(skill_clean)
+
+        return skills
+
+    def segment_blocks(self, description: str) -> List[Tuple[str, str]]:
+        """
+        Split a job description into labeled blocks, keeping the original text.
+
+        A line starting with a section heading ("Requirements:", "## What you'll do")
+        opens a block labeled with the first feature the heading feeds; text before
+        the first heading is "overview". Company introductions are labeled "about"
+        and equal-opportunity statements "legal"; text after them that no heading
+        opens is "overview" again.
+
+        Returns:
+            List of (section, block text) in document order
+        """
+        blocks: List[Tuple[str, List[str]]] = [("overview", [])]
+
+        for line in (description or "").splitlines():
+            label = line.strip(BLOCK_BULLETS)
+            lowered = label.lower()
+            section = None
+
+            heading = self.heading_pattern.match(lowered)
+            rest = lowered[heading.end():] if heading else ""
+            # A heading word only opens a block as a short title or before a colon
+            if heading and not rest[:1].isalnum() and (len(lowered.split()) <= 4 or rest.lstrip().startswith(":")):
+                section = next(feature for feature, headings in SECTION_HEADINGS.items()
+                               if heading.group() in headings)
+            elif ABOUT_HEADING_PATTERN.match(lowered) and len(lowered.split()) <= 5:
+                section = "about"
+            elif LEGAL_PATTERN.search(lowered) and blocks[-1][0] != "legal":
+                section = "legal"
+            elif blocks[-1][0] in BOILERPLATE_SECTIONS and blocks[-1][1] and (
+                    not label or (len(lowered.split()) <= TITLE_MAX_WORDS and not label.endswith((".", "!", "?", ",", ";")))):
+                section = "overview"
+
+            if section:
+                blocks.append((section, []))
+            if line.strip():
+                blocks[-1][1].append(line.rstrip())
+
+        return [(section, "\n".join(lines)) for section, lines in blocks if lines]
+
+    def clear_cache(self) -> None:
+        """Drop all memoized features."""
+
+        self._cache.clear()
+
+    def _remember(self, key: bytes, features: Dict[str, Any]) -> None:
+        """Memoize features, evicting the least recently used entry beyond the limit."""
+
+        self._cache[key] = features
+        if len(self._cache) > self.max_cache_entries:
+            self._cache.popitem(last=False)
+
+    def _extract(self, text: str, sections: Optional[Dict[str, List[str]]] = None,
+                 fragment_skills: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
+        """
+        Compute features from the lowercased description.
+
+        extract_many() passes the sections it already segmented and the skills of
+        fragments it ran through one batched ``nlp.pipe`` call.
+        """
+        sections = sections or self._segment_sections(text)
+
+        # Skill extraction is shared by fragments that feed both required and preferred skills
+        if fragment_skills is None:
+            fragment_skills = {}
+            if self.nlp_extractor is not None:
+                # One nlp.pipe call for every skill fragment of the description
+                fragments = list(dict.fromkeys(sections['required_skills'] + sections['preferred_skills']))
+                fragment_skills = dict(zip(fragments, self.nlp_extractor.pipe_skills(fragments, n_process=1)))
+
+        def skills_for(fragments: List[str]) -> List[str]:
+            skills = []
+            for fragment in fragments:
+                if fragment not in fragment_skills:
+                    fragment_skills[fragment] = self.extract_skills_from_text(fragment)
+                skills.extend(fragment_skills[fragment])
+            return list(dict.fromkeys(skills))
+
+        def stripped(fragments: List[str]) -> List[str]:
+            return [fragment.strip() for fragment in fragments]
+
+        return {
+            'complexity_score': self._complexity_score(text),
+            'experience_level': self._experience_level(text),
+            'required_skills': skills_for(sections['required_skills']),
+            'preferred_skills': skills_for(sections['preferred_skills']),
+            'responsibilities': stripped(sections['responsibilities']),
+            'qualifications': stripped(sections['qualifications']),
+            'benefits': stripped(sections['benefits']),
+            'company_culture': {
+                aspect: any(indicator in text for indicator in indicators)
+                for aspect, indicators in CULTURE_INDICATORS.items()
+            }
+        }
+
+    def _segment_sections(self, text: str) -> Dict[str, List[str]]:
+        """
+        Collect the fragment after every section heading in one scan.
+
+        Matches of the same heading do not overlap, mirroring ``re.findall`` per heading.
+        """
+        by_heading: Dict[str, List[str]] = {}
+        last_end: Dict[str, int] = {}
+
+        # Searching again from the next character (not the match end) keeps headings
+        # inside fragments or other headings, e.g. "required: python, experience: 5 years"
+        # yields both sections and "key responsibilities" also counts as "responsibilities"
+        match = self.heading_pattern.search(text)
+        while match:
+            heading = match.group()
+            start = match.start()
+            if start >= last_end.get(heading, 0):
+                fragment = self.fragment_pattern.match(text, match.end())
+                if fragment:
+                    last_end[heading] = fragment.end()
+                    by_heading.setdefault(heading, []).append(fragment.group(1))
+            match = self.heading_pattern.search(text, start + 1)
+
+        return {
+            feature: [fragment for heading in headings for fragment in by_heading.get(heading, [])]
+            for feature, headings in SECTION_HEADINGS.items()
+        }
+
+    @staticmethod
+    def _complexity_score(text: str) -> float:
+        """Score complexity on a 0-10 scale from indicator counts."""
+
+        # str.count per indicator over the shared lowercased text is faster than a combined
+        # overlapping regex for this short word list
+        complexity_score = 0.0
+        complexity_score += sum(text.count(indicator) * 0.1 for indicator in COMPLEXITY_INDICATORS)
+        complexity_score -= sum(text.count(indicator) * 0.05 for indicator in SIMPLICITY_INDICATORS)
+
+        return round(max(0.0, min(10.0, complexity_score + 5.0)), 2)
+
+    @staticmethod
+    def _experience_level(text: str) -> str:
+        """Get the first experience level with an indicator in the text."""
+
+        for level, indicators in EXPERIENCE_LEVELS.items():
+            if any(indicator in text for indicator in indicators):
+                return level
+        return 'unknown'
+
+    @staticmethod
+    def _empty_features() -> Dict[str, Any]:
+        """Features of an empty description."""
+
+        return {
+            'complexity_score': 0.0,
+            'experience_level': 'unknown',
+            'required_skills': [],
+            'preferred_skills': [],
+            'responsibilities': [],
+            'qualifications': [],
+            'benefits': [],
+            'company_culture': {}
+        }
+
+@lru_cache(maxsize=1)
+def get_jd_feature_extractor() -> JDFeatureExtractor:
+    """Get the shared extractor (compiled and memoized once per process)."""
+    return JDFeatureExtractor()
@@ -0,0 +1,156 @@
+"""
+Job filter utilities that compile the job search preferences into a single predicate.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Iterator
+from config import Config
+from utils.salary_normalizer import get_salary_normalizer
+
+# Spellings of each job type, keyed by the canonical name used in JobConfig.JOB_TYPES
+JOB_TYPE_ALIASES = {
+    "full-time": ["full-time", "full time", "fulltime", "permanent"],
+    "part-time": ["part-time", "part time", "parttime"],
+    "contract": ["contract", "contractor", "freelance", "temporary", "temp"],
+    "internship": ["internship", "intern"],
+    "remote": ["remote", "work from home", "wfh"]
+}
+
+# Seniority words in titles, keyed by the canonical level used in JobConfig.EXPERIENCE_LEVELS
+EXPERIENCE_LEVEL_ALIASES = {
+    "entry": ["entry", "entry-level", "entry level", "junior", "jr", "graduate", "new grad", "associate", "intern"],
+    "mid-level": ["mid-level", "mid level", "mid", "intermediate"],
+    "senior": ["senior", "sr", "staff", "principal", "lead"],
+    "executive": ["director", "vp", "vice president", "head of", "chief"]
+}
+
+def _alias_pattern(aliases: Iterable[str]) -> re.Pattern:
+    """Compile one word-bounded alternation, longest alias first."""
+
+    ordered = sorted(set(aliases), key=len, reverse=True)
+    return re.compile(r"\b(?:" + "|".join(re.escape(alias) for alias in ordered) + r")\b", re.IGNORECASE)
+
+def _canonical_lookup(aliases: Dict[str, List[str]]) -> Dict[str, str]:
+    """Map every alias (lowercased) to its canonical name."""
+
+    return {alias.lower(): canonical for canonical, names in aliases.items() for alias in names}
+
+class JobFilter:
+    """
+    Predicate over job dictionaries compiled from the search preferences.
+
+    Rules run in a fixed order and a job is rejected by the first rule it fails.
+    Jobs that do not state a salary, job type or seniority pass the matching rule,
+    so missing data never rejects a job.
+    """
+
+    RULES = ("exclude_keywords", "salary", "job_type", "experience_level")
+
+    def __init__(self, exclude_keywords: Optional[List[str]] = None, min_salary: Optional[int] = None,
+                 max_salary: Optional[int] = None, job_types: Optional[List[str]] = None,
+                 experience_levels: Optional[List[str]] = None):
+        exclude_keywords = Config.JOB_SEARCH_EXCLUDE_KEYWORDS if exclude_keywords is None else exclude_keywords
+        job_types = Config.JOB_TYPE if job_types is None else job_types
+        experience_levels = Config.EXPERIENCE_LEVEL if experience_levels is None else experience_levels
+
+        self.min_salary = Config.MIN_SALARY if min_salary is None else min_salary
+        self.max_salary = Config.MAX_SALARY if max_salary is None else max_salary
+        self.min_salary_confidence = Config.SALARY_MIN_CONFIDENCE
+        self._salary_normalizer = get_salary_normalizer()
+
+        self._exclude_pattern = _alias_pattern(exclude_keywords) if exclude_keywords else None
+
+        self._job_type_lookup = _canonical_lookup(JOB_TYPE_ALIASES)
+        self._job_type_pattern = _alias_pattern(self._job_type_lookup)
+        self.job_types = {self._job_type_lookup.get(t.lower(), t.lower()) for t in job_types or []}
+
+        self._level_lookup = _canonical_lookup(EXPERIENCE_LEVEL_ALIASES)
+        self._level_pattern = _alias_pattern(self._level_lookup)
+        self.experience_levels = {self._level_lookup.get(l.lower(), l.lower()) for l in experience_levels or []}
+
+        self.stats: Dict[str, int] = self._empty_stats()
+
+    def check(self, job: Dict[str, Any]) -> Optional[str]:
+        """
+        Get the first rule a job fails.
+
+        Returns:
+            Rule name, or None when the job passes every rule
+        """
+        title = job.get("title") or ""
+
+        if self._exclude_pattern and self._exclude_pattern.search(title):
+            return "exclude_keywords"
+
+        if self.min_salary or self.max_salary:
+            parsed = self._salary_normalizer.parse_value(job.get("salary"))
+            # Only trust salaries whose currency and period were stated or clearly implied
+            if parsed and parsed["confidence"] >= self.min_salary_confidence:
+                if self.min_salary and parsed["max"] < self.min_salary:
+                    return "salary"
+                if self.max_salary and parsed["min"] > self.max_salary:
+                    return "salary"
+
+        if self.job_types:
+            declared = " ".join(str(job.get(field) or "") for field in ("job_type", "title", "location"))
+            found = {self._job_type_lookup[m.lower()] for m in self._job_type_pattern.findall(declared)}
+            if found and not found & self.job_types:
+                return "job_type"
+
+        if self.experience_levels:
+            declared = f"{job.get('experience_level') or ''} {title}"
+            found = {self._level_lookup[m.lower()] for m in self._level_pattern.findall(declared)}
+            if found and not found & self.experience_levels:
+                return "experience_level"
+
+        return None
+
+    def iter_accepted(self, jobs: Iterable[Dict[str, Any]],
+                      rejection_counts: Optional[Dict[str, int]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the jobs that pass, counting rejections per rule.
+
+        Args:
+            jobs: Jobs to check (any iterable, consumed lazily)
+            rejection_counts: Optional counter updated alongside the running stats
+        """
+        for job in jobs:
+            self.stats["checked"] += 1
+            rule = self.check(job)
+            if rule is None:
+                self.stats["passed"] += 1
+                yield job
+                continue
+
+            self.stats[rule] += 1
+            if rejection_counts is not None:
+                rejection_counts[rule] = rejection_counts.get(rule, 0) + 1
+
+    def apply(self, jobs: Iterable[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        Filter a batch of jobs.
+
+        Returns:
+            Tuple of (passing jobs in input order, rejection count per rule)
+        """
+        rejection_counts = {rule: 0 for rule in self.RULES}
+        accepted = list(self.iter_accepted(jobs, rejection_counts))
+        return accepted, rejection_counts
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get checked, passed and per-rule rejection counts since creation or the last reset."""
+        return dict(self.stats)
+
+    def reset_stats(self) -> None:
+        """Reset the running counters."""
+        self.stats = self._empty_stats()
+
+    def _empty_stats(self) -> Dict[str, int]:
+        """Counters for checked and passed jobs plus one per rule."""
+        return {"checked": 0, "passed": 0, **{rule: 0 for rule in self.RULES}}
+
+@lru_cache(maxsize=1)
+def get_job_filter() -> JobFilter:
+    """Get the filter compiled from the configured preferences."""
+    return JobFilter()
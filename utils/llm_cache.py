@@ -0,0 +1,224 @@
+"""
+LLM cache utilities for reusing parsed model responses across runs.
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, Any, List, Optional
+from config import Config
+
+WHITESPACE_PATTERN = re.compile(r"[ \t]*\n[ \t]*|[ \t]+")
+
+def normalize_prompt(messages: List[Dict[str, str]]) -> str:
+    """
+    Normalize chat messages for cache keys.
+
+    Prompts are built from indented f-strings, so indentation and runs of spaces
+    are collapsed; case and line breaks are kept because the model sees them.
+    """
+    def collapse(match: re.Match) -> str:
+        return "\n" if "\n" in match.group(0) else " "
+
+    return "\n".join(
+        f"{message.get('role', '')}: {WHITESPACE_PATTERN.sub(collapse, (message.get('content') or '').strip())}"
+        for message in messages
+    )
+
+class LLMCache:
+    """
+    Disk-backed store of parsed LLM results with a TTL and LRU size limit.
+
+    Entries are keyed by model, normalized prompt and generation parameters, and
+    remember how long the original call took so hits can report the time saved.
+    """
+
+    # Eviction runs after this many writes instead of on every write
+    EVICTION_INTERVAL = 50
+
+    def __init__(self, cache_path: Optional[str] = None, ttl_hours: Optional[float] = None,
+                 max_entries: Optional[int] = None):
+        self.cache_path = cache_path or Config.LLM_CACHE_PATH
+        self.ttl_seconds = (ttl_hours if ttl_hours is not None else Config.LLM_CACHE_TTL_HOURS) * 3600
+        self.max_entries = max_entries if max_entries is not None else Config.LLM_CACHE_MAX_ENTRIES
+
+        directory = os.path.dirname(self.cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Shared with executor threads, so access is serialized with a lock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.cache_path, timeout=30, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                result TEXT NOT NULL,
+                latency REAL NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._connection.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_access ON llm_cache(last_access)")
+        self._connection.commit()
+
+        self._writes = 0
+        self.stats: Dict[str, float] = {"hits": 0, "misses": 0, "bypassed": 0, "seconds_saved": 0.0}
+
+    def get(self, model: str, messages: List[Dict[str, str]], params: Dict[str, Any]) -> Optional[Any]:
+        """
+        Look up a cached result.
+
+        Args:
+            model: Model name the request is sent to
+            messages: Chat messages of the request
+            params: Generation parameters that change the output (temperature, max_tokens, ...)
+
+        Returns:
+            The cached parsed result, or None on a miss or an expired entry
+        """
+        key = self.key(model, messages, params)
+        now = time.time()
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT result, latency, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row and self.ttl_seconds and now - row[2] > self.ttl_seconds:
+                self._connection.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._connection.commit()
+                row = None
+
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+
+            self._connection.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+            self._connection.commit()
+
+        self.stats["hits"] += 1
+        self.stats["seconds_saved"] += row[1]
+        return json.loads(row[0])
+
+    def put(self, model: str, messages: List[Dict[str, str]], params: Dict[str, Any],
+            result: Any, latency: float) -> None:
+        """
+        Store a parsed result.
+
+        Args:
+            latency: Seconds the uncached call took, credited to every later hit
+        """
+        now = time.time()
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, model, result, latency, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self.key(model, messages, params), model, json.dumps(result), latency, now, now)
+            )
+            self._connection.commit()
+
+            self._writes += 1
+            if self._writes >= self.EVICTION_INTERVAL:
+                self._writes = 0
+                self._evict()
+
+    def record_bypass(self) -> None:
+        """Count a call that opted out of the cache."""
+
+        self.stats["bypassed"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get this run's cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, bypassed, lookups, hit_rate (percent)
+            and seconds_saved
+        """
+        hits = int(self.stats["hits"])
+        misses = int(self.stats["misses"])
+        lookups = hits + misses
+
+        return {
+            "hits": hits,
+            "misses": misses,
+            "bypassed": int(self.stats["bypassed"]),
+            "lookups": lookups,
+            "hit_rate": round(hits / lookups * 100, 1) if lookups else 0.0,
+            "seconds_saved": round(self.stats["seconds_saved"], 2)
+        }
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+
+        with self._lock:
+            self._connection.execute("DELETE FROM llm_cache")
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+
+        with self._lock:
+            self._connection.close()
+
+    def count(self) -> int:
+        """Get the number of cached results."""
+
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    def _evict(self) -> None:
+        """Delete expired entries, then the least recently used ones above the size limit (caller holds the lock)."""
+
+        if self.ttl_seconds:
+            self._connection.execute("DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+
+        if self.max_entries:
+            count = self._connection.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            excess = count - self.max_entries
+            if excess > 0:
+                self._connection.execute(
+                    "DELETE FROM llm_cache WHERE key IN "
+                    "(SELECT key FROM llm_cache ORDER BY last_access LIMIT ?)",
+                    (excess,)
+                )
+        self._connection.commit()
+
+    @staticmethod
+    def key(model: str, messages: List[Dict[str, str]], params: Dict[str, Any]) -> str:
+        """Content address of a request."""
+
+        payload = "\0".join([model, normalize_prompt(messages), json.dumps(params, sort_keys=True, default=str)])
+        return hashlib.blake2b(payload.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+_llm_cache: Optional[LLMCache] = None
+_llm_cache_pid: Optional[int] = None
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """
+    Get the process-wide LLM cache, or None when it is disabled or cannot be opened.
+
+    Forked worker processes open their own connection instead of reusing the parent's.
+    """
+    global _llm_cache, _llm_cache_pid
+
+    if not Config.LLM_CACHE_ENABLED:
+        return None
+
+    if _llm_cache is None or _llm_cache_pid != os.getpid():
+        try:
+            _llm_cache = LLMCache()
+            _llm_cache_pid = os.getpid()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not open LLM cache: {e}")
+            return None
+
+    return _llm_cache
@@ -0,0 +1,410 @@
+"""
+LLM scheduling utilities for running OpenAI requests concurrently within rate and spend budgets.
+"""
+
+import time
+import random
+import asyncio
+import contextlib
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator, Iterator
+import openai
+from config import Config
+
+# USD per 1K tokens as (prompt, completion); unknown models are priced like gpt-4
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-4": (0.03, 0.06),
+    "gpt-4-turbo": (0.01, 0.03),
+    "gpt-4o": (0.0025, 0.01),
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-3.5-turbo": (0.0005, 0.0015)
+}
+
+# Chat formatting overhead of the OpenAI message format
+TOKENS_PER_MESSAGE = 4
+TOKENS_PER_REPLY = 3
+
+# Usage accumulator of the current asyncio task, set by track_usage()
+_usage_scope: ContextVar[Optional[Dict[str, Any]]] = ContextVar("llm_usage_scope", default=None)
+
+class LLMBudgetExceeded(RuntimeError):
+    """Raised instead of sending a request that would exceed the run's token or cost ceiling."""
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """Get the tiktoken encoding for a model, or None when tiktoken is not installed."""
+
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Encodings are downloaded on first use; offline runs fall back to the estimate
+        return None
+
+def count_tokens(text: str, model: str = "gpt-4") -> int:
+    """Count the tokens of a text (about four characters per token without tiktoken)."""
+
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return (len(text) + 3) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+def truncate_tokens(text: str, max_tokens: int, model: str = "gpt-4") -> str:
+    """Cut a text to at most max_tokens tokens."""
+
+    if max_tokens <= 0:
+        return ""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return text[:max_tokens * 4]
+    tokens = encoding.encode(text, disallowed_special=())
+    return text if len(tokens) <= max_tokens else encoding.decode(tokens[:max_tokens])
+
+def estimate_prompt_tokens(messages: List[Dict[str, str]], model: str = "gpt-4") -> int:
+    """Estimate the prompt tokens of a chat request, including message formatting."""
+
+    return TOKENS_PER_REPLY + sum(
+        TOKENS_PER_MESSAGE + count_tokens(message.get("content") or "", model) for message in messages
+    )
+
+@contextlib.contextmanager
+def track_usage() -> Iterator[Dict[str, Any]]:
+    """
+    Collect the requests, tokens and cost of the LLM calls made inside the block.
+
+    Scopes follow the asyncio task, so concurrent callers each see only their own calls.
+    """
+    usage = {"requests": 0, "prompt_tokens": 0, "completion_tokens": 0, "cost": 0.0}
+    token = _usage_scope.set(usage)
+    try:
+        yield usage
+    finally:
+        _usage_scope.reset(token)
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Get the USD cost of a request."""
+
+    prompt_price, completion_price = MODEL_PRICES.get(model, MODEL_PRICES["gpt-4"])
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1000
+
+class _RateBucket:
+    """Token bucket refilled continuously up to a per-minute capacity."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.available = float(per_minute)
+        self.updated = time.monotonic()
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount is available (0 when it is available now)."""
+
+        if not self.capacity:
+            return 0.0
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.capacity / 60)
+        self.updated = now
+        # Requests larger than the whole bucket wait for a full bucket instead of forever
+        missing = min(amount, self.capacity) - self.available
+        return max(0.0, missing * 60 / self.capacity)
+
+    def take(self, amount: float) -> None:
+        """Consume amount (may go negative for oversized requests)."""
+
+        if self.capacity:
+            self.available -= amount
+
+    def drain(self) -> None:
+        """Empty the bucket so every waiter waits for it to refill."""
+
+        if self.capacity:
+            self.available = min(self.available, 0.0)
+            self.updated = time.monotonic()
+
+    def give_back(self, amount: float) -> None:
+        """Return an over-reservation."""
+
+        if self.capacity:
+            self.available = min(self.capacity, self.available + amount)
+
+class LLMScheduler:
+    """
+    Shared gate in front of chat completion calls.
+
+    Requests run concurrently up to max_concurrency, wait for requests-per-minute
+    and tokens-per-minute budget before they are sent, and are retried on 429 and
+    5xx responses with backoff that honours retry-after. Prompt tokens are
+    estimated up front so a request that would push the run over its token or
+    cost ceiling is refused instead of sent.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None, requests_per_minute: Optional[int] = None,
+                 tokens_per_minute: Optional[int] = None, max_retries: Optional[int] = None,
+                 run_token_limit: Optional[int] = None, run_cost_limit: Optional[float] = None):
+        self.max_concurrency = max_concurrency or Config.LLM_MAX_CONCURRENCY
+        self.requests_per_minute = Config.LLM_REQUESTS_PER_MINUTE if requests_per_minute is None else requests_per_minute
+        self.tokens_per_minute = Config.LLM_TOKENS_PER_MINUTE if tokens_per_minute is None else tokens_per_minute
+        self.max_retries = Config.LLM_MAX_RETRIES if max_retries is None else max_retries
+        self.run_token_limit = Config.LLM_RUN_TOKEN_LIMIT if run_token_limit is None else run_token_limit
+        self.run_cost_limit = Config.LLM_RUN_COST_LIMIT if run_cost_limit is None else run_cost_limit
+
+        self._requests = _RateBucket(self.requests_per_minute)
+        self._tokens = _RateBucket(self.tokens_per_minute)
+
+        # asyncio primitives belong to one event loop, so they are created per loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._budget_lock: Optional[asyncio.Lock] = None
+
+        # Worst case of requests in flight, counted against the run ceilings
+        self._pending_tokens = 0
+        self._pending_cost = 0.0
+
+        # After a 429, no request is sent before the server's retry-after has passed
+        self._paused_until = 0.0
+
+        self.stats: Dict[str, Any] = self._empty_stats()
+
+    async def complete(self, client: openai.AsyncOpenAI, model: str, messages: List[Dict[str, str]], **params) -> Any:
+        """
+        Send a chat completion through the scheduler.
+
+        Args:
+            client: OpenAI client of the caller (its own retries are disabled here)
+            model: Model name
+            messages: Chat messages
+            **params: Other create() arguments (max_tokens, temperature, ...)
+
+        Returns:
+            The chat completion response
+
+        Raises:
+            LLMBudgetExceeded: The request would exceed the run's token or cost ceiling
+        """
+        self._bind_loop()
+        prompt_tokens, reserved, worst_cost = self._reserve(model, messages, params)
+        try:
+            async with self._semaphore:
+                start_time = time.perf_counter()
+                response = await self._create(client.with_options(max_retries=0), model, messages, params, reserved)
+                usage = getattr(response, "usage", None)
+                self._account(model, reserved, prompt_tokens, getattr(usage, "prompt_tokens", None),
+                              getattr(usage, "completion_tokens", None) or 0, time.perf_counter() - start_time)
+                return response
+        finally:
+            self._release(reserved, worst_cost)
+
+    async def stream(self, client: openai.AsyncOpenAI, model: str, messages: List[Dict[str, str]],
+                     **params) -> AsyncIterator[str]:
+        """
+        Stream the content of a chat completion through the scheduler.
+
+        Rate limits, retries and ceilings apply as in complete(); retries only
+        happen before the first chunk. The server reports token usage in the last
+        chunk; closing the generator early (aclose()) cancels the generation, and
+        the tokens received so far are counted as estimated usage.
+
+        Yields:
+            Content deltas as they arrive
+        """
+        self._bind_loop()
+        prompt_tokens, reserved, worst_cost = self._reserve(model, messages, params)
+        try:
+            async with self._semaphore:
+                start_time = time.perf_counter()
+                response = await self._create(
+                    client.with_options(max_retries=0), model, messages,
+                    {**params, "stream": True, "stream_options": {"include_usage": True}}, reserved
+                )
+                parts: List[str] = []
+                usage = None
+                try:
+                    async for chunk in response:
+                        usage = getattr(chunk, "usage", None) or usage
+                        delta = chunk.choices[0].delta.content if chunk.choices else None
+                        if delta:
+                            parts.append(delta)
+                            yield delta
+                finally:
+                    await response.close()
+                    # A cancelled stream has no usage chunk, so the received text is counted
+                    completion_tokens = getattr(usage, "completion_tokens", None) or count_tokens("".join(parts), model)
+                    self._account(model, reserved, prompt_tokens, getattr(usage, "prompt_tokens", None),
+                                  completion_tokens, time.perf_counter() - start_time)
+        finally:
+            self._release(reserved, worst_cost)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get this run's request, retry, token and cost totals.
+
+        Returns:
+            Dictionary with requests, retries, rate_limited, failures, refused,
+            prompt_tokens, completion_tokens, estimated_prompt_tokens, estimated_usage
+            (requests whose tokens were estimated, not reported), cost (USD) and api_seconds
+        """
+        return {**self.stats, "cost": round(self.stats["cost"], 4), "api_seconds": round(self.stats["api_seconds"], 2)}
+
+    def reset_stats(self) -> None:
+        """Start a new run (clears the totals the ceilings are checked against)."""
+
+        self.stats = self._empty_stats()
+
+    def _reserve(self, model: str, messages: List[Dict[str, str]], params: Dict[str, Any]) -> Tuple[int, int, float]:
+        """
+        Estimate a request and hold its worst case against the run ceilings.
+
+        Returns:
+            Tuple of (estimated prompt tokens, reserved tokens, worst-case cost)
+        """
+        prompt_tokens = estimate_prompt_tokens(messages, model)
+        max_completion = params.get("max_tokens") or 0
+        worst_cost = self._check_run_budget(model, prompt_tokens, max_completion)
+
+        reserved = prompt_tokens + max_completion
+        self._pending_tokens += reserved
+        self._pending_cost += worst_cost
+        return prompt_tokens, reserved, worst_cost
+
+    def _release(self, reserved: int, worst_cost: float) -> None:
+        """Drop a finished request's hold on the run ceilings."""
+
+        self._pending_tokens -= reserved
+        self._pending_cost -= worst_cost
+
+    async def _create(self, client: openai.AsyncOpenAI, model: str, messages: List[Dict[str, str]],
+                      params: Dict[str, Any], reserved: int) -> Any:
+        """Send a request once budget is free, retrying 429s and 5xx (caller holds a slot)."""
+
+        for attempt in range(self.max_retries + 1):
+            await self._acquire(reserved)
+            self.stats["requests"] += 1
+            try:
+                return await client.chat.completions.create(model=model, messages=messages, **params)
+            except (openai.RateLimitError, openai.InternalServerError,
+                    openai.APIConnectionError, openai.APITimeoutError) as e:
+                if attempt == self.max_retries:
+                    self.stats["failures"] += 1
+                    raise
+                self.stats["retries"] += 1
+                if isinstance(e, openai.RateLimitError):
+                    self.stats["rate_limited"] += 1
+                    # The server is over its limit for everyone: slow down the other waiters too
+                    self._requests.drain()
+                    self._paused_until = max(self._paused_until, time.monotonic() + (self._retry_after(e) or 0.0))
+                await asyncio.sleep(self._backoff(e, attempt))
+
+    def _bind_loop(self) -> None:
+        """Create the semaphore and lock for the running event loop."""
+
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._budget_lock = asyncio.Lock()
+
+    def _check_run_budget(self, model: str, prompt_tokens: int, max_completion: int) -> float:
+        """
+        Refuse a request whose worst case would cross the per-run ceilings.
+
+        Returns:
+            The request's worst-case cost
+        """
+        committed_tokens = self.stats["prompt_tokens"] + self.stats["completion_tokens"] + self._pending_tokens
+        if self.run_token_limit and committed_tokens + prompt_tokens + max_completion > self.run_token_limit:
+            self.stats["refused"] += 1
+            raise LLMBudgetExceeded(
+                f"LLM token ceiling reached: {committed_tokens} used or in flight, request needs up to "
+                f"{prompt_tokens + max_completion}, limit {self.run_token_limit}"
+            )
+
+        worst_cost = estimate_cost(model, prompt_tokens, max_completion)
+        committed_cost = self.stats["cost"] + self._pending_cost
+        if self.run_cost_limit and committed_cost + worst_cost > self.run_cost_limit:
+            self.stats["refused"] += 1
+            raise LLMBudgetExceeded(
+                f"LLM cost ceiling reached: ${committed_cost:.4f} spent or in flight, request costs up to "
+                f"${worst_cost:.4f}, limit ${self.run_cost_limit:.2f}"
+            )
+        return worst_cost
+
+    async def _acquire(self, tokens: int) -> None:
+        """Wait until one request and its tokens fit in the per-minute budgets."""
+
+        async with self._budget_lock:
+            while True:
+                wait = max(self._requests.wait_time(1), self._tokens.wait_time(tokens),
+                           self._paused_until - time.monotonic())
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            self._requests.take(1)
+            self._tokens.take(tokens)
+
+    def _backoff(self, error: Exception, attempt: int) -> float:
+        """
+        Seconds to wait before a retry: the server's retry-after plus jitter if given, else
+        jittered exponential.
+
+        Without jitter every request rate limited together would wake at the same moment
+        and all but one would be rejected again.
+        """
+        retry_after = self._retry_after(error)
+        if retry_after is not None:
+            return retry_after + random.random() * min(30.0, max(retry_after, 1.0) * 2 ** attempt / 2)
+        return min(30.0, 0.5 * 2 ** attempt) * (0.5 + random.random() / 2)
+
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """The server's retry-after (or retry-after-ms) in seconds, when the response has one."""
+
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+            try:
+                return float(headers[header]) * scale
+            except (KeyError, TypeError, ValueError):
+                continue
+        return None
+
+    def _account(self, model: str, reserved: int, estimated: int, prompt_tokens: Optional[int],
+                 completion_tokens: int, elapsed: float) -> None:
+        """Add a request's usage to the totals and return unused reserved tokens to the budget."""
+
+        if prompt_tokens is None:
+            # No usage from the server (a stream closed before its last chunk)
+            self.stats["estimated_usage"] += 1
+            prompt_tokens = estimated
+        cost = estimate_cost(model, prompt_tokens, completion_tokens)
+        self._tokens.give_back(reserved - prompt_tokens - completion_tokens)
+        self.stats["prompt_tokens"] += prompt_tokens
+        self.stats["completion_tokens"] += completion_tokens
+        self.stats["estimated_prompt_tokens"] += estimated
+        self.stats["cost"] += cost
+        self.stats["api_seconds"] += elapsed
+
+        scope = _usage_scope.get()
+        if scope is not None:
+            scope["requests"] += 1
+            scope["prompt_tokens"] += prompt_tokens
+            scope["completion_tokens"] += completion_tokens
+            scope["cost"] += cost
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        """Zeroed run totals."""
+        return {
+            "requests": 0, "retries": 0, "rate_limited": 0, "failures": 0, "refused": 0,
+            "prompt_tokens": 0, "completion_tokens": 0, "estimated_prompt_tokens": 0,
+            "estimated_usage": 0, "cost": 0.0, "api_seconds": 0.0
+        }
+
+@lru_cache(maxsize=1)
+def get_llm_scheduler() -> LLMScheduler:
+    """Get the scheduler shared by every LLM caller (budgets are process-wide)."""
+    return LLMScheduler()
@@ -0,0 +1,255 @@
+"""
+Location utilities for mapping free-text job locations to canonical places.
+"""
+
+import os
+import re
+import mmap
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+from config import Config
+
+DEFAULT_GAZETTEER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gazetteer.tsv")
+
+# Work arrangement markers, checked in this order
+WORK_MODE_PATTERNS = [
+    ("hybrid", re.compile(r"\bhybrid\b", re.IGNORECASE)),
+    ("remote", re.compile(r"\b(?:remote|work from home|wfh|anywhere|distributed|telecommute)\b", re.IGNORECASE)),
+    ("onsite", re.compile(r"\b(?:on-?site|in[- ]office|in person)\b", re.IGNORECASE))
+]
+
+# Words removed before gazetteer lookup ("Greater Seattle Area", "Remote in US")
+# Two-letter codes like "in" and "or" are only dropped right after a work mode, as they are also states
+NOISE_WORDS = re.compile(
+    r"\b(?:(?:hybrid|remote|work from home|wfh|anywhere|distributed|telecommute|on-?site|in[- ]office|in person)"
+    r"(?:\s+(?:in|within|from))?|greater|metropolitan|metro|area|region|based|only|office)\b",
+    re.IGNORECASE
+)
+PART_SEPARATORS = re.compile(r"\s*[,;/|()\[\]•·]\s*|\s+[-–—]\s+")
+
+class Gazetteer:
+    """
+    Offline place table read through a memory map.
+
+    Only the alias index is kept in Python objects; rows are parsed from the
+    mapped file when a lookup needs them.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or Config.GAZETTEER_PATH or DEFAULT_GAZETTEER_PATH
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._aliases: Dict[str, List[int]] = {}  # alias -> row offsets, in file order
+        self._ids: Dict[str, int] = {}  # place id -> row offset
+        self.max_alias_words = 1
+        self._build_index()
+
+        self.record = lru_cache(maxsize=1024)(self._record)
+
+    def lookup(self, alias: str) -> List[Dict[str, str]]:
+        """Get every place an alias can refer to (e.g. "cambridge" in the US and the UK)."""
+
+        return [self.record(offset) for offset in self._aliases.get(alias, [])]
+
+    def get(self, place_id: str) -> Optional[Dict[str, str]]:
+        """Get a place by id."""
+
+        offset = self._ids.get(place_id)
+        return self.record(offset) if offset is not None else None
+
+    def close(self) -> None:
+        """Release the memory map."""
+
+        self._map.close()
+        self._file.close()
+
+    def _build_index(self) -> None:
+        """Scan the mapped file once for ids and aliases."""
+
+        offset = 0
+        size = len(self._map)
+        while offset < size:
+            end = self._map.find(b"\n", offset)
+            end = size if end == -1 else end
+            line = self._map[offset:end].decode("utf-8").rstrip("\r")
+
+            if line and not line.startswith("#"):
+                fields = line.split("\t")
+                self._ids[fields[0]] = offset
+                for alias in fields[4].split("|") if len(fields) > 4 else []:
+                    if alias:
+                        self._aliases.setdefault(alias, []).append(offset)
+                        self.max_alias_words = max(self.max_alias_words, len(alias.split()))
+
+            offset = end + 1
+
+    def _record(self, offset: int) -> Dict[str, str]:
+        """Parse the row starting at a byte offset."""
+
+        end = self._map.find(b"\n", offset)
+        fields = self._map[offset:end if end != -1 else len(self._map)].decode("utf-8").rstrip("\r").split("\t")
+        return {"id": fields[0], "city": fields[1], "region": fields[2], "country": fields[3]}
+
+class LocationNormalizer:
+    """
+    Maps location strings to a canonical place and a remote/hybrid/onsite flag.
+
+    "Remote - US" and "United States (Remote)" both become the United States with
+    work_mode "remote"; "NYC" and "New York, NY" both become New York City.
+    """
+
+    def __init__(self, gazetteer: Optional[Gazetteer] = None, cache_size: Optional[int] = None):
+        self.gazetteer = gazetteer or get_gazetteer()
+        self.normalize = lru_cache(maxsize=cache_size or Config.LOCATION_CACHE_SIZE)(self._normalize)
+
+    def _normalize(self, text: str) -> Dict[str, Any]:
+        """
+        Normalize one location string.
+
+        Returns:
+            Dictionary with id (None when no place is recognized), city, region,
+            country and work_mode ("remote", "hybrid", "onsite" or "unknown")
+        """
+        text = (text or "").strip()
+        work_mode = "unknown"
+        for mode, pattern in WORK_MODE_PATTERNS:
+            if pattern.search(text):
+                work_mode = mode
+                break
+
+        place = self._resolve(self._candidates(text))
+        if place is None:
+            return {
+                "id": "remote" if work_mode == "remote" else None,
+                "city": "", "region": "", "country": "",
+                "work_mode": work_mode
+            }
+
+        return {**place, "work_mode": "onsite" if work_mode == "unknown" else work_mode}
+
+    def annotate(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Add location_id, location_country and work_mode to a job dictionary."""
+
+        location = self.normalize(job.get("location") or "")
+        job["location_id"] = location["id"]
+        job["location_country"] = location["country"] or None
+        job["work_mode"] = location["work_mode"]
+        return location
+
+    def match(self, job_location: str, target_location: str) -> float:
+        """
+        Score how well a job location satisfies a target location.
+
+        Returns:
+            1.0 for the same place (or remote for a remote target), 0.5 for a remote
+            job or the same region, 0.3 for the same country, otherwise 0.0
+        """
+        if not target_location:
+            return 1.0
+
+        job = self.normalize(job_location or "")
+        target = self.normalize(target_location)
+
+        # Unrecognized places fall back to plain text containment
+        if target["id"] is None or (job["id"] is None and job["work_mode"] != "remote"):
+            return 1.0 if target_location.lower() in (job_location or "").lower() else 0.0
+
+        same_country = not target["country"] or not job["country"] or target["country"] == job["country"]
+
+        if target["work_mode"] == "remote":
+            return 1.0 if job["work_mode"] == "remote" and same_country else 0.0
+
+        if job["id"] == target["id"]:
+            return 1.0
+        # A region or country target is met by any place inside it
+        if (not target["city"] and job["country"] == target["country"]
+                and (not target["region"] or job["region"] == target["region"])):
+            return 1.0
+
+        if job["work_mode"] == "remote" and same_country:
+            return 0.5
+        if target["region"] and job["region"] == target["region"] and job["country"] == target["country"]:
+            return 0.5
+        if target["country"] and job["country"] == target["country"]:
+            return 0.3
+        return 0.0
+
+    def _candidates(self, text: str) -> List[List[Dict[str, str]]]:
+        """Look up every comma/paren/dash separated part of a location, one candidate list per part."""
+
+        candidates = []
+        for part in PART_SEPARATORS.split(text.lower()):
+            part = " ".join(NOISE_WORDS.sub(" ", part).split())
+            if not part:
+                continue
+
+            places = self.gazetteer.lookup(part)
+            if not places:
+                places = self._lookup_ngrams(part)
+            if places:
+                candidates.append(places)
+        return candidates
+
+    def _lookup_ngrams(self, part: str) -> List[Dict[str, str]]:
+        """Find the longest multi-letter alias inside a part ("downtown seattle" -> seattle)."""
+
+        words = part.split()
+        for size in range(min(len(words), self.gazetteer.max_alias_words), 0, -1):
+            for start in range(len(words) - size + 1):
+                alias = " ".join(words[start:start + size])
+                # Two-letter codes ("in", "or", "me") only count as a whole part
+                if len(alias) > 2:
+                    places = self.gazetteer.lookup(alias)
+                    if places:
+                        return places
+        return []
+
+    @staticmethod
+    def _resolve(candidates: List[List[Dict[str, str]]]) -> Optional[Dict[str, str]]:
+        """
+        Pick the most specific place consistent with the other parts.
+
+        A city supported by a matching region or country in another part wins over
+        an unsupported one ("Portland, OR" over Portland alone); ties keep file order.
+        A place conflicts with a part that only names other countries, or other
+        regions of its own country ("Portland, ME" is not Portland, Oregon).
+        """
+        if not candidates:
+            return None
+
+        def ids(part_index: int) -> set:
+            return {place["id"] for index, places in enumerate(candidates) if index != part_index for place in places}
+
+        def consistent(place: Dict[str, str], other: Dict[str, str]) -> bool:
+            if other["country"] != place["country"]:
+                return False
+            # A region named on its own constrains the place; a city elsewhere does not
+            return bool(other["city"]) or not (other["region"] and place["region"]) or other["region"] == place["region"]
+
+        best: Optional[Tuple[Tuple[int, int, int], Dict[str, str]]] = None
+        for part_index, places in enumerate(candidates):
+            others = ids(part_index)
+            for place in places:
+                specificity = 2 if place["city"] else 1 if place["region"] else 0
+                region_id = f"{place['country']}-{place['region']}" if place["region"] else None
+                support = (region_id in others) + (place["country"] in others)
+                conflicts = any(
+                    not any(consistent(place, other) for other in other_places)
+                    for index, other_places in enumerate(candidates) if index != part_index
+                )
+                key = (0 if conflicts else 1, support, specificity)
+                if best is None or key > best[0]:
+                    best = (key, place)
+
+        return best[1]
+
+@lru_cache(maxsize=1)
+def get_gazetteer() -> Gazetteer:
+    """Get the shared gazetteer (mapped once per process)."""
+    return Gazetteer()
+
+@lru_cache(maxsize=1)
+def get_location_normalizer() -> LocationNormalizer:
+    """Get the shared normalizer (its cache is shared by every caller)."""
+    return LocationNormalizer()
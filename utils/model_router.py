@@ -0,0 +1,186 @@
+"""
+Model routing utilities for choosing how much LLM each resume optimization needs.
+"""
+
+import time
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Callable
+import openai
+from config import Config
+from utils.llm_scheduler import track_usage
+from utils.structured_output import StructuredOutput, StructuredOutputError, get_optimization_output
+
+# Tiers from cheapest to most capable; "skip" uses the deterministic content only
+TIERS = ("skip", "fast", "strong")
+
+class ModelRouter:
+    """
+    Routing policy for resume optimization requests.
+
+    A request is routed from its skill gap, the job's match score and its
+    priority: small gaps and poor matches (unless the job is high priority) skip
+    the LLM, most requests go to the fast model, and large gaps or high-priority
+    jobs go to the strong model.
+    Fast-tier output with low confidence is escalated to the strong tier.
+    """
+
+    def __init__(self, output: Optional[StructuredOutput] = None, enabled: Optional[bool] = None):
+        self.output = output or get_optimization_output()
+        self.enabled = Config.LLM_ROUTING_ENABLED if enabled is None else enabled
+        self.models = {"fast": Config.LLM_FAST_MODEL, "strong": Config.LLM_STRONG_MODEL}
+        self.max_tokens = {"fast": Config.LLM_FAST_MAX_TOKENS, "strong": Config.LLM_STRONG_MAX_TOKENS}
+        self.stats: Dict[str, Dict[str, Any]] = {tier: self._empty_tier() for tier in TIERS}
+
+    def route(self, skill_gaps: Dict[str, Any], match_score: Optional[float] = None,
+              priority: str = "normal") -> Dict[str, Any]:
+        """
+        Pick the tier for one request.
+
+        Args:
+            skill_gaps: Result of the skill gap analysis (missing_skills, coverage_percentage, ...)
+            match_score: Resume-to-job relevance (0-100), when the job was ranked
+            priority: Job priority ("high", "normal" or "low")
+
+        Returns:
+            Dictionary with tier, model (None for "skip"), max_tokens and reason
+        """
+        if not self.enabled:
+            return self._decision("strong", "routing disabled")
+
+        missing = skill_gaps.get("missing_skills", [])
+        high_missing = [skill for skill in missing if skill.get("priority") == "high"]
+        coverage = skill_gaps.get("coverage_percentage", 0)
+
+        if priority == "high":
+            return self._decision("strong", "high-priority job")
+        if not skill_gaps.get("total_required"):
+            return self._decision("skip", "no requirements extracted")
+        if len(missing) <= Config.LLM_SKIP_MAX_MISSING and coverage >= Config.LLM_SKIP_MIN_COVERAGE:
+            return self._decision("skip", f"{len(missing)} missing skills, {coverage:.0f}% coverage")
+        if match_score is not None and match_score < Config.LLM_SKIP_BELOW_MATCH:
+            return self._decision("skip", f"match score {match_score:.0f}")
+        if len(missing) >= Config.LLM_STRONG_MIN_MISSING or len(high_missing) >= Config.LLM_STRONG_MIN_HIGH_MISSING:
+            return self._decision("strong", f"{len(missing)} missing skills ({len(high_missing)} high priority)")
+        return self._decision("fast", f"{len(missing)} missing skills")
+
+    async def generate(self, client: openai.AsyncOpenAI, messages: List[Dict[str, str]], decision: Dict[str, Any],
+                       skill_gaps: Dict[str, Any], on_field: Optional[Callable[[str, Any], None]] = None,
+                       **params) -> Dict[str, Any]:
+        """
+        Run a routed request, escalating low-confidence fast-tier output.
+
+        Args:
+            client: OpenAI client of the caller
+            messages: Chat messages
+            decision: Result of route() (not "skip")
+            skill_gaps: Skill gap analysis used to judge the output
+            on_field: Called with each valid top-level field as it streams in (again
+                for the strong tier's fields after an escalation)
+            **params: Other create() arguments except max_tokens (temperature, ...)
+
+        Returns:
+            Schema-valid optimization content, with model_tier, model and
+            confidence added
+
+        Raises:
+            StructuredOutputError: The last tier tried still returned invalid output, or
+                the generation was cancelled at its timeout (never escalated)
+        """
+        tier = decision["tier"]
+        while True:
+            start_time = time.perf_counter()
+            result = None
+            with track_usage() as usage:
+                try:
+                    result = await self.output.generate(client, self.models[tier], messages, on_field=on_field,
+                                                        max_tokens=self.max_tokens[tier], **params)
+                except StructuredOutputError as error:
+                    if tier == "strong" or error.cancelled:
+                        self._record(tier, time.perf_counter() - start_time, usage)
+                        raise
+            self._record(tier, time.perf_counter() - start_time, usage)
+
+            confidence = self.confidence(result, skill_gaps) if result is not None else 0.0
+            if tier == "fast" and confidence < Config.LLM_ESCALATE_BELOW_CONFIDENCE:
+                self.stats["fast"]["escalated"] += 1
+                tier = "strong"
+                continue
+
+            return {**result, "model_tier": tier, "model": self.models[tier], "confidence": round(confidence, 2)}
+
+    def record_skip(self) -> None:
+        """Count a request served by the deterministic path."""
+
+        self.stats["skip"]["requests"] += 1
+
+    @staticmethod
+    def confidence(result: Dict[str, Any], skill_gaps: Dict[str, Any]) -> float:
+        """
+        Score how well optimization output covers what the gap analysis asked for.
+
+        Averages three checks: a substantive summary, enhanced experience entries,
+        and the share of high-priority missing skills that appear in the output.
+        """
+        summary_ok = len((result.get("optimized_summary") or "").split()) >= 15
+        experience_ok = bool(result.get("enhanced_experience"))
+
+        wanted = [skill["skill"].lower() for skill in skill_gaps.get("missing_skills", []) if skill.get("priority") == "high"]
+        if wanted:
+            text = " ".join([
+                result.get("optimized_summary") or "",
+                " ".join(result.get("keywords_added") or []),
+                " ".join(result.get("skills_section", {}).get("technical_skills") or []),
+                " ".join(entry.get("description", "") for entry in result.get("enhanced_experience") or [])
+            ]).lower()
+            coverage = sum(1 for skill in wanted if skill in text) / len(wanted)
+        else:
+            coverage = 1.0
+
+        return (summary_ok + experience_ok + coverage) / 3
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get this run's requests, latency and cost per tier.
+
+        Returns:
+            Dictionary keyed by tier with requests, escalated, seconds,
+            avg_seconds, tokens and cost (USD)
+        """
+        return {
+            tier: {
+                **stats,
+                "seconds": round(stats["seconds"], 2),
+                "avg_seconds": round(stats["seconds"] / stats["requests"], 2) if stats["requests"] else 0.0,
+                "cost": round(stats["cost"], 4)
+            }
+            for tier, stats in self.stats.items()
+        }
+
+    def _decision(self, tier: str, reason: str) -> Dict[str, Any]:
+        """Build a routing decision."""
+
+        return {
+            "tier": tier,
+            "model": self.models.get(tier),
+            "max_tokens": self.max_tokens.get(tier, 0),
+            "reason": reason
+        }
+
+    def _record(self, tier: str, elapsed: float, usage: Dict[str, Any]) -> None:
+        """Add one tier attempt to the counters."""
+
+        stats = self.stats[tier]
+        stats["requests"] += 1
+        stats["seconds"] += elapsed
+        stats["tokens"] += usage["prompt_tokens"] + usage["completion_tokens"]
+        stats["cost"] += usage["cost"]
+
+    @staticmethod
+    def _empty_tier() -> Dict[str, Any]:
+        """Zeroed counters of one tier."""
+        return {"requests": 0, "escalated": 0, "seconds": 0.0, "tokens": 0, "cost": 0.0}
+
+@lru_cache(maxsize=1)
+def get_model_router() -> ModelRouter:
+    """Get the router configured from the routing settings."""
+    return ModelRouter()
@@ -0,0 +1,143 @@
+"""
+NLP extraction utilities that use a batched spaCy pipeline for skill extraction.
+"""
+
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Iterable
+from config import Config
+from utils.skill_matcher import SKILL_TAXONOMY
+
+# Components never needed for skill extraction (POS tags are enough to find noun phrases)
+DISABLED_COMPONENTS = ["parser", "ner", "lemmatizer", "textcat", "senter"]
+
+# Token tags that make up candidate custom skill phrases ("data pipelines", "Snowflake")
+PHRASE_POS = {"NOUN", "PROPN"}
+
+class NLPSkillExtractor:
+    """
+    Extracts taxonomy skills with a spaCy PhraseMatcher and short noun phrases as custom skills.
+
+    The model is loaded once, on first use. When it is not installed a blank English
+    tokenizer is used, so taxonomy matching still works but no custom phrases are found.
+    """
+
+    def __init__(self, model: Optional[str] = None, batch_size: Optional[int] = None,
+                 n_process: Optional[int] = None, taxonomy: Optional[Dict[str, List[str]]] = None):
+        self.model = model or Config.SPACY_MODEL
+        self.batch_size = batch_size or Config.SPACY_BATCH_SIZE
+        self.n_process = n_process or Config.SPACY_N_PROCESS
+        self.taxonomy = taxonomy or SKILL_TAXONOMY
+
+        self._nlp = None
+        self._matcher = None
+        self.has_tagger = False
+
+    @property
+    def nlp(self):
+        """The spaCy pipeline (loaded on first access)."""
+
+        if self._nlp is None:
+            self._load()
+        return self._nlp
+
+    def extract_skills(self, text: str) -> List[str]:
+        """
+        Extract skills from one text.
+
+        Returns:
+            Taxonomy skills, then custom noun phrases, lowercased and in order of first mention
+        """
+        return self.pipe_skills([text], n_process=1)[0]
+
+    def pipe_skills(self, texts: Iterable[str], n_process: Optional[int] = None) -> List[List[str]]:
+        """
+        Extract skills from many texts with ``nlp.pipe``.
+
+        Args:
+            texts: Texts to process
+            n_process: Processes for ``nlp.pipe`` (defaults to Config.SPACY_N_PROCESS)
+
+        Returns:
+            One skill list per text, in input order
+        """
+        texts = [text or "" for text in texts]
+        if not texts:
+            return []
+
+        nlp = self.nlp
+        n_process = n_process or self.n_process
+        if len(texts) < self.batch_size:
+            # Worker start-up costs more than a single small batch
+            n_process = 1
+
+        return [self._skills_from_doc(doc) for doc in nlp.pipe(texts, batch_size=self.batch_size, n_process=n_process)]
+
+    def _skills_from_doc(self, doc) -> List[str]:
+        """Collect taxonomy hits and custom noun phrases from a processed document."""
+
+        from spacy.util import filter_spans
+
+        # Longest match wins for overlapping skills ("react native" over "react")
+        spans = filter_spans([doc[start:end] for _, start, end in self._matcher(doc)])
+        skills = [span.text.lower() for span in sorted(spans, key=lambda span: span.start)]
+        matched_tokens = {token.i for span in spans for token in span}
+
+        if self.has_tagger:
+            skills.extend(self._noun_phrases(doc, matched_tokens))
+
+        return list(dict.fromkeys(skills))
+
+    @staticmethod
+    def _noun_phrases(doc, matched_tokens) -> List[str]:
+        """Get runs of nouns and proper nouns (up to three tokens) outside taxonomy matches."""
+
+        phrases = []
+        current = []
+        for token in list(doc) + [None]:
+            if (token is not None and token.pos_ in PHRASE_POS and not token.is_stop
+                    and token.i not in matched_tokens and not token.like_num):
+                current.append(token.text.lower())
+                continue
+
+            if current and len(current) <= 3:
+                phrase = " ".join(current)
+                if len(phrase) > 2:
+                    phrases.append(phrase)
+            current = []
+
+        return phrases
+
+    def _load(self) -> None:
+        """Load the model with unneeded components disabled and build the phrase matcher."""
+
+        import spacy
+        from spacy.matcher import PhraseMatcher
+
+        try:
+            nlp = spacy.load(self.model, disable=DISABLED_COMPONENTS)
+        except OSError:
+            print(f"Warning: spaCy model '{self.model}' is not installed "
+                  f"(python -m spacy download {self.model}); matching taxonomy skills only")
+            nlp = spacy.blank("en")
+
+        self.has_tagger = "tagger" in nlp.pipe_names
+
+        # Patterns only need the tokenizer, so they are built with make_doc
+        matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        for skills in self.taxonomy.values():
+            matcher.add("SKILL", [nlp.make_doc(skill) for skill in skills])
+
+        self._nlp = nlp
+        self._matcher = matcher
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The pipeline is reloaded lazily in each process instead of being pickled
+        state = dict(self.__dict__)
+        state["_nlp"] = None
+        state["_matcher"] = None
+        return state
+
+@lru_cache(maxsize=1)
+def get_nlp_skill_extractor() -> NLPSkillExtractor:
+    """Get the shared extractor (the model loads on first use)."""
+    return NLPSkillExtractor()
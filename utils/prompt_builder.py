@@ -0,0 +1,171 @@
+"""
+Prompt utilities for fitting resume optimization prompts into a token budget.
+"""
+
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from config import Config
+from utils.jd_feature_extractor import get_jd_feature_extractor
+from utils.llm_scheduler import count_tokens, truncate_tokens
+
+# Instructions and response schema shared by every optimization request. This is
+# sent first and never formatted, so it stays byte-identical across calls and
+# the API can serve it from its prompt cache.
+OPTIMIZATION_SYSTEM_PROMPT = """You are an expert resume writer and career coach. Create compelling, truthful, and ATS-optimized resume content.
+
+You will receive a target job title, skill lists, the relevant parts of the job description and the current resume. Respond with JSON only, in this format:
+{
+    "optimized_summary": "Professional summary optimized for this role...",
+    "enhanced_experience": [
+        {
+            "title": "Job Title",
+            "company": "Company Name",
+            "description": "Enhanced job description with relevant keywords...",
+            "achievements": ["Achievement 1", "Achievement 2"]
+        }
+    ],
+    "skills_section": {
+        "technical_skills": ["skill1", "skill2", ...],
+        "core_competencies": ["competency1", "competency2", ...]
+    },
+    "keywords_added": ["keyword1", "keyword2", ...],
+    "modifications_summary": ["modification1", "modification2", ...],
+    "ats_optimization_tips": ["tip1", "tip2", ...]
+}
+
+Guidelines:
+1. Keep all information truthful - only enhance presentation, don't fabricate
+2. Incorporate high-priority required skills naturally into existing experience
+3. Use action verbs and quantifiable achievements
+4. Optimize for ATS (Applicant Tracking Systems)
+5. Maintain professional tone and format
+6. Focus on relevant experience and skills"""
+
+# Job description blocks in the order they are kept when the budget is short;
+# company introductions and legal statements are never sent
+SECTION_PRIORITY = ["required_skills", "qualifications", "responsibilities", "preferred_skills", "overview", "benefits"]
+DROPPED_SECTIONS = {"about", "legal"}
+
+# A block is only cut to fit when at least this many tokens of it would remain
+MIN_PARTIAL_TOKENS = 32
+
+class PromptBuilder:
+    """
+    Builds resume optimization messages that fit a token budget.
+
+    The job description is segmented into sections and the highest-signal ones
+    (requirements, qualifications, responsibilities) are kept first; boilerplate
+    is dropped. The resume gets at least its configured share of the budget.
+    """
+
+    def __init__(self, token_budget: Optional[int] = None, resume_share: Optional[float] = None, model: str = "gpt-4"):
+        self.token_budget = token_budget or Config.PROMPT_TOKEN_BUDGET
+        self.resume_share = Config.PROMPT_RESUME_SHARE if resume_share is None else resume_share
+        self.model = model
+        self.system_tokens = count_tokens(OPTIMIZATION_SYSTEM_PROMPT, model)
+
+    def build(self, job_title: str, resume_text: str, job_description: str,
+              required_skills: Sequence[str] = (), high_priority_skills: Sequence[str] = (),
+              current_skills: Sequence[str] = (), missing_skills: Sequence[str] = ()) -> Dict[str, Any]:
+        """
+        Build the chat messages for one optimization request.
+
+        Args:
+            job_title: Target job title
+            resume_text: Plain text of the current resume
+            job_description: Job description text
+            required_skills: Skills the job asks for
+            high_priority_skills: Required skills with high confidence
+            current_skills: Skills already on the resume
+            missing_skills: Required skills not on the resume
+
+        Returns:
+            Dictionary with messages and tokens (system, user, job_description,
+            resume, total, budget and dropped_sections)
+        """
+        header = "\n".join(line for line in [
+            f"Optimize this resume for a {job_title} position.",
+            f"Required Skills: {', '.join(required_skills)}" if required_skills else "",
+            f"High Priority Skills: {', '.join(high_priority_skills)}" if high_priority_skills else "",
+            f"Missing Skills: {', '.join(missing_skills)}" if missing_skills else "",
+            f"Current Skills: {', '.join(current_skills)}" if current_skills else ""
+        ] if line)
+
+        # Labels and separators around the two variable parts
+        available = max(0, self.token_budget - count_tokens(header, self.model) - 16)
+
+        segmented = get_jd_feature_extractor().segment_blocks(job_description)
+        blocks = [(section, text) for section, text in segmented if section not in DROPPED_SECTIONS]
+        dropped = sorted({section for section, _ in segmented if section in DROPPED_SECTIONS})
+        # One extra token per block for the blank line joining it to the next
+        block_tokens = [count_tokens(text, self.model) + 1 for _, text in blocks]
+        resume_tokens = sum(count_tokens(line, self.model) + 1 for line in (resume_text or "").splitlines())
+
+        # The resume keeps its share; either side may use what the other does not need
+        resume_budget = min(resume_tokens, max(int(available * self.resume_share), available - sum(block_tokens)))
+        fitted_description, cut_sections = self._fit_blocks(blocks, block_tokens, available - resume_budget)
+        fitted_resume = self._fit_lines(resume_text or "", resume_budget)
+
+        user_prompt = f"{header}\n\nJob Description:\n{fitted_description}\n\nCurrent Resume Content:\n{fitted_resume}"
+        user_tokens = count_tokens(user_prompt, self.model)
+
+        return {
+            "messages": [
+                {"role": "system", "content": OPTIMIZATION_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ],
+            "tokens": {
+                "system": self.system_tokens,
+                "user": user_tokens,
+                "job_description": count_tokens(fitted_description, self.model),
+                "resume": count_tokens(fitted_resume, self.model),
+                "total": self.system_tokens + user_tokens,
+                "budget": self.token_budget,
+                "dropped_sections": dropped + cut_sections
+            }
+        }
+
+    def _fit_blocks(self, blocks: List[Tuple[str, str]], block_tokens: List[int], budget: int) -> Tuple[str, List[str]]:
+        """
+        Keep the highest-priority blocks that fit, in document order.
+
+        Returns:
+            Tuple of (fitted text, sections left out entirely)
+        """
+        def priority(index: int) -> int:
+            section = blocks[index][0]
+            return SECTION_PRIORITY.index(section) if section in SECTION_PRIORITY else len(SECTION_PRIORITY)
+
+        kept: Dict[int, str] = {}
+        left = budget
+        for index in sorted(range(len(blocks)), key=lambda i: (priority(i), i)):
+            if block_tokens[index] <= left:
+                kept[index] = blocks[index][1]
+                left -= block_tokens[index]
+            elif left >= MIN_PARTIAL_TOKENS:
+                kept[index] = self._fit_lines(blocks[index][1], left)
+                left = 0
+
+        cut = sorted({section for index, (section, _) in enumerate(blocks) if index not in kept}
+                     - {blocks[index][0] for index in kept})
+        return "\n\n".join(kept[index] for index in sorted(kept) if kept[index]), cut
+
+    def _fit_lines(self, text: str, budget: int) -> str:
+        """Keep whole lines from the start while they fit, cutting the first line that does not."""
+
+        lines = []
+        left = budget
+        for line in text.splitlines():
+            tokens = count_tokens(line, self.model) + 1
+            if tokens > left:
+                if left >= MIN_PARTIAL_TOKENS:
+                    lines.append(truncate_tokens(line, left - 1, self.model))
+                break
+            lines.append(line)
+            left -= tokens
+        return "\n".join(lines)
+
+@lru_cache(maxsize=1)
+def get_prompt_builder() -> PromptBuilder:
+    """Get the builder configured from the prompt settings."""
+    return PromptBuilder()
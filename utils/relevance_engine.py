@@ -0,0 +1,243 @@
+"""
+Relevance utilities for ranking candidate jobs against a resume with BM25 or TF-IDF.
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+import scipy.sparse as sp
+from config import Config
+
+# Terms keep +, # and inner dots so "c++", "c#" and "node.js" survive tokenization
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*")
+
+STOP_WORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in", "is", "it",
+    "its", "of", "on", "or", "our", "that", "the", "their", "this", "to", "we", "will", "with", "you",
+    "your", "who", "what", "which", "all", "can", "able", "us", "not", "but", "if", "into", "about"
+}
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase a text and split it into index terms without stop words."""
+
+    return [token for token in TOKEN_PATTERN.findall((text or "").lower()) if token not in STOP_WORDS]
+
+class RelevanceEngine:
+    """
+    Vectorized resume-to-job relevance index.
+
+    Candidate jobs are indexed once into a sparse jobs x terms weight matrix; a
+    query (resume text, role) is scored against every job with a single sparse
+    matrix-vector product.
+    """
+
+    METHODS = ("bm25", "tfidf")
+
+    def __init__(self, method: Optional[str] = None, k1: float = 1.5, b: float = 0.75,
+                 title_weight: Optional[int] = None):
+        self.method = (method or Config.RELEVANCE_METHOD).lower()
+        if self.method not in self.METHODS:
+            raise ValueError(f"Unknown relevance method '{self.method}' (expected one of {', '.join(self.METHODS)})")
+
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight if title_weight is not None else Config.RELEVANCE_TITLE_WEIGHT
+
+        self.jobs: List[Dict[str, Any]] = []
+        self.vocabulary: Dict[str, int] = {}
+        self.terms: List[str] = []
+        self.idf: Optional[np.ndarray] = None
+        self.weights: Optional[sp.csr_matrix] = None
+
+    def index(self, jobs: List[Dict[str, Any]]) -> "RelevanceEngine":
+        """
+        Build the weight matrix for a set of candidate jobs.
+
+        The title is repeated ``title_weight`` times so title terms count more
+        than terms buried in the description.
+
+        Args:
+            jobs: Job dictionaries with title, company and description
+
+        Returns:
+            The engine, for chaining
+        """
+        self.jobs = list(jobs)
+        vocabulary: Dict[str, int] = {}
+        indptr = [0]
+        indices: List[int] = []
+
+        for job in self.jobs:
+            title_terms = tokenize(job.get("title", ""))
+            terms = title_terms * max(1, self.title_weight)
+            terms += tokenize(job.get("company", ""))
+            terms += tokenize(job.get("description", ""))
+            indices.extend(vocabulary.setdefault(term, len(vocabulary)) for term in terms)
+            indptr.append(len(indices))
+
+        self.vocabulary = vocabulary
+        self.terms = list(vocabulary)
+
+        # Duplicate (row, term) entries are summed into term counts
+        counts = sp.csr_matrix(
+            (np.ones(len(indices), dtype=np.float64), np.asarray(indices, dtype=np.int64),
+             np.asarray(indptr, dtype=np.int64)),
+            shape=(len(self.jobs), len(vocabulary))
+        )
+        counts.sum_duplicates()
+
+        num_docs = max(len(self.jobs), 1)
+        document_frequency = np.bincount(counts.indices, minlength=len(vocabulary))
+
+        if self.method == "bm25":
+            self.idf = np.log(1.0 + (num_docs - document_frequency + 0.5) / (document_frequency + 0.5))
+            lengths = np.asarray(counts.sum(axis=1)).ravel()
+            average_length = lengths.mean() if len(lengths) else 0.0
+            norms = self.k1 * (1.0 - self.b + self.b * lengths / (average_length or 1.0))
+
+            weights = counts.copy()
+            row_norms = np.repeat(norms, np.diff(weights.indptr))
+            weights.data = weights.data * (self.k1 + 1.0) / (weights.data + row_norms) * self.idf[weights.indices]
+        else:
+            self.idf = np.log((1.0 + num_docs) / (1.0 + document_frequency)) + 1.0
+
+            weights = counts.copy()
+            weights.data = (1.0 + np.log(weights.data)) * self.idf[weights.indices]
+            row_norms = np.sqrt(np.asarray(weights.multiply(weights).sum(axis=1)).ravel())
+            row_norms[row_norms == 0] = 1.0
+            weights.data /= np.repeat(row_norms, np.diff(weights.indptr))
+
+        self.weights = weights.tocsr()
+        return self
+
+    def score(self, query: str) -> np.ndarray:
+        """
+        Score every indexed job against a query.
+
+        Returns:
+            Array of raw scores, one per indexed job
+        """
+        if self.weights is None or not self.jobs:
+            return np.zeros(len(self.jobs))
+
+        query_vector = self._query_vector(query)
+        if query_vector is None:
+            return np.zeros(len(self.jobs))
+
+        return self.weights @ query_vector
+
+    def rank(self, query: str, k: Optional[int] = None, explain_terms: int = 5) -> List[Dict[str, Any]]:
+        """
+        Get the top-k jobs for a query with explanations.
+
+        Args:
+            query: Resume text, role and other search context
+            k: Number of results (all jobs when None)
+            explain_terms: Matched terms listed per result
+
+        Returns:
+            List of dictionaries with index, job, score (0-100 relative to the best
+            match), raw_score and matched_terms ((term, contribution) pairs)
+        """
+        scores = self.score(query)
+        if not len(scores):
+            return []
+
+        k = len(scores) if k is None else min(k, len(scores))
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.lexsort((top, -scores[top]))]
+
+        best = scores[top[0]] if len(top) and scores[top[0]] > 0 else 1.0
+        query_vector = self._query_vector(query)
+
+        results = []
+        for row in top:
+            results.append({
+                "index": int(row),
+                "job": self.jobs[row],
+                "score": round(float(scores[row] / best * 100), 1),
+                "raw_score": round(float(scores[row]), 4),
+                "matched_terms": self._explain(row, query_vector, explain_terms)
+            })
+        return results
+
+    def _query_vector(self, query: str) -> Optional[np.ndarray]:
+        """Build the query term vector over the index vocabulary."""
+
+        columns = [self.vocabulary[term] for term in tokenize(query) if term in self.vocabulary]
+        if not columns:
+            return None
+
+        counts = np.bincount(columns, minlength=len(self.vocabulary)).astype(np.float64)
+        if self.method == "bm25":
+            # Repeating a term in a long resume should not dominate the score
+            return np.minimum(counts, 1.0) + np.log1p(np.maximum(counts - 1.0, 0.0)) * 0.1
+
+        vector = np.where(counts > 0, 1.0 + np.log(np.maximum(counts, 1.0)), 0.0) * self.idf
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _explain(self, row: int, query_vector: Optional[np.ndarray], limit: int) -> List[Tuple[str, float]]:
+        """Get the query terms contributing most to one job's score."""
+
+        if query_vector is None or limit <= 0:
+            return []
+
+        start, end = self.weights.indptr[row], self.weights.indptr[row + 1]
+        columns = self.weights.indices[start:end]
+        contributions = self.weights.data[start:end] * query_vector[columns]
+
+        matched = np.flatnonzero(contributions)
+        order = matched[np.argsort(-contributions[matched], kind="stable")][:limit]
+        return [(self.terms[columns[i]], round(float(contributions[i]), 4)) for i in order]
+
+def rank_jobs(jobs: List[Dict[str, Any]], query: str, method: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Annotate jobs with ``match_score`` and ``match_terms`` and sort them by match.
+
+    Args:
+        jobs: Candidate job dictionaries (updated in place)
+        query: Resume text plus role/search context
+
+    Returns:
+        The jobs ordered from best to worst match (ties keep their input order)
+    """
+    if not jobs or not query:
+        return jobs
+
+    engine = RelevanceEngine(method).index(jobs)
+    ranked = []
+    for result in engine.rank(query):
+        job = result["job"]
+        job["match_score"] = result["score"]
+        job["match_terms"] = [term for term, _ in result["matched_terms"]]
+        ranked.append(job)
+    return ranked
+
+@lru_cache(maxsize=8)
+def _read_resume_text(resume_path: str, modified: float) -> str:
+    """Read resume text once per file version."""
+
+    from utils.resume_editor import ResumeEditor
+    return ResumeEditor().extract_resume_text(resume_path)
+
+def build_relevance_query(role: str = "", resume_path: Optional[str] = None) -> str:
+    """
+    Build the relevance query from the target role and the resume text.
+
+    The role is repeated so it weighs as much as the resume's most frequent terms.
+    """
+    parts = [role or ""] * 3
+
+    if resume_path and os.path.exists(resume_path):
+        try:
+            parts.append(_read_resume_text(resume_path, os.path.getmtime(resume_path)))
+        except Exception as e:
+            print(f"Warning: Could not read resume for relevance ranking: {e}")
+
+    return "\n".join(part for part in parts if part)
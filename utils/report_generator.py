@@ -9,6 +9,8 @@ from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 import pandas as pd
 from utils.database import ApplicationDatabase
+from utils.skill_matcher import SKILL_TAXONOMY, get_skill_matcher
+from utils.skill_matrix import SkillMatrix
 from config import Config
 
 class ReportGenerator:
@@ -39,21 +41,9 @@ class ReportGenerator:
         companies = list(set([app.get("company_name", "") for app in applications if app.get("company_name")]))
         job_titles = list(set([app.get("job_title", "") for app in applications if app.get("job_title")]))
         
-        # Skill analysis
-        all_skills = []
-        for app in applications:
-            skill_analysis = app.get("skill_analysis", {})
-            if isinstance(skill_analysis, dict):
-                required_skills = skill_analysis.get("required_skills", [])
-                for skill in required_skills:
-                    if isinstance(skill, dict):
-                        all_skills.append(skill.get("skill", ""))
-                    else:
-                        all_skills.append(str(skill))
-        
-        from collections import Counter
-        skill_counts = Counter(all_skills)
-        top_skills = skill_counts.most_common(10)
+        # Skill analysis (jobs x skills matrix, aggregated with vectorized operations)
+        skill_matrix = SkillMatrix.from_applications(applications)
+        top_skills = skill_matrix.top_k(10, weighted=True)
         
         # Timeline analysis
         app_timeline = []
@@ -81,9 +71,11 @@ class ReportGenerator:
                 "job_title_list": job_titles[:10]  # Top 10 job titles
             },
             "skills_analysis": {
-                "total_unique_skills": len(skill_counts),
+                "total_unique_skills": skill_matrix.num_skills,
                 "top_required_skills": top_skills,
-                "skill_diversity_score": len(skill_counts) / total_apps if total_apps > 0 else 0
+                "top_skill_pairs": skill_matrix.top_pairs(10),
+                "skills_by_category": skill_matrix.category_totals(weighted=True),
+                "skill_diversity_score": skill_matrix.num_skills / total_apps if total_apps > 0 else 0
             },
             "timeline": app_timeline,
             "recommendations": self._generate_session_recommendations(
@@ -135,38 +127,13 @@ class ReportGenerator:
         
         skill_trends = self.db.get_skill_trends(limit=50)
         
-        # Categorize skills
-        skill_categories = {
-            "programming_languages": [],
-            "frameworks": [],
-            "databases": [],
-            "cloud_platforms": [],
-            "tools": [],
-            "other": []
-        }
-        
-        # Simple categorization (would be better with ML or predefined mappings)
-        programming_langs = ["python", "java", "javascript", "typescript", "c++", "c#", "go", "rust"]
-        frameworks = ["react", "angular", "vue", "django", "flask", "spring", "express"]
-        databases = ["mysql", "postgresql", "mongodb", "redis", "elasticsearch"]
-        cloud_platforms = ["aws", "azure", "gcp", "docker", "kubernetes"]
-        tools = ["git", "jira", "jenkins", "gitlab"]
+        # Categorize skills with the shared taxonomy
+        matcher = get_skill_matcher()
+        skill_categories = {category: [] for category in SKILL_TAXONOMY}
+        skill_categories["other"] = []
         
         for skill_data in skill_trends:
-            skill_name = skill_data["skill_name"].lower()
-            
-            if any(lang in skill_name for lang in programming_langs):
-                skill_categories["programming_languages"].append(skill_data)
-            elif any(fw in skill_name for fw in frameworks):
-                skill_categories["frameworks"].append(skill_data)
-            elif any(db in skill_name for db in databases):
-                skill_categories["databases"].append(skill_data)
-            elif any(cloud in skill_name for cloud in cloud_platforms):
-                skill_categories["cloud_platforms"].append(skill_data)
-            elif any(tool in skill_name for tool in tools):
-                skill_categories["tools"].append(skill_data)
-            else:
-                skill_categories["other"].append(skill_data)
+            skill_categories[matcher.categorize(skill_data["skill_name"])].append(skill_data)
         
         # Generate recommendations
         recommendations = []
@@ -0,0 +1,113 @@
+"""
+Resume cache utilities for parsing and analyzing each resume file once.
+"""
+
+import os
+import copy
+import hashlib
+import threading
+from functools import lru_cache
+from typing import Dict, Any, Callable, Tuple
+from utils.analysis_cache import get_analysis_cache
+
+class ResumeArtifactCache:
+    """
+    Parsed resume artifacts (text, sections, skills, experience, education) shared by every consumer.
+
+    Entries are found by file path, modification time and size without reading
+    the file; a changed file is hashed, so a touched but identical resume is not
+    parsed again. Artifacts are also stored in the analysis cache by content
+    hash, so they survive across runs.
+    """
+
+    NAMESPACE = "resume_artifacts"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_path: Dict[str, Tuple[int, int, str]] = {}
+        self._by_hash: Dict[str, Dict[str, Any]] = {}
+        self.stats = {"hits": 0, "disk_hits": 0, "parses": 0}
+
+    def get(self, resume_path: str, version: str, build: Callable[[str], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Get the artifact of a resume file, building it only when the content is new.
+
+        Args:
+            resume_path: Path to the resume file
+            version: Fingerprint of the parser and taxonomy that build the artifact
+            build: Builds the artifact from the file path on a miss
+
+        Returns:
+            A copy of the artifact, with content_hash added
+        """
+        path = os.path.abspath(resume_path)
+        stat = os.stat(path)
+
+        with self._lock:
+            known = self._by_path.get(path)
+            if known and known[:2] == (stat.st_mtime_ns, stat.st_size):
+                artifact = self._by_hash.get(f"{version}:{known[2]}")
+                if artifact is not None:
+                    self.stats["hits"] += 1
+                    return copy.deepcopy(artifact)
+
+        content_hash = self.file_hash(path)
+        key = f"{version}:{content_hash}"
+
+        with self._lock:
+            self._by_path[path] = (stat.st_mtime_ns, stat.st_size, content_hash)
+            artifact = self._by_hash.get(key)
+            if artifact is not None:
+                self.stats["hits"] += 1
+                return copy.deepcopy(artifact)
+
+        analysis_cache = get_analysis_cache()
+        artifact = analysis_cache.get(self.NAMESPACE, version, content_hash) if analysis_cache else None
+        if artifact is not None:
+            self.stats["disk_hits"] += 1
+        else:
+            artifact = {**build(path), "content_hash": content_hash}
+            self.stats["parses"] += 1
+            if analysis_cache:
+                analysis_cache.put(self.NAMESPACE, version, content_hash, artifact)
+
+        with self._lock:
+            self._by_hash[key] = artifact
+        return copy.deepcopy(artifact)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get this run's lookups.
+
+        Returns:
+            Dictionary with hits (memory), disk_hits, parses, lookups and hit_rate (percent)
+        """
+        lookups = self.stats["hits"] + self.stats["disk_hits"] + self.stats["parses"]
+        reused = lookups - self.stats["parses"]
+        return {
+            **self.stats,
+            "lookups": lookups,
+            "hit_rate": round(reused / lookups * 100, 1) if lookups else 0.0
+        }
+
+    def clear(self) -> None:
+        """Forget the in-memory artifacts (the disk copies stay)."""
+
+        with self._lock:
+            self._by_path = {}
+            self._by_hash = {}
+
+    @staticmethod
+    def file_hash(path: str) -> str:
+        """Hash of a file's bytes."""
+
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+@lru_cache(maxsize=1)
+def get_resume_cache() -> ResumeArtifactCache:
+    """Get the process-wide resume artifact cache."""
+    return ResumeArtifactCache()
@@ -0,0 +1,152 @@
+"""
+Resume document utilities for assembling tailored resumes section by section.
+"""
+
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+from utils.resume_template import ResumeTemplate, get_resume_template
+
+# Document order of the optimization fields that become resume sections
+SECTION_ORDER = [
+    "optimized_summary",
+    "skills_section",
+    "enhanced_experience",
+    "modifications_summary",
+    "ats_optimization_tips"
+]
+
+class ResumeDocumentAssembler:
+    """
+    Builds a tailored resume document from optimization content.
+
+    Sections can be added one at a time while the response is still streaming
+    (pass add_section as the on_field callback); each is rendered right away and
+    held until finish() puts the sections in document order. Anything not
+    streamed, or streamed with a different final value, is rendered by finish().
+    Paragraphs are cloned from the shared resume template, so no document is
+    built or restyled per variant.
+    """
+
+    def __init__(self, job_title: str, company_name: str, template: Optional[ResumeTemplate] = None):
+        self.job_title = job_title
+        self.company_name = company_name
+        self.template = template or get_resume_template()
+        self.streamed: List[str] = []  # Fields received through add_section, in arrival order
+        self.reused = 0  # Streamed sections finish() did not need to render again
+
+        self._values: Dict[str, Any] = {}
+        self._elements: Dict[str, List[Any]] = {}
+        self._header = [
+            self.template.block("title", f'Resume - {job_title}'),
+            self.template.block("paragraph", f'Modified for: {job_title} at {company_name}'),
+            self.template.block("paragraph", f'Modification date: {datetime.now().strftime("%B %d, %Y")}'),
+            self.template.block("blank")
+        ]
+        self._blocks: Optional[List[Any]] = None
+
+    def add_section(self, key: str, value: Any) -> None:
+        """Render one optimization field as soon as it is available (replacing an earlier version)."""
+
+        if key not in SECTION_ORDER:
+            return
+        self._values[key] = value
+        self._elements[key] = self._render(key, value)
+        if key not in self.streamed:
+            self.streamed.append(key)
+
+    def finish(self, optimized_content: Dict[str, Any]) -> List[Any]:
+        """
+        Complete the document from the final optimization content.
+
+        Args:
+            optimized_content: Final content; sections already rendered from the
+                same value are reused
+
+        Returns:
+            The document's paragraphs (w:p elements) in order
+        """
+        self.reused = 0
+        for key in SECTION_ORDER:
+            value = optimized_content.get(key)
+            if key in self._elements and self._values.get(key) == value:
+                self.reused += 1
+                continue
+            self._values[key] = value
+            self._elements[key] = self._render(key, value)
+
+        self._blocks = self._header + [element for key in SECTION_ORDER for element in self._elements[key]]
+        return self._blocks
+
+    def save(self, output: Any) -> None:
+        """Write the finished document to a .docx path or binary file object."""
+
+        if self._blocks is None:
+            raise RuntimeError("finish() must be called before save()")
+        self.template.save(self._blocks, output)
+
+    def _render(self, key: str, value: Any) -> List[Any]:
+        """Render a section's paragraphs (none for an empty value)."""
+
+        if not value:
+            return []
+        if key == "optimized_summary":
+            return self._summary(value)
+        if key == "skills_section":
+            return self._skills(value)
+        if key == "enhanced_experience":
+            return self._experience(value)
+        if key == "modifications_summary":
+            return self._modifications(value)
+        return self._ats_tips(value)
+
+    def _summary(self, summary: str) -> List[Any]:
+        """Professional summary section."""
+        block = self.template.block
+        return [block("heading", 'Professional Summary'), block("paragraph", summary), block("blank")]
+
+    def _skills(self, skills_section: Dict[str, Any]) -> List[Any]:
+        """Technical skills and core competencies section."""
+        block = self.template.block
+        blocks = [block("heading", 'Technical Skills')]
+
+        if skills_section.get("technical_skills"):
+            blocks.append(block("paragraph", ', '.join(skills_section["technical_skills"])))
+
+        if skills_section.get("core_competencies"):
+            blocks.append(block("blank"))
+            blocks.append(block("paragraph", 'Core Competencies:'))
+            blocks.append(block("paragraph", ', '.join(skills_section["core_competencies"])))
+
+        blocks.append(block("blank"))
+        return blocks
+
+    def _experience(self, enhanced_experience: List[Dict[str, Any]]) -> List[Any]:
+        """Enhanced experience section."""
+        block = self.template.block
+        blocks = [block("heading", 'Professional Experience')]
+
+        for exp in enhanced_experience:
+            # Job title and company
+            blocks.append(block("subheading", f'{exp.get("title", "Job Title")} - {exp.get("company", "Company")}'))
+
+            # Description
+            if exp.get("description"):
+                blocks.append(block("paragraph", exp["description"]))
+
+            # Achievements
+            for achievement in exp.get("achievements") or []:
+                blocks.append(block("bullet", achievement))
+
+            blocks.append(block("blank"))
+        return blocks
+
+    def _modifications(self, modifications: List[str]) -> List[Any]:
+        """Summary of the modifications made."""
+        block = self.template.block
+        return [block("heading", 'Modifications Made')] + [block("paragraph", f'• {mod}') for mod in modifications] + [block("blank")]
+
+    def _ats_tips(self, ats_recs: List[str]) -> List[Any]:
+        """Top ATS optimization tips."""
+        block = self.template.block
+        # Top 5 recommendations
+        return [block("heading", 'ATS Optimization Tips')] + [block("paragraph", f'• {rec}') for rec in ats_recs[:5]]
@@ -8,33 +8,61 @@ It includes AI-powered content optimization, ATS optimization, and file manipula
 
 import os
 import re
-import json
+import sys
+import time
 import asyncio
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Callable
 from datetime import datetime
 from docx import Document
 from docx.shared import Inches, Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK
+from docx.enum.text import WD_BREAK
 from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml.shared import OxmlElement, qn
 import openai
 from openai import AsyncOpenAI
 from config import Config
+from utils.skill_matcher import SKILL_TAXONOMY, SkillMatcher, get_skill_matcher
+from utils.analysis_cache import content_fingerprint, get_analysis_cache, source_fingerprint
+from utils.llm_cache import get_llm_cache
+from utils.llm_scheduler import get_llm_scheduler
+from utils.structured_output import StructuredOutputError, get_optimization_output
+from utils.model_router import get_model_router
+from utils.prompt_builder import get_prompt_builder
+from utils.resume_document import ResumeDocumentAssembler
+from utils.resume_renderer import get_resume_renderer
+from utils.tailoring_reuse import get_tailoring_reuse
+from utils.resume_cache import get_resume_cache
+from utils.logger import setup_logger
 
 class ResumeEditor:
     """Comprehensive resume editing utility with AI-powered optimization."""
     
+    # Source of this module and the skill matcher; folded into the cache versions below
+    # so changing the extraction code invalidates cached results
+    EXTRACTION_SOURCE = source_fingerprint(sys.modules[__name__], SkillMatcher)
+
+    # Persistent analysis cache namespace and version of cached job analyses
+    JOB_ANALYSIS_CACHE_NAMESPACE = "resume_editor_job_requirements"
+    JOB_ANALYSIS_VERSION = content_fingerprint("1", SKILL_TAXONOMY, EXTRACTION_SOURCE)
+    
+    # Version of parsed resume artifacts
+    RESUME_ARTIFACT_VERSION = content_fingerprint("1", SKILL_TAXONOMY, EXTRACTION_SOURCE)
+    
     def __init__(self, api_key: Optional[str] = None):
         """Initialize the ResumeEditor."""
         self.api_key = api_key or Config.OPENAI_API_KEY
-        self.client = AsyncOpenAI(api_key=self.api_key) if self.api_key else None
+        self.client = AsyncOpenAI(api_key=self.api_key, base_url=Config.OPENAI_BASE_URL or None) if self.api_key else None
+        self.logger = setup_logger("ResumeEditor")
         
     async def edit_resume_for_job(self, 
                                 resume_path: str,
                                 job_title: str,
                                 job_description: str,
                                 company_name: str,
-                                output_dir: Optional[str] = None) -> Dict[str, Any]:
+                                output_dir: Optional[str] = None,
+                                use_llm_cache: bool = True,
+                                match_score: Optional[float] = None,
+                                priority: str = "normal") -> Dict[str, Any]:
         """
         Edit a resume to match a specific job description.
         
@@ -44,6 +72,9 @@ class ResumeEditor:
             job_description: Job description text
             company_name: Company name
             output_dir: Output directory for modified resume
+            use_llm_cache: Reuse a cached AI response for an identical prompt
+            match_score: Resume-to-job relevance (0-100), used for model routing
+            priority: Job priority ("high", "normal" or "low"), used for model routing
             
         Returns:
             Dictionary containing modification results and file path
@@ -57,22 +88,28 @@ class ResumeEditor:
             if not job_title or not job_description:
                 raise ValueError("Job title and description are required")
             
-            # Extract resume content
-            resume_content = self._extract_resume_content(resume_path)
-            
             # Analyze job requirements
             job_analysis = self._analyze_job_requirements(job_description)
             
-            # Analyze current resume
-            resume_analysis = self._analyze_current_resume(resume_content)
+            # Parsed and analyzed once per resume version, shared across jobs and runs
+            resume_analysis = self._get_resume_artifact(resume_path)
             
             # Identify skill gaps
             skill_gaps = self._identify_skill_gaps(resume_analysis, job_analysis)
             
-            # Generate optimized content
-            optimized_content = await self._generate_optimized_content(
-                resume_analysis, job_analysis, skill_gaps, job_title
+            # Generate optimized content once per cluster of near-duplicate jobs;
+            # streamed sections are rendered as they arrive
+            document = ResumeDocumentAssembler(job_title, company_name)
+            optimized_content, tailoring_reuse = await get_tailoring_reuse().tailor(
+                resume_analysis["content_hash"], job_title, company_name, skill_gaps,
+                lambda: self._generate_optimized_content(
+                    resume_analysis, job_analysis, skill_gaps, job_title, job_description, use_cache=use_llm_cache,
+                    match_score=match_score, priority=priority, on_field=document.add_section
+                ),
+                job_description, reuse=use_llm_cache
             )
+            if tailoring_reuse["decision"] == "reused":
+                self.logger.info(f"Reusing tailored content for {job_title} at {company_name}: {tailoring_reuse['reason']}")
             
             # Create modification plan
             modification_plan = self._create_modification_plan(
@@ -86,7 +123,7 @@ class ResumeEditor:
             
             # Create modified resume file
             modified_resume_path = await self._create_modified_resume(
-                resume_path, optimized_content, job_title, company_name, output_dir
+                resume_path, optimized_content, job_title, company_name, output_dir, document
             )
             
             return {
@@ -101,6 +138,14 @@ class ResumeEditor:
                 "optimized_content": optimized_content,
                 "modification_plan": modification_plan,
                 "ats_recommendations": ats_recommendations,
+                "analysis_cache": self._get_analysis_cache_stats(),
+                "resume_cache": get_resume_cache().get_stats(),
+                "llm_cache": self._get_llm_cache_stats(),
+                "llm_usage": get_llm_scheduler().get_stats(),
+                "structured_output": get_optimization_output().get_stats(),
+                "model_routing": get_model_router().get_stats(),
+                "resume_rendering": get_resume_renderer().get_stats(),
+                "tailoring_reuse": tailoring_reuse,
                 "modification_timestamp": datetime.now().isoformat()
             }
             
@@ -111,6 +156,70 @@ class ResumeEditor:
                 "modification_timestamp": datetime.now().isoformat()
             }
     
+    async def edit_resume_for_jobs(self,
+                                 resume_path: str,
+                                 jobs: List[Dict[str, Any]],
+                                 output_dir: Optional[str] = None,
+                                 use_llm_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Edit a resume for several jobs at once.
+        
+        The AI calls run concurrently within the shared LLM scheduler's rate and
+        spend budgets instead of one job at a time.
+        
+        Args:
+            resume_path: Path to the original resume
+            jobs: Job dictionaries with title, description and company (match_score
+                and priority, when present, steer model routing)
+            output_dir: Output directory for modified resumes
+            use_llm_cache: Reuse cached AI responses for identical prompts
+            
+        Returns:
+            One result dictionary per job, in input order
+        """
+        
+        return await asyncio.gather(*[
+            self.edit_resume_for_job(
+                resume_path,
+                job.get("title", ""),
+                job.get("description", ""),
+                job.get("company", ""),
+                output_dir,
+                use_llm_cache,
+                match_score=job.get("match_score"),
+                priority=job.get("priority", "normal")
+            )
+            for job in jobs
+        ])
+    
+    async def analyze_resume(self, resume_path: str) -> Dict[str, Any]:
+        """
+        Analyze a resume file.
+        
+        Args:
+            resume_path: Path to the resume (.docx, .pdf or .txt)
+            
+        Returns:
+            Dictionary with sections, skills, experience, education, statistics,
+            content and content_hash
+        """
+        
+        return self._get_resume_artifact(resume_path)
+    
+    def extract_resume_text(self, resume_path: str) -> str:
+        """Get the plain text of a resume file (.docx, .pdf or .txt)."""
+        
+        return self._get_resume_artifact(resume_path)["content"]
+    
+    def _get_resume_artifact(self, resume_path: str) -> Dict[str, Any]:
+        """Get the parsed and analyzed resume from the shared cache, parsing it only when it changed."""
+        
+        return get_resume_cache().get(
+            resume_path,
+            self.RESUME_ARTIFACT_VERSION,
+            lambda path: self._analyze_current_resume(self._extract_resume_content(path))
+        )
+    
     def _extract_resume_content(self, resume_path: str) -> str:
         """Extract text content from resume file."""
         
@@ -167,6 +276,13 @@ class ResumeEditor:
     def _analyze_job_requirements(self, job_description: str) -> Dict[str, Any]:
         """Analyze job description to extract requirements."""
         
+        # Reposted or re-scraped descriptions reuse the stored analysis
+        analysis_cache = get_analysis_cache()
+        if analysis_cache:
+            cached = analysis_cache.get(self.JOB_ANALYSIS_CACHE_NAMESPACE, self.JOB_ANALYSIS_VERSION, job_description)
+            if cached is not None:
+                return cached
+        
         # Extract technical skills
         technical_skills = self._extract_technical_skills(job_description)
         
@@ -182,7 +298,7 @@ class ResumeEditor:
         # Extract keywords
         keywords = self._extract_keywords(job_description)
         
-        return {
+        job_analysis = {
             "technical_skills": technical_skills,
             "soft_skills": soft_skills,
             "experience_requirements": experience_requirements,
@@ -190,60 +306,49 @@ class ResumeEditor:
             "keywords": keywords,
             "total_requirements": len(technical_skills) + len(soft_skills)
         }
+        
+        if analysis_cache:
+            analysis_cache.put(self.JOB_ANALYSIS_CACHE_NAMESPACE, self.JOB_ANALYSIS_VERSION, job_description, job_analysis)
+        
+        return job_analysis
+    
+    def _get_analysis_cache_stats(self) -> Dict[str, Any]:
+        """Get this run's hit rate for cached job analyses."""
+        
+        analysis_cache = get_analysis_cache()
+        return analysis_cache.get_stats(self.JOB_ANALYSIS_CACHE_NAMESPACE) if analysis_cache else {}
+    
+    def _get_llm_cache_stats(self) -> Dict[str, Any]:
+        """Get this run's reused AI responses and the seconds they saved."""
+        
+        llm_cache = get_llm_cache()
+        return llm_cache.get_stats() if llm_cache else {}
     
     def _extract_technical_skills(self, text: str) -> List[Dict[str, Any]]:
         """Extract technical skills from text."""
         
-        # Define skill categories and patterns
-        skill_patterns = {
-            "programming_languages": [
-                r"python", r"java", r"javascript", r"typescript", r"c\+\+", r"c#", r"go", r"rust", r"php", r"ruby",
-                r"swift", r"kotlin", r"scala", r"r", r"matlab", r"sql", r"html", r"css", r"bash", r"powershell"
-            ],
-            "frameworks": [
-                r"django", r"flask", r"fastapi", r"react", r"angular", r"vue", r"node\.js", r"express", r"spring",
-                r"laravel", r"rails", r"asp\.net", r"dotnet", r"flutter", r"react native", r"xamarin"
-            ],
-            "databases": [
-                r"postgresql", r"mysql", r"mongodb", r"redis", r"elasticsearch", r"dynamodb", r"sqlite", r"oracle",
-                r"sql server", r"mariadb", r"cassandra", r"neo4j", r"influxdb"
-            ],
-            "cloud_platforms": [
-                r"aws", r"amazon web services", r"azure", r"gcp", r"google cloud", r"docker", r"kubernetes",
-                r"terraform", r"ansible", r"chef", r"puppet", r"jenkins", r"gitlab", r"github actions"
-            ],
-            "tools": [
-                r"git", r"jira", r"confluence", r"slack", r"figma", r"sketch", r"adobe", r"postman", r"swagger",
-                r"kibana", r"grafana", r"prometheus", r"nagios", r"zabbix"
-            ]
-        }
-        
         extracted_skills = []
         
-        for category, patterns in skill_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, text.lower())
-                for match in matches:
-                    skill_name = match.group()
-                    context_start = max(0, match.start() - 50)
-                    context_end = min(len(text), match.end() + 50)
-                    context = text[context_start:context_end].lower()
-                    
-                    # Calculate confidence based on context
-                    confidence = 0.7
-                    if any(word in context for word in ["required", "must", "essential", "minimum", "mandatory"]):
-                        confidence = 0.9
-                    elif any(word in context for word in ["preferred", "nice to have", "bonus", "plus"]):
-                        confidence = 0.6
-                    elif any(word in context for word in ["experience with", "knowledge of", "familiarity"]):
-                        confidence = 0.8
-                    
-                    extracted_skills.append({
-                        "skill": skill_name.title(),
-                        "category": category,
-                        "confidence": confidence,
-                        "context": context.strip()
-                    })
+        for match in get_skill_matcher().find_all(text):
+            context_start = max(0, match["start"] - 50)
+            context_end = min(len(text), match["end"] + 50)
+            context = text[context_start:context_end].lower()
+            
+            # Calculate confidence based on context
+            confidence = 0.7
+            if any(word in context for word in ["required", "must", "essential", "minimum", "mandatory"]):
+                confidence = 0.9
+            elif any(word in context for word in ["preferred", "nice to have", "bonus", "plus"]):
+                confidence = 0.6
+            elif any(word in context for word in ["experience with", "knowledge of", "familiarity"]):
+                confidence = 0.8
+            
+            extracted_skills.append({
+                "skill": match["skill"].title(),
+                "category": match["category"],
+                "confidence": confidence,
+                "context": context.strip()
+            })
         
         # Remove duplicates and sort by confidence
         unique_skills = {}
@@ -419,42 +524,20 @@ class ResumeEditor:
     def _extract_resume_skills(self, content: str) -> List[Dict[str, Any]]:
         """Extract skills from resume content."""
         
-        # Use the same skill patterns as job analysis
-        skill_patterns = {
-            "programming_languages": [
-                r"python", r"java", r"javascript", r"typescript", r"c\+\+", r"c#", r"go", r"rust", r"php", r"ruby"
-            ],
-            "frameworks": [
-                r"django", r"flask", r"react", r"angular", r"vue", r"node\.js", r"spring", r"laravel", r"rails"
-            ],
-            "databases": [
-                r"postgresql", r"mysql", r"mongodb", r"redis", r"elasticsearch", r"dynamodb", r"sqlite"
-            ],
-            "cloud_platforms": [
-                r"aws", r"azure", r"gcp", r"docker", r"kubernetes", r"terraform", r"ansible"
-            ],
-            "tools": [
-                r"git", r"jenkins", r"jira", r"confluence", r"slack", r"figma", r"sketch"
-            ]
-        }
-        
+        # Use the same skill matcher as job analysis
         skills = []
         
-        for category, patterns in skill_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, content.lower())
-                for match in matches:
-                    skill_name = match.group()
-                    context_start = max(0, match.start() - 30)
-                    context_end = min(len(content), match.end() + 30)
-                    context = content[context_start:context_end]
-                    
-                    skills.append({
-                        "skill": skill_name.title(),
-                        "category": category,
-                        "context": context.strip(),
-                        "mention_count": 1
-                    })
+        for match in get_skill_matcher().find_all(content):
+            context_start = max(0, match["start"] - 30)
+            context_end = min(len(content), match["end"] + 30)
+            context = content[context_start:context_end]
+            
+            skills.append({
+                "skill": match["skill"].title(),
+                "category": match["category"],
+                "context": context.strip(),
+                "mention_count": 1
+            })
         
         # Count mentions and remove duplicates
         skill_counts = {}
@@ -577,32 +660,72 @@ class ResumeEditor:
     async def _generate_optimized_content(self, resume_analysis: Dict[str, Any],
                                         job_analysis: Dict[str, Any],
                                         skill_gaps: Dict[str, Any],
-                                        job_title: str) -> Dict[str, Any]:
-        """Generate optimized resume content using AI."""
+                                        job_title: str,
+                                        job_description: str = "",
+                                        use_cache: bool = True,
+                                        match_score: Optional[float] = None,
+                                        priority: str = "normal",
+                                        on_field: Optional[Callable[[str, Any], None]] = None) -> Dict[str, Any]:
+        """
+        Generate optimized resume content using the model the router picks for this job.
+        
+        on_field receives each valid top-level field while the response streams. A
+        generation cancelled at LLM_STREAM_TIMEOUT keeps the fields received so far
+        and fills in the rest from the basic optimization.
+        """
         
         if not self.client:
             return self._generate_basic_optimized_content(resume_analysis, job_analysis, skill_gaps)
         
+        router = get_model_router()
+        decision = router.route(skill_gaps, match_score, priority)
+        self.logger.info(f"Model routing for {job_title}: {decision['tier']} ({decision['reason']})")
+        if decision["tier"] == "skip":
+            router.record_skip()
+            return self._generate_basic_optimized_content(resume_analysis, job_analysis, skill_gaps)
+        
         try:
             # Prepare prompt for AI
-            prompt = self._create_optimization_prompt(resume_analysis, job_analysis, skill_gaps, job_title)
-            
-            response = await self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert resume writer and career coach. Create compelling, truthful, and ATS-optimized resume content."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=2000,
-                temperature=0.3
+            prompt = self._create_optimization_prompt(resume_analysis, job_analysis, skill_gaps, job_title, job_description)
+            messages = prompt["messages"]
+            tokens = prompt["tokens"]
+            self.logger.info(
+                f"Optimization prompt for {job_title}: {tokens['total']} tokens "
+                f"(system {tokens['system']}, JD {tokens['job_description']}, resume {tokens['resume']}, "
+                f"budget {tokens['budget']}, dropped: {', '.join(tokens['dropped_sections']) or 'none'})"
             )
-            
-            # Parse AI response
-            ai_response = response.choices[0].message.content
-            optimized_data = self._parse_ai_response(ai_response)
+            params = {"max_tokens": decision["max_tokens"], "temperature": 0.3}
+            
+            # An identical prompt (same resume, same JD) routed the same way reuses the earlier response
+            llm_cache = get_llm_cache()
+            if llm_cache:
+                if use_cache:
+                    cached = llm_cache.get(decision["model"], messages, params)
+                    if cached is not None:
+                        cached["optimization_timestamp"] = datetime.now().isoformat()
+                        return cached
+                else:
+                    llm_cache.record_bypass()
+            
+            # Schema-validated response; low-confidence fast-tier output is retried on the strong model
+            start_time = time.perf_counter()
+            optimized_data = await router.generate(self.client, messages, decision, skill_gaps, on_field=on_field,
+                                                   temperature=params["temperature"])
+            optimized_data["source"] = "ai"
+            optimized_data["optimization_timestamp"] = datetime.now().isoformat()
+            
+            if llm_cache and use_cache:
+                llm_cache.put(decision["model"], messages, params, optimized_data, time.perf_counter() - start_time)
             
             return optimized_data
             
+        except StructuredOutputError as e:
+            basic_content = self._generate_basic_optimized_content(resume_analysis, job_analysis, skill_gaps)
+            if not e.cancelled:
+                return basic_content
+            self.logger.warning(f"{e}; keeping {len(e.fields)} streamed section(s) for {job_title}")
+            return {**basic_content, **e.fields, "source": "ai_partial"}
+            
         except Exception as e:
             # Fallback to basic optimization
             return self._generate_basic_optimized_content(resume_analysis, job_analysis, skill_gaps)
@@ -610,87 +733,22 @@ class ResumeEditor:
     def _create_optimization_prompt(self, resume_analysis: Dict[str, Any],
                                   job_analysis: Dict[str, Any],
                                   skill_gaps: Dict[str, Any],
-                                  job_title: str) -> str:
-        """Create prompt for AI optimization."""
+                                  job_title: str,
+                                  job_description: str = "") -> Dict[str, Any]:
+        """Create the token-budgeted messages for AI optimization."""
         
         current_skills = [skill["skill"] for skill in resume_analysis.get("skills", [])]
         missing_skills = [skill["skill"] for skill in skill_gaps.get("missing_skills", [])]
         required_skills = [skill["skill"] for skill in job_analysis.get("technical_skills", [])]
         
-        prompt = f"""
-        Optimize this resume for a {job_title} position. The goal is to better align the resume with the job requirements while maintaining truthfulness and professionalism.
-        
-        Current Resume Content:
-        {resume_analysis.get("content", "")[:2000]}
-        
-        Job Requirements:
-        - Technical Skills: {', '.join(required_skills[:15])}
-        - Missing Skills: {', '.join(missing_skills[:10])}
-        - Current Skills: {', '.join(current_skills[:15])}
-        
-        Please provide optimized content in JSON format:
-        {{
-            "optimized_summary": "Professional summary optimized for this role...",
-            "enhanced_experience": [
-                {{
-                    "title": "Job Title",
-                    "company": "Company Name", 
-                    "description": "Enhanced job description with relevant keywords...",
-                    "achievements": ["Achievement 1", "Achievement 2"]
-                }}
-            ],
-            "skills_section": {{
-                "technical_skills": ["skill1", "skill2", ...],
-                "core_competencies": ["competency1", "competency2", ...]
-            }},
-            "keywords_added": ["keyword1", "keyword2", ...],
-            "modifications_summary": ["modification1", "modification2", ...],
-            "ats_optimization_tips": ["tip1", "tip2", ...]
-        }}
-        
-        Guidelines:
-        1. Keep all information truthful - only enhance presentation, don't fabricate
-        2. Incorporate high-priority required skills naturally into existing experience
-        3. Use action verbs and quantifiable achievements
-        4. Optimize for ATS (Applicant Tracking Systems)
-        5. Maintain professional tone and format
-        6. Focus on relevant experience and skills
-        """
-        
-        return prompt
-    
-    def _parse_ai_response(self, ai_response: str) -> Dict[str, Any]:
-        """Parse AI response to extract JSON content."""
-        
-        try:
-            # Extract JSON from the response
-            json_start = ai_response.find('{')
-            json_end = ai_response.rfind('}') + 1
-            
-            if json_start != -1 and json_end != -1:
-                json_str = ai_response[json_start:json_end]
-                optimized_data = json.loads(json_str)
-                
-                # Add metadata
-                optimized_data["source"] = "ai"
-                optimized_data["optimization_timestamp"] = datetime.now().isoformat()
-                
-                return optimized_data
-            
-        except json.JSONDecodeError:
-            pass
-        
-        # Return basic structure if parsing fails
-        return {
-            "source": "fallback",
-            "optimization_timestamp": datetime.now().isoformat(),
-            "optimized_summary": "Resume optimization completed",
-            "enhanced_experience": [],
-            "skills_section": {"technical_skills": [], "core_competencies": []},
-            "keywords_added": [],
-            "modifications_summary": ["Basic optimization applied"],
-            "ats_optimization_tips": ["Use relevant keywords", "Maintain clean format"]
-        }
+        return get_prompt_builder().build(
+            job_title,
+            resume_analysis.get("content", ""),
+            job_description,
+            required_skills=required_skills[:15],
+            current_skills=current_skills[:15],
+            missing_skills=missing_skills[:10]
+        )
     
     def _generate_basic_optimized_content(self, resume_analysis: Dict[str, Any],
                                         job_analysis: Dict[str, Any],
@@ -806,98 +864,31 @@ class ResumeEditor:
                                     optimized_content: Dict[str, Any],
                                     job_title: str,
                                     company_name: str,
-                                    output_dir: Optional[str] = None) -> str:
-        """Create a modified resume file based on the optimization results."""
+                                    output_dir: Optional[str] = None,
+                                    document: Optional[ResumeDocumentAssembler] = None) -> str:
+        """Create a modified resume file based on the optimization results.
+        
+        Files are named by a hash of their content (default directory OUTPUT_RESUME_DIR),
+        so identical content returns the existing file. document may already hold
+        sections rendered while the response streamed; it is finished in-process,
+        otherwise the document is built on the renderer's process pool.
+        """
         
         try:
-            # Create output directory
-            if not output_dir:
-                output_dir = os.path.join(os.path.dirname(original_resume_path), "modified_resumes")
-            os.makedirs(output_dir, exist_ok=True)
-            
-            # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_job_title = re.sub(r'[^\w\s-]', '', job_title).replace(' ', '_')[:30]
-            safe_company = re.sub(r'[^\w\s-]', '', company_name).replace(' ', '_')[:20]
-            
-            filename = f"resume_{safe_job_title}_{safe_company}_{timestamp}.docx"
-            output_path = os.path.join(output_dir, filename)
-            
-            # Create the modified document
-            doc = Document()
-            
-            # Add title
-            title = doc.add_heading(f'Resume - {job_title}', 0)
-            title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            # Add modification info
-            doc.add_paragraph(f'Modified for: {job_title} at {company_name}')
-            doc.add_paragraph(f'Modification date: {datetime.now().strftime("%B %d, %Y")}')
-            doc.add_paragraph('')
-            
-            # Add optimized content
-            # Summary section
-            if optimized_content.get("optimized_summary"):
-                doc.add_heading('Professional Summary', level=1)
-                doc.add_paragraph(optimized_content["optimized_summary"])
-                doc.add_paragraph('')
-            
-            # Skills section
-            skills_section = optimized_content.get("skills_section", {})
-            if skills_section:
-                doc.add_heading('Technical Skills', level=1)
-                
-                if skills_section.get("technical_skills"):
-                    doc.add_paragraph(', '.join(skills_section["technical_skills"]))
-                
-                if skills_section.get("core_competencies"):
-                    doc.add_paragraph('')
-                    doc.add_paragraph('Core Competencies:')
-                    doc.add_paragraph(', '.join(skills_section["core_competencies"]))
-                
-                doc.add_paragraph('')
-            
-            # Experience section (enhanced)
-            enhanced_experience = optimized_content.get("enhanced_experience", [])
-            if enhanced_experience:
-                doc.add_heading('Professional Experience', level=1)
-                
-                for exp in enhanced_experience:
-                    # Job title and company
-                    job_header = doc.add_heading(f'{exp.get("title", "Job Title")} - {exp.get("company", "Company")}', level=2)
-                    
-                    # Description
-                    if exp.get("description"):
-                        doc.add_paragraph(exp["description"])
-                    
-                    # Achievements
-                    if exp.get("achievements"):
-                        for achievement in exp["achievements"]:
-                            p = doc.add_paragraph()
-                            p.add_run('• ').bold = True
-                            p.add_run(achievement)
-                    
-                    doc.add_paragraph('')
-            
-            # Add modification summary
-            modifications = optimized_content.get("modifications_summary", [])
-            if modifications:
-                doc.add_heading('Modifications Made', level=1)
-                for mod in modifications:
-                    doc.add_paragraph(f'• {mod}')
-                doc.add_paragraph('')
-            
-            # Add ATS recommendations
-            ats_recs = optimized_content.get("ats_optimization_tips", [])
-            if ats_recs:
-                doc.add_heading('ATS Optimization Tips', level=1)
-                for rec in ats_recs[:5]:  # Top 5 recommendations
-                    doc.add_paragraph(f'• {rec}')
+            streamed = document is not None and bool(document.streamed)
+            rendered = await get_resume_renderer().render(
+                job_title, company_name, optimized_content, output_dir, document if streamed else None
+            )
             
-            # Save the document
-            doc.save(output_path)
+            if rendered["reused"]:
+                self.logger.info(f"Resume for {job_title} at {company_name}: identical content, reusing {rendered['path']}")
+            elif streamed:
+                self.logger.info(
+                    f"Resume for {job_title}: {document.reused}/{len(document.streamed)} streamed sections "
+                    f"reused ({', '.join(document.streamed)})"
+                )
             
-            return output_path
+            return rendered["path"]
             
         except Exception as e:
             raise Exception(f"Failed to create modified resume: {str(e)}")
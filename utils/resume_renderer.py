@@ -0,0 +1,231 @@
+"""
+Resume rendering utilities for writing tailored resume files on a process pool, content-addressed.
+"""
+
+import os
+import re
+import json
+import time
+import asyncio
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+from config import Config
+from utils.resume_document import SECTION_ORDER, ResumeDocumentAssembler
+from utils.resume_template import ResumeTemplate, get_resume_template
+
+# Template owned by each worker process (set by the pool initializer)
+_worker_template: Optional[ResumeTemplate] = None
+
+# Rendered files are named resume_<title>_<company>_<content hash>.docx
+FILENAME_PATTERN = re.compile(r"^resume_.*_[0-9a-f]{16}\.docx$")
+
+def _init_worker() -> None:
+    """Parse the resume template once per worker process."""
+
+    global _worker_template
+    _worker_template = ResumeTemplate()
+
+def _render_file(job_title: str, company_name: str, content: Dict[str, Any], output_path: str) -> str:
+    """Render one resume inside a worker (or a thread with one worker) and move it into place."""
+
+    document = ResumeDocumentAssembler(job_title, company_name, _worker_template or get_resume_template())
+    document.finish(content)
+    temporary_path = f"{output_path}.{os.getpid()}.tmp"
+    document.save(temporary_path)
+    os.replace(temporary_path, output_path)
+    return output_path
+
+class ResumeRenderer:
+    """
+    Writes tailored resume files, one per distinct content.
+
+    Files are named by a hash of the job title, company and optimized content,
+    so identical requests (common when near-identical JDs produce the same
+    tailoring) return the existing file instead of writing a new one; concurrent
+    identical requests share one render. Documents are built on a process pool.
+    Files in OUTPUT_RESUME_DIR older than the retention period, or beyond the
+    file limit, are removed least recently used first.
+    """
+
+    # Retention runs after this many new files instead of after every file
+    RETENTION_INTERVAL = 50
+
+    def __init__(self, output_dir: Optional[str] = None, workers: Optional[int] = None,
+                 retention_days: Optional[float] = None, max_files: Optional[int] = None):
+        self.output_dir = output_dir or Config.OUTPUT_RESUME_DIR
+        self.workers = workers or Config.RESUME_RENDER_WORKERS or os.cpu_count() or 1
+        self.retention_days = Config.RESUME_RETENTION_DAYS if retention_days is None else retention_days
+        self.max_files = Config.RESUME_MAX_FILES if max_files is None else max_files
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._written = 0
+        self.stats = {"rendered": 0, "reused": 0, "removed": 0, "render_seconds": 0.0}
+
+    async def render(self, job_title: str, company_name: str, content: Dict[str, Any],
+                     output_dir: Optional[str] = None,
+                     document: Optional[ResumeDocumentAssembler] = None) -> Dict[str, Any]:
+        """
+        Get the resume file for some optimized content, rendering it only when it is new.
+
+        Args:
+            job_title: Target job title
+            company_name: Company name
+            content: Optimization content (summary, skills, experience, modifications, ATS tips)
+            output_dir: Directory for the file (default OUTPUT_RESUME_DIR, the only
+                directory retention applies to)
+            document: Assembler holding sections rendered while the response streamed;
+                it is finished in-process instead of rendering again on the pool
+
+        Returns:
+            Dictionary with path, content_hash and reused
+        """
+        output_dir = output_dir or self.output_dir
+        content_hash = self.content_hash(job_title, company_name, content)
+        output_path = os.path.join(output_dir, self._filename(job_title, company_name, content_hash))
+
+        pending = self._in_flight.get(output_path)
+        if pending is not None:
+            await asyncio.shield(pending)
+            self.stats["reused"] += 1
+            return {"path": output_path, "content_hash": content_hash, "reused": True}
+
+        if os.path.exists(output_path):
+            # Reuse counts as access for least-recently-used retention
+            os.utime(output_path)
+            self.stats["reused"] += 1
+            return {"path": output_path, "content_hash": content_hash, "reused": True}
+
+        loop = asyncio.get_running_loop()
+        pending = self._in_flight[output_path] = loop.create_future()
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            start_time = time.perf_counter()
+            if document is not None:
+                document.finish(content)
+                temporary_path = f"{output_path}.{os.getpid()}.tmp"
+                document.save(temporary_path)
+                os.replace(temporary_path, output_path)
+            else:
+                fields = {key: content.get(key) for key in SECTION_ORDER}
+                executor = self._get_executor() if self.workers > 1 else None
+                await loop.run_in_executor(executor, _render_file, job_title, company_name, fields, output_path)
+            self.stats["rendered"] += 1
+            self.stats["render_seconds"] += time.perf_counter() - start_time
+            pending.set_result(output_path)
+        except Exception as e:
+            pending.set_exception(e)
+            # Waiters see the failure; nobody else needs to retrieve it
+            pending.exception()
+            raise
+        finally:
+            del self._in_flight[output_path]
+
+        self._written += 1
+        if self._written >= self.RETENTION_INTERVAL:
+            self._written = 0
+            self.apply_retention()
+
+        return {"path": output_path, "content_hash": content_hash, "reused": False}
+
+    async def render_many(self, requests: List[Dict[str, Any]], output_dir: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Render several resumes at once on the pool.
+
+        Args:
+            requests: Dictionaries with job_title, company_name and content
+            output_dir: Directory for the files (default OUTPUT_RESUME_DIR)
+
+        Returns:
+            One render() result per request, in input order
+        """
+        return await asyncio.gather(*[
+            self.render(request["job_title"], request["company_name"], request["content"], output_dir)
+            for request in requests
+        ])
+
+    def apply_retention(self) -> int:
+        """
+        Remove rendered files from OUTPUT_RESUME_DIR that are past the retention period
+        or beyond the file limit (least recently used first).
+
+        Returns:
+            Number of files removed
+        """
+        if not os.path.isdir(self.output_dir) or not (self.retention_days or self.max_files):
+            return 0
+
+        files = []
+        for entry in os.scandir(self.output_dir):
+            if entry.is_file() and FILENAME_PATTERN.match(entry.name):
+                files.append((entry.stat().st_mtime, entry.path))
+        files.sort(reverse=True)
+
+        cutoff = time.time() - self.retention_days * 86400 if self.retention_days else None
+        expired = [path for index, (modified, path) in enumerate(files)
+                   if (cutoff and modified < cutoff) or (self.max_files and index >= self.max_files)]
+
+        removed = 0
+        for path in expired:
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+        self.stats["removed"] += removed
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get this run's rendering counts.
+
+        Returns:
+            Dictionary with rendered, reused, removed (by retention) and render_seconds
+        """
+        return {**self.stats, "render_seconds": round(self.stats["render_seconds"], 2)}
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "ResumeRenderer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @staticmethod
+    def content_hash(job_title: str, company_name: str, content: Dict[str, Any]) -> str:
+        """Hash of everything that ends up in the document except the modification date."""
+
+        payload = json.dumps([job_title, company_name, [content.get(key) for key in SECTION_ORDER]],
+                             sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+    @staticmethod
+    def _filename(job_title: str, company_name: str, content_hash: str) -> str:
+        """Readable, content-addressed file name."""
+
+        safe_job_title = re.sub(r'[^\w\s-]', '', job_title).replace(' ', '_')[:30]
+        safe_company = re.sub(r'[^\w\s-]', '', company_name).replace(' ', '_')[:20]
+        return f"resume_{safe_job_title}_{safe_company}_{content_hash}.docx"
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the pool on first use so the workers are reused across renders."""
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        return self._executor
+
+@lru_cache(maxsize=1)
+def get_resume_renderer() -> ResumeRenderer:
+    """Get the renderer configured from the resume output settings."""
+
+    renderer = ResumeRenderer()
+    renderer.apply_retention()
+    return renderer
@@ -0,0 +1,180 @@
+"""
+Resume template utilities for rendering many tailored resume documents from one parsed base document.
+"""
+
+import io
+import os
+import re
+import copy
+import zipfile
+from functools import lru_cache
+from typing import Dict, Any, Optional, Iterable
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
+from lxml import etree
+from config import Config
+
+# Text of the placeholder run in each prototype paragraph
+PLACEHOLDER = "{{text}}"
+
+# Part of the package that changes per variant; every other part is written once
+DOCUMENT_PART = "word/document.xml"
+
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+# Built-in styles the prototypes use; Word leaves unused ones out of saved files
+REQUIRED_STYLES = ("Title", "Heading 1", "Heading 2")
+
+class ResumeTemplate:
+    """
+    A pre-styled resume document kept as parsed XML.
+
+    The base document (RESUME_TEMPLATE_PATH when it exists, else the python-docx
+    default) is loaded once. One prototype paragraph per block kind (title,
+    heading, subheading, paragraph, bullet, blank) is styled with python-docx
+    and holds a placeholder run. A variant is rendered by cloning prototypes,
+    substituting their text and serializing only the document part; the other
+    package parts (styles, numbering, theme, ...) are compressed once and
+    reused as an archive prefix.
+    """
+
+    def __init__(self, template_path: Optional[str] = None):
+        template_path = Config.RESUME_TEMPLATE_PATH if template_path is None else template_path
+        self.template_path = template_path if template_path and os.path.exists(template_path) else None
+        doc = Document(self.template_path) if self.template_path else Document()
+        self._add_missing_styles(doc)
+
+        # The template's own content is replaced by the rendered blocks
+        body = doc.element.body
+        for element in list(body):
+            if element is not body.sectPr:
+                body.remove(element)
+
+        title = doc.add_heading(PLACEHOLDER, 0)
+        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        doc.add_heading(PLACEHOLDER, level=1)
+        doc.add_heading(PLACEHOLDER, level=2)
+        doc.add_paragraph(PLACEHOLDER)
+        bullet = doc.add_paragraph()
+        bullet.add_run('• ').bold = True
+        bullet.add_run(PLACEHOLDER)
+        doc.add_paragraph('')
+
+        kinds = ["title", "heading", "subheading", "paragraph", "bullet", "blank"]
+        self.prototypes: Dict[str, Any] = {}
+        for kind, element in zip(kinds, [element for element in body if element is not body.sectPr]):
+            body.remove(element)
+            self.prototypes[kind] = element
+
+        # Serialize the package once; variants only append their document part
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        prefix = io.BytesIO()
+        with zipfile.ZipFile(buffer) as package, zipfile.ZipFile(prefix, "w") as static:
+            for info in package.infolist():
+                if info.filename == DOCUMENT_PART:
+                    self._document_info = info
+                    self._skeleton = etree.fromstring(package.read(info))
+                else:
+                    static.writestr(info, package.read(info))
+        self._prefix = prefix.getvalue()
+
+    def block(self, kind: str, text: str = "") -> Any:
+        """
+        Clone a prototype paragraph with its placeholder replaced.
+
+        Args:
+            kind: "title", "heading", "subheading", "paragraph", "bullet" or "blank"
+            text: Paragraph text (line breaks and tabs are kept)
+
+        Returns:
+            A detached w:p element
+        """
+        paragraph = copy.deepcopy(self.prototypes[kind])
+        for text_element in paragraph.iter(qn("w:t")):
+            if text_element.text == PLACEHOLDER:
+                self._set_run_text(text_element, text)
+        return paragraph
+
+    def render(self, blocks: Iterable[Any]) -> bytes:
+        """Serialize a variant's document part with the given blocks as its body."""
+
+        root = copy.deepcopy(self._skeleton)
+        body = root.find(qn("w:body"))
+        section = body.find(qn("w:sectPr"))
+        for element in blocks:
+            if section is not None:
+                section.addprevious(element)
+            else:
+                body.append(element)
+        return etree.tostring(root, encoding="UTF-8", xml_declaration=True, standalone=True)
+
+    def save(self, blocks: Iterable[Any], output: Any) -> None:
+        """
+        Write a variant as a .docx file.
+
+        Args:
+            blocks: w:p elements from block(), in document order
+            output: File path or binary file object
+        """
+        buffer = io.BytesIO(self._prefix)
+        with zipfile.ZipFile(buffer, "a") as package:
+            package.writestr(self._document_info, self.render(blocks))
+
+        if isinstance(output, (str, os.PathLike)):
+            with open(output, "wb") as file:
+                file.write(buffer.getvalue())
+        else:
+            output.write(buffer.getvalue())
+
+    def _add_missing_styles(self, doc: Any) -> None:
+        """Copy required built-in styles the template lacks from the python-docx default document."""
+
+        missing = [name for name in REQUIRED_STYLES if name not in doc.styles]
+        if not missing:
+            return
+
+        defaults = Document().styles
+        for name in missing:
+            style = defaults[name].element
+            doc.styles.element.append(copy.deepcopy(style))
+            # Linked character style ("Heading1Char"), referenced by id
+            link = style.find(qn("w:link"))
+            if link is not None:
+                link_id = link.get(qn("w:val"))
+                linked = defaults.element.find(f"{qn('w:style')}[@{qn('w:styleId')}='{link_id}']")
+                present = doc.styles.element.find(f"{qn('w:style')}[@{qn('w:styleId')}='{link_id}']")
+                if linked is not None and present is None:
+                    doc.styles.element.append(copy.deepcopy(linked))
+
+        print(f"Warning: Resume template {self.template_path} has no {', '.join(missing)} style(s); "
+              f"using the default ones")
+
+    @staticmethod
+    def _set_run_text(text_element: Any, text: str) -> None:
+        """Fill a placeholder w:t, turning newlines and tabs into w:br and w:tab like python-docx."""
+
+        run = text_element.getparent()
+        position = run.index(text_element)
+        run.remove(text_element)
+
+        pieces = []
+        for piece in re.split(r"([\t\n\r])", text):
+            if piece in ("\n", "\r", "\t"):
+                pieces.append(("w:tab" if piece == "\t" else "w:br", None))
+            elif piece:
+                pieces.append(("w:t", piece))
+
+        for offset, (tag, value) in enumerate(pieces):
+            element = etree.Element(qn(tag))
+            if value is not None:
+                element.text = value
+                if value != value.strip():
+                    element.set(XML_SPACE, "preserve")
+            run.insert(position + offset, element)
+
+@lru_cache(maxsize=1)
+def get_resume_template() -> ResumeTemplate:
+    """Get the template loaded from RESUME_TEMPLATE_PATH (or the default styles)."""
+    return ResumeTemplate()
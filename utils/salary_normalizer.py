@@ -0,0 +1,379 @@
+"""
+Salary utilities for parsing free-text salaries and querying them as numeric columns.
+"""
+
+import re
+from array import array
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Iterable, Sequence
+import numpy as np
+from config import Config
+
+# Currency markers, longest first so "CA$" wins over "$"
+CURRENCY_MARKERS = {
+    "ca$": "CAD", "c$": "CAD", "cad": "CAD",
+    "a$": "AUD", "au$": "AUD", "aud": "AUD",
+    "us$": "USD", "usd": "USD", "$": "USD",
+    "£": "GBP", "gbp": "GBP",
+    "€": "EUR", "eur": "EUR",
+    "₹": "INR", "inr": "INR", "rs": "INR",
+    "chf": "CHF", "sgd": "SGD"
+}
+
+# Approximate conversion to USD; override the base currency with SALARY_BASE_CURRENCY
+USD_RATES = {
+    "USD": 1.0, "CAD": 0.73, "AUD": 0.66, "GBP": 1.27, "EUR": 1.08,
+    "INR": 0.012, "CHF": 1.12, "SGD": 0.74
+}
+
+MULTIPLIERS = {"k": 1_000, "m": 1_000_000}
+
+# Working units per year for each pay period
+PERIOD_FACTORS = {"hour": 2080, "day": 260, "week": 52, "month": 12, "year": 1}
+
+PERIOD_ALIASES = {
+    "hour": "hour", "hr": "hour", "hourly": "hour", "h": "hour",
+    "day": "day", "daily": "day",
+    "week": "week", "wk": "week", "weekly": "week",
+    "month": "month", "mo": "month", "monthly": "month",
+    "year": "year", "yr": "year", "annum": "year", "annual": "year", "annually": "year", "yearly": "year",
+    "pa": "year", "p.a.": "year"
+}
+
+def _marker_pattern(marker: str) -> str:
+    """Escape a currency marker, word-bounding its letters so "rs" does not match "years"."""
+
+    pattern = re.escape(marker)
+    if marker[0].isalpha():
+        pattern = r"\b" + pattern
+    if marker[-1].isalpha():
+        pattern += r"\b"
+    return pattern
+
+_CURRENCY_ALTERNATION = "|".join(_marker_pattern(marker) for marker in sorted(CURRENCY_MARKERS, key=len, reverse=True))
+
+# One amount: optional currency, number with separators (including lakh grouping), optional k/m multiplier
+AMOUNT_PATTERN = re.compile(
+    r"(?P<currency>" + _CURRENCY_ALTERNATION + r")?\s*"
+    r"(?P<number>\d{1,3}(?:,\d{2})+,\d{3}|\d{1,3}(?:[,.\s]\d{3})+|\d+(?:\.\d+)?)\s*"
+    r"(?P<multiplier>k|m)?\b",
+    re.IGNORECASE
+)
+PERIOD_PATTERN = re.compile(
+    r"(?:/|\bper\b|\ba\b|\ban\b)\s*(?P<period>hour|hr|h|day|week|wk|month|mo|year|yr|annum)\b"
+    r"|\b(?P<adverb>hourly|daily|weekly|monthly|yearly|annually|annual|pa|p\.a\.)(?!\w)",
+    re.IGNORECASE
+)
+CURRENCY_PATTERN = re.compile(_CURRENCY_ALTERNATION, re.IGNORECASE)
+
+# Text joining the two ends of a range ("80 - 100k", "$80k to $100k")
+RANGE_SEPARATOR_PATTERN = re.compile(r"^\s*(?:-|–|—|to)\s*$", re.IGNORECASE)
+
+# Years of experience that follow a number ("5 years", "3+ yrs")
+EXPERIENCE_PATTERN = re.compile(r"\s*\+?\s*(?:years?|yrs?)\b", re.IGNORECASE)
+
+# Retirement plans and similar benefits that look like amounts
+NOISE_PATTERN = re.compile(r"\b401\s*\(?k\)?|\b403\s*\(?b\)?", re.IGNORECASE)
+
+class SalaryNormalizer:
+    """
+    Parses salary text into an annualized range in the base currency.
+
+    Results carry a confidence between 0 and 1 that drops when the currency or
+    pay period had to be assumed.
+    """
+
+    def __init__(self, base_currency: Optional[str] = None):
+        self.base_currency = (base_currency or Config.SALARY_BASE_CURRENCY).upper()
+        if self.base_currency not in USD_RATES:
+            raise ValueError(f"Unsupported base currency '{self.base_currency}'")
+
+        # Parsed strings repeat across sources and runs
+        self.parse = lru_cache(maxsize=4096)(self._parse)
+
+    def _parse(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse one salary string.
+
+        Args:
+            text: Salary as shown by the source, e.g. "$120k - $150k" or "£60,000 a year"
+
+        Returns:
+            Dictionary with min, max (annual, base currency), currency, period and
+            confidence, or None when the text has no amount
+        """
+        if not text:
+            return None
+
+        cleaned = NOISE_PATTERN.sub(" ", text)
+        candidates = []
+        for match in AMOUNT_PATTERN.finditer(cleaned):
+            value = self._to_number(match.group("number"))
+            if value is None or value <= 0:
+                continue
+            # "5+ years experience" is not an amount
+            if EXPERIENCE_PATTERN.match(cleaned, match.end()):
+                continue
+            candidates.append((match, value))
+
+        if not candidates:
+            return None
+
+        # Two amounts form a range only when a separator joins them or both are clearly money;
+        # otherwise the first amount with a currency or multiplier (or the first amount) stands alone
+        chosen = None
+        for (first, first_value), (second, second_value) in zip(candidates, candidates[1:]):
+            joined = RANGE_SEPARATOR_PATTERN.match(cleaned[first.end():second.start()])
+            if joined or (self._is_marked(first) and self._is_marked(second)):
+                chosen = [(first, first_value), (second, second_value)]
+                break
+        if chosen is None:
+            chosen = [next((candidate for candidate in candidates if self._is_marked(candidate[0])), candidates[0])]
+
+        currency = next((CURRENCY_MARKERS[match.group("currency").lower()] for match, _ in chosen
+                         if match.group("currency")), None)
+        amounts = [value for _, value in chosen]
+        multipliers = [MULTIPLIERS.get((match.group("multiplier") or "").lower(), 1) for match, _ in chosen]
+
+        # "$80-100k": the multiplier applies to both ends of the range
+        shared = max(multipliers)
+        amounts = [amount * (multiplier if multiplier > 1 or amount >= 1_000 else shared)
+                   for amount, multiplier in zip(amounts, multipliers)]
+
+        confidence = 1.0
+        if currency is None:
+            marker = CURRENCY_PATTERN.search(cleaned)
+            if marker:
+                currency = CURRENCY_MARKERS[marker.group(0).lower()]
+            else:
+                currency = self.base_currency
+                confidence -= 0.2
+
+        period_match = PERIOD_PATTERN.search(cleaned)
+        if period_match:
+            period = PERIOD_ALIASES[(period_match.group("period") or period_match.group("adverb")).lower()]
+        else:
+            period = self._infer_period(max(amounts))
+            # Yearly is the usual unstated period, so guessing it costs less
+            confidence -= 0.1 if period == "year" else 0.3
+
+        if len(amounts) == 1:
+            confidence -= 0.1
+
+        rate = USD_RATES.get(currency, 1.0) / USD_RATES[self.base_currency]
+        factor = PERIOD_FACTORS[period] * rate
+        low, high = min(amounts) * factor, max(amounts) * factor
+
+        return {
+            "min": round(low, 2),
+            "max": round(high, 2),
+            "currency": currency,
+            "period": period,
+            "confidence": round(max(confidence, 0.1), 2)
+        }
+
+    def parse_value(self, salary: Any) -> Optional[Dict[str, Any]]:
+        """
+        Parse a job's salary field, which sources give as text or as a plain number.
+
+        A number is taken as an annual amount in the base currency (min == max).
+        """
+        if isinstance(salary, (int, float)) and not isinstance(salary, bool):
+            if salary <= 0:
+                return None
+            return {
+                "min": float(salary),
+                "max": float(salary),
+                "currency": self.base_currency,
+                "period": "year",
+                "confidence": 1.0
+            }
+        return self.parse(salary) if isinstance(salary, str) else None
+
+    def annotate(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Add numeric salary fields to a job dictionary.
+
+        Sets salary_min, salary_max (annual, base currency) and salary_confidence;
+        jobs without a parseable salary get None values.
+        """
+        parsed = self.parse_value(job.get("salary"))
+        job["salary_min"] = parsed["min"] if parsed else None
+        job["salary_max"] = parsed["max"] if parsed else None
+        job["salary_confidence"] = parsed["confidence"] if parsed else None
+        return parsed
+
+    @staticmethod
+    def _is_marked(match: re.Match) -> bool:
+        """Whether an amount carries a currency or a k/m multiplier."""
+        return bool(match.group("currency") or match.group("multiplier"))
+
+    @staticmethod
+    def _to_number(number: str) -> Optional[float]:
+        """Convert "120,000", "120.000", "120 000", "12,00,000" or "55.50" to a float."""
+
+        parts = re.split(r"[,.\s]", number)
+        if len(parts) > 1 and all(len(part) == 3 for part in parts[1:]):
+            return float("".join(parts))
+        try:
+            return float(number.replace(",", ""))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _infer_period(amount: float) -> str:
+        """Guess the pay period of an amount without one."""
+
+        if amount < 500:
+            return "hour"
+        if amount < 20_000:
+            return "month"
+        return "year"
+
+class SalaryIndex:
+    """
+    Columnar store of normalized salaries for vectorized range queries and percentiles.
+
+    Each row is a job; jobs without a salary are kept as NaN so row indices line up
+    with the input jobs.
+    """
+
+    def __init__(self, normalizer: Optional[SalaryNormalizer] = None):
+        self.normalizer = normalizer or get_salary_normalizer()
+        self.job_ids: List[Any] = []
+        self.roles: List[str] = []  # role code -> role name
+        self.locations: List[str] = []  # location code -> location name
+        self._role_index: Dict[str, int] = {}
+        self._location_index: Dict[str, int] = {}
+
+        self._min = array('d')
+        self._max = array('d')
+        self._confidence = array('d')
+        self._role_codes = array('i')
+        self._location_codes = array('i')
+        self._arrays: Optional[Dict[str, np.ndarray]] = None
+
+    @classmethod
+    def from_jobs(cls, jobs: Iterable[Dict[str, Any]]) -> "SalaryIndex":
+        """Build an index from job dictionaries with salary, title and location."""
+
+        index = cls()
+        for job in jobs:
+            index.add_job(job)
+        return index
+
+    def add_job(self, job: Dict[str, Any]) -> int:
+        """
+        Append one job row.
+
+        Returns:
+            Row index of the job
+        """
+        parsed = self.normalizer.parse_value(job.get("salary"))
+
+        self._min.append(parsed["min"] if parsed else np.nan)
+        self._max.append(parsed["max"] if parsed else np.nan)
+        self._confidence.append(parsed["confidence"] if parsed else 0.0)
+        self._role_codes.append(self._code(job.get("title"), self.roles, self._role_index))
+        self._location_codes.append(self._code(job.get("location"), self.locations, self._location_index))
+        self.job_ids.append(job.get("job_id") or job.get("id"))
+        self._arrays = None
+
+        return len(self._min) - 1
+
+    @property
+    def num_jobs(self) -> int:
+        return len(self._min)
+
+    def in_range(self, min_salary: Optional[float] = None, max_salary: Optional[float] = None,
+                 min_confidence: float = 0.0) -> np.ndarray:
+        """
+        Get rows whose salary range overlaps [min_salary, max_salary].
+
+        Rows without a salary never match.
+
+        Returns:
+            Array of row indices
+        """
+        arrays = self._numpy()
+        mask = ~np.isnan(arrays["min"]) & (arrays["confidence"] >= min_confidence)
+        if min_salary is not None:
+            mask &= arrays["max"] >= min_salary
+        if max_salary is not None:
+            mask &= arrays["min"] <= max_salary
+        return np.flatnonzero(mask)
+
+    def percentiles(self, by: Optional[str] = None, q: Sequence[float] = (25, 50, 75),
+                    min_confidence: float = 0.0) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize salary midpoints overall or per group.
+
+        Args:
+            by: None for one overall summary, "role" or "location" for one per group
+            q: Percentiles to report
+            min_confidence: Ignore salaries parsed with less confidence
+
+        Returns:
+            Dictionary of group -> {"count": n, "p25": ..., "p50": ..., ...}
+        """
+        arrays = self._numpy()
+        midpoints = (arrays["min"] + arrays["max"]) / 2
+        mask = ~np.isnan(midpoints) & (arrays["confidence"] >= min_confidence)
+
+        if by is None:
+            return {"all": self._summarize(midpoints[mask], q)}
+        if by not in ("role", "location"):
+            raise ValueError(f"Unknown grouping '{by}' (expected 'role' or 'location')")
+
+        codes = arrays["role_codes"] if by == "role" else arrays["location_codes"]
+        names = self.roles if by == "role" else self.locations
+
+        # One sort groups all rows of a code together
+        codes, values = codes[mask], midpoints[mask]
+        order = np.argsort(codes, kind="stable")
+        codes, values = codes[order], values[order]
+        boundaries = np.flatnonzero(np.diff(codes)) + 1
+
+        summary = {}
+        for group_codes, group_values in zip(np.split(codes, boundaries), np.split(values, boundaries)):
+            if len(group_codes):
+                summary[names[group_codes[0]]] = self._summarize(group_values, q)
+        return summary
+
+    def _numpy(self) -> Dict[str, np.ndarray]:
+        """NumPy copies of the columns (cached until the next ``add_job``)."""
+
+        if self._arrays is None:
+            self._arrays = {
+                "min": np.array(self._min, dtype=np.float64),
+                "max": np.array(self._max, dtype=np.float64),
+                "confidence": np.array(self._confidence, dtype=np.float64),
+                "role_codes": np.array(self._role_codes, dtype=np.int32),
+                "location_codes": np.array(self._location_codes, dtype=np.int32)
+            }
+        return self._arrays
+
+    @staticmethod
+    def _summarize(values: np.ndarray, q: Sequence[float]) -> Dict[str, Any]:
+        """Count and percentiles of salary midpoints."""
+
+        summary: Dict[str, Any] = {"count": int(len(values))}
+        if len(values):
+            for percentile, value in zip(q, np.percentile(values, q)):
+                summary[f"p{percentile:g}"] = round(float(value), 2)
+        return summary
+
+    @staticmethod
+    def _code(name: Optional[str], names: List[str], index: Dict[str, int]) -> int:
+        """Get the code of a role or location, adding it when new."""
+
+        name = (name or "unknown").strip().lower() or "unknown"
+        if name not in index:
+            index[name] = len(names)
+            names.append(name)
+        return index[name]
+
+@lru_cache(maxsize=1)
+def get_salary_normalizer() -> SalaryNormalizer:
+    """Get the shared normalizer (its parse cache is shared by every caller)."""
+    return SalaryNormalizer()
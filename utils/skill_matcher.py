@@ -0,0 +1,139 @@
+"""
+Skill matching utilities shared by job description, resume and report skill extraction.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+
+# Shared skill taxonomy: category -> canonical lowercase skill names
+SKILL_TAXONOMY: Dict[str, List[str]] = {
+    "programming_languages": [
+        "python", "java", "javascript", "typescript", "c++", "c#", "go", "rust", "php", "ruby",
+        "swift", "kotlin", "scala", "r", "matlab", "sql", "html", "css", "bash", "powershell"
+    ],
+    "frameworks": [
+        "django", "flask", "fastapi", "react", "angular", "vue", "node.js", "express", "spring",
+        "laravel", "rails", "asp.net", "dotnet", "flutter", "react native", "xamarin",
+        "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy", "jquery"
+    ],
+    "databases": [
+        "postgresql", "mysql", "mongodb", "redis", "elasticsearch", "dynamodb", "sqlite", "oracle",
+        "sql server", "mariadb", "cassandra", "neo4j", "influxdb", "firebase", "supabase"
+    ],
+    "cloud_platforms": [
+        "aws", "amazon web services", "azure", "gcp", "google cloud", "docker", "kubernetes",
+        "terraform", "ansible", "chef", "puppet", "heroku", "digitalocean", "linode", "vultr", "cloudflare"
+    ],
+    "tools": [
+        "git", "jenkins", "gitlab", "github actions", "gitlab ci", "jira", "confluence", "slack", "teams",
+        "zoom", "figma", "sketch", "adobe", "adobe creative suite", "postman", "swagger", "kibana",
+        "grafana", "prometheus", "nagios", "zabbix"
+    ],
+    "methodologies": [
+        "agile", "scrum", "kanban", "waterfall", "devops", "ci/cd", "tdd", "bdd", "lean"
+    ]
+}
+
+class SkillMatcher:
+    """Finds every taxonomy skill in a text with a single compiled regular expression."""
+
+    def __init__(self, taxonomy: Optional[Dict[str, List[str]]] = None):
+        self.taxonomy = taxonomy or SKILL_TAXONOMY
+
+        # First category wins for skills listed twice
+        self.skill_categories: Dict[str, str] = {}
+        for category, skills in self.taxonomy.items():
+            for skill in skills:
+                self.skill_categories.setdefault(skill.lower(), category)
+
+        # The alternation is factored into a prefix trie so the regex engine tries a handful
+        # of branches per position instead of every skill. Optional suffixes are greedy, so
+        # the longest skill wins ("react native" over "react", "c++" over "c").
+        # Boundaries treat + and # as word characters so "c" never matches inside "c++"/"c#",
+        # while punctuation such as the dot in "node.js" stays part of the skill.
+        body = self._build_trie_pattern(self.skill_categories)
+        self.pattern = re.compile(r"(?<![\w+#])" + body + r"(?![\w+#])")
+        # Used when lowercasing changes the text length, so offsets stay valid
+        self.pattern_ignorecase = re.compile(self.pattern.pattern, re.IGNORECASE)
+
+    def find_all(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Find all skill mentions in one pass.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            List of dictionaries with skill, category, start and end offsets
+        """
+        if not text:
+            return []
+
+        # Matching lowercased text is much faster than an IGNORECASE pattern
+        text_lower = text.lower()
+        if len(text_lower) == len(text):
+            found = self.pattern.finditer(text_lower)
+        else:
+            found = self.pattern_ignorecase.finditer(text)
+
+        matches = []
+        for match in found:
+            skill = match.group().lower()
+            matches.append({
+                "skill": skill,
+                "category": self.skill_categories.get(skill, "other"),
+                "start": match.start(),
+                "end": match.end()
+            })
+        return matches
+
+    def find_skills(self, text: str) -> List[str]:
+        """Get the distinct skills mentioned in a text, in order of first mention."""
+
+        return list(dict.fromkeys(match["skill"] for match in self.find_all(text)))
+
+    def categorize(self, skill: str) -> str:
+        """
+        Get the category of a skill name.
+
+        Exact taxonomy names are looked up directly; longer names such as
+        "python programming" are categorized by the first skill they contain.
+
+        Returns:
+            Category name, or "other" if no known skill is found
+        """
+        skill_lower = (skill or "").lower().strip()
+
+        if skill_lower in self.skill_categories:
+            return self.skill_categories[skill_lower]
+
+        matches = self.find_all(skill_lower)
+        return matches[0]["category"] if matches else "other"
+
+    @staticmethod
+    def _build_trie_pattern(skills) -> str:
+        """Build a regex alternation factored by common prefixes."""
+
+        trie: Dict[str, Any] = {}
+        for skill in skills:
+            node = trie
+            for char in skill:
+                node = node.setdefault(char, {})
+            node[""] = True
+
+        def build(node: Dict[str, Any]) -> str:
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ""
+            is_end = "" in node
+            if len(branches) == 1 and not is_end:
+                return branches[0]
+            return "(?:" + "|".join(branches) + ")" + ("?" if is_end else "")
+
+        return build(trie)
+
+@lru_cache(maxsize=1)
+def get_skill_matcher() -> SkillMatcher:
+    """Get the shared matcher built from SKILL_TAXONOMY (compiled once per process)."""
+    return SkillMatcher()
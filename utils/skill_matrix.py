@@ -0,0 +1,276 @@
+"""
+Skill matrix utilities for vectorized skill statistics across many jobs.
+"""
+
+from array import array
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+import numpy as np
+import scipy.sparse as sp
+from utils.skill_matcher import SKILL_TAXONOMY, get_skill_matcher
+
+class SkillMatrix:
+    """
+    Sparse jobs x skills matrix built incrementally as job descriptions are analyzed.
+
+    Each row is a job and each column a canonical (lowercase) skill. Cell values
+    count how often a job lists the skill (e.g. 2 when it is both required and
+    preferred). Aggregates are computed with NumPy/SciPy instead of Python loops.
+    """
+
+    def __init__(self):
+        self.skills: List[str] = []  # column -> skill name
+        self.skill_index: Dict[str, int] = {}  # skill name -> column
+        self.sources: List[str] = []  # source code -> source name
+        self.source_index: Dict[str, int] = {}
+        self.job_ids: List[Any] = []
+
+        # CSR arrays grown in place; materialized on demand
+        self._indptr = array('q', [0])
+        self._indices = array('i')
+        self._data = array('i')
+        self._row_sources = array('i')
+
+        self._categories = array('i')  # column -> category code
+        self.category_names: List[str] = list(SKILL_TAXONOMY) + ["other"]
+        self._category_codes = {name: code for code, name in enumerate(self.category_names)}
+
+        # NumPy copies of the arrays above (the growable arrays cannot be viewed while they grow)
+        self._arrays: Optional[Dict[str, np.ndarray]] = None
+        self._csr: Optional[sp.csr_matrix] = None
+
+    @classmethod
+    def from_applications(cls, applications: List[Dict[str, Any]]) -> "SkillMatrix":
+        """
+        Build a matrix from stored application rows.
+
+        Required skills are read from ``skill_analysis.required_skills`` (names or
+        ``{"skill": ...}`` dictionaries) and the source from ``platform``.
+        """
+        matrix = cls()
+        for application in applications:
+            skill_analysis = application.get("skill_analysis") or {}
+            skills = []
+            if isinstance(skill_analysis, dict):
+                for skill in skill_analysis.get("required_skills", []):
+                    skills.append(skill.get("skill", "") if isinstance(skill, dict) else str(skill))
+            matrix.add_job(skills, source=application.get("platform"),
+                           job_id=application.get("job_id") or application.get("id"))
+        return matrix
+
+    def add_job(self, skills: Iterable[str], source: Optional[str] = None, job_id: Any = None) -> int:
+        """
+        Append one job row.
+
+        Args:
+            skills: Skill names (repeats increase the cell count)
+            source: Job source such as "linkedin" (used for slicing)
+            job_id: Optional identifier kept alongside the row
+
+        Returns:
+            Row index of the job
+        """
+        counts: Dict[int, int] = {}
+        for skill in skills:
+            skill = (skill or "").strip().lower()
+            if skill:
+                column = self._column(skill)
+                counts[column] = counts.get(column, 0) + 1
+
+        self._indices.extend(counts.keys())
+        self._data.extend(counts.values())
+        self._indptr.append(len(self._indices))
+        self._row_sources.append(self._source_code(source))
+        self.job_ids.append(job_id)
+        self._arrays = None
+        self._csr = None
+
+        return len(self._indptr) - 2
+
+    @property
+    def num_jobs(self) -> int:
+        return len(self._indptr) - 1
+
+    @property
+    def num_skills(self) -> int:
+        return len(self.skills)
+
+    def to_csr(self) -> sp.csr_matrix:
+        """Get the matrix as a SciPy CSR matrix (cached until the next ``add_job``)."""
+
+        if self._csr is None:
+            arrays = self._numpy()
+            self._csr = sp.csr_matrix(
+                (arrays["data"], arrays["indices"], arrays["indptr"]),
+                shape=(self.num_jobs, self.num_skills)
+            )
+        return self._csr
+
+    def frequency(self, weighted: bool = False, source: Optional[str] = None) -> np.ndarray:
+        """
+        Get per-skill totals.
+
+        Args:
+            weighted: Count every mention instead of the number of jobs
+            source: Only count jobs from this source
+
+        Returns:
+            Array indexed by skill column
+        """
+        arrays = self._numpy()
+        indices, data = arrays["indices"], arrays["data"]
+
+        if source is not None:
+            mask = self._entry_mask(source)
+            indices, data = indices[mask], data[mask]
+
+        weights = data if weighted else None
+        return np.bincount(indices, weights=weights, minlength=self.num_skills).astype(np.int64)
+
+    def frequency_dict(self, weighted: bool = False, source: Optional[str] = None) -> Dict[str, int]:
+        """Get per-skill totals as a dictionary in first-seen order (zero counts omitted)."""
+
+        counts = self.frequency(weighted, source)
+        return {self.skills[column]: int(counts[column]) for column in np.flatnonzero(counts)}
+
+    def top_k(self, k: int = 10, weighted: bool = False, source: Optional[str] = None) -> List[Tuple[str, int]]:
+        """
+        Get the k most frequent skills.
+
+        Ties keep first-seen order, like a stable sort of a frequency dictionary.
+
+        Returns:
+            List of (skill, count) tuples
+        """
+        counts = self.frequency(weighted, source)
+        columns = self._top_columns(counts, k)
+        return [(self.skills[column], int(counts[column])) for column in columns]
+
+    def co_occurrence(self, source: Optional[str] = None) -> sp.csr_matrix:
+        """Get the skills x skills matrix of jobs listing both skills (diagonal = job count)."""
+
+        binary = self._binary(source)
+        return (binary.T @ binary).tocsr()
+
+    def co_occurring(self, skill: str, k: int = 10, source: Optional[str] = None) -> List[Tuple[str, int]]:
+        """
+        Get the skills most often listed together with a skill.
+
+        Returns:
+            List of (skill, jobs listing both) tuples
+        """
+        column = self.skill_index.get((skill or "").strip().lower())
+        if column is None:
+            return []
+
+        binary = self._binary(source)
+        rows = binary[:, column].nonzero()[0]
+        counts = np.asarray(binary[rows].sum(axis=0)).ravel()
+        counts[column] = 0
+
+        return [(self.skills[c], int(counts[c])) for c in self._top_columns(counts, k)]
+
+    def top_pairs(self, k: int = 10, source: Optional[str] = None) -> List[Tuple[str, str, int]]:
+        """Get the k skill pairs listed together in the most jobs."""
+
+        pairs = sp.triu(self.co_occurrence(source), k=1).tocoo()
+        if pairs.nnz == 0:
+            return []
+
+        order = np.lexsort((pairs.col, pairs.row, -pairs.data))[:k]
+        return [(self.skills[pairs.row[i]], self.skills[pairs.col[i]], int(pairs.data[i])) for i in order]
+
+    def category_breakdown(self, source: Optional[str] = None) -> Dict[str, List[str]]:
+        """Group the skills present (optionally in one source) by taxonomy category."""
+
+        present = np.flatnonzero(self.frequency(source=source))
+        categories = self._numpy()["categories"][present]
+
+        breakdown: Dict[str, List[str]] = {}
+        for column, code in zip(present, categories):
+            breakdown.setdefault(self.category_names[code], []).append(self.skills[column])
+        return breakdown
+
+    def category_totals(self, weighted: bool = False, source: Optional[str] = None) -> Dict[str, int]:
+        """Get total skill counts per category."""
+
+        categories = self._numpy()["categories"]
+        totals = np.bincount(categories, weights=self.frequency(weighted, source),
+                             minlength=len(self.category_names))
+        return {name: int(totals[code]) for code, name in enumerate(self.category_names) if totals[code]}
+
+    def source_counts(self) -> Dict[str, int]:
+        """Get the number of jobs from each source."""
+
+        counts = np.bincount(self._numpy()["row_sources"], minlength=len(self.sources))
+        return {source: int(counts[code]) for code, source in enumerate(self.sources)}
+
+    def _numpy(self) -> Dict[str, np.ndarray]:
+        """Get NumPy copies of the growable arrays (cached until the next change)."""
+
+        if self._arrays is None:
+            self._arrays = {
+                "indptr": np.frombuffer(self._indptr, dtype=np.int64).copy(),
+                "indices": np.frombuffer(self._indices, dtype=np.int32).copy(),
+                "data": np.frombuffer(self._data, dtype=np.int32).copy(),
+                "row_sources": np.frombuffer(self._row_sources, dtype=np.int32).copy(),
+                "categories": np.frombuffer(self._categories, dtype=np.int32).copy()
+            }
+        return self._arrays
+
+    def _column(self, skill: str) -> int:
+        """Get the column of a skill, adding it with its category on first sight."""
+
+        column = self.skill_index.get(skill)
+        if column is None:
+            column = len(self.skills)
+            self.skill_index[skill] = column
+            self.skills.append(skill)
+            self._categories.append(self._category_codes[get_skill_matcher().categorize(skill)])
+        return column
+
+    def _source_code(self, source: Optional[str]) -> int:
+        """Get the code of a source name, adding it on first sight."""
+
+        source = (source or "unknown").lower()
+        code = self.source_index.get(source)
+        if code is None:
+            code = len(self.sources)
+            self.source_index[source] = code
+            self.sources.append(source)
+        return code
+
+    def _row_mask(self, source: str) -> np.ndarray:
+        """Boolean mask of the rows from a source."""
+
+        code = self.source_index.get((source or "unknown").lower(), -1)
+        return self._numpy()["row_sources"] == code
+
+    def _entry_mask(self, source: str) -> np.ndarray:
+        """Boolean mask of the stored entries that belong to rows from a source."""
+
+        row_lengths = np.diff(self._numpy()["indptr"])
+        return np.repeat(self._row_mask(source), row_lengths)
+
+    def _binary(self, source: Optional[str]) -> sp.csr_matrix:
+        """Get the 0/1 presence matrix, optionally restricted to one source."""
+
+        matrix = self.to_csr()
+        if source is not None:
+            matrix = matrix[self._row_mask(source)]
+
+        binary = matrix.copy()
+        binary.data = np.ones_like(binary.data)
+        return binary
+
+    @staticmethod
+    def _top_columns(counts: np.ndarray, k: int) -> np.ndarray:
+        """Get the columns of the k largest non-zero counts, ties broken by column."""
+
+        candidates = np.flatnonzero(counts)
+        if k < len(candidates):
+            # Keep every column tied with the k-th largest count so tie-breaking stays stable
+            threshold = np.partition(counts[candidates], len(candidates) - k)[len(candidates) - k]
+            candidates = candidates[counts[candidates] >= threshold]
+
+        order = np.lexsort((candidates, -counts[candidates]))
+        return candidates[order][:k]
@@ -0,0 +1,430 @@
+"""
+Structured output utilities for schema-validated, streamed JSON responses from the LLM.
+"""
+
+import re
+import json
+import time
+import asyncio
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Callable
+import openai
+from config import Config
+from utils.llm_scheduler import LLMScheduler, get_llm_scheduler
+
+# Response schema of resume optimization (strict mode: every property required, no extras)
+OPTIMIZATION_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "optimized_summary": {"type": "string"},
+        "enhanced_experience": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string"},
+                    "company": {"type": "string"},
+                    "description": {"type": "string"},
+                    "achievements": {"type": "array", "items": {"type": "string"}}
+                },
+                "required": ["title", "company", "description", "achievements"],
+                "additionalProperties": False
+            }
+        },
+        "skills_section": {
+            "type": "object",
+            "properties": {
+                "technical_skills": {"type": "array", "items": {"type": "string"}},
+                "core_competencies": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["technical_skills", "core_competencies"],
+            "additionalProperties": False
+        },
+        "keywords_added": {"type": "array", "items": {"type": "string"}},
+        "modifications_summary": {"type": "array", "items": {"type": "string"}},
+        "ats_optimization_tips": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": [
+        "optimized_summary", "enhanced_experience", "skills_section",
+        "keywords_added", "modifications_summary", "ats_optimization_tips"
+    ],
+    "additionalProperties": False
+}
+
+# Models that accept response_format json_schema; json_object models only guarantee valid JSON
+JSON_SCHEMA_MODEL_PREFIXES = ("gpt-4o", "gpt-4.1", "gpt-5", "o1", "o3", "o4")
+JSON_OBJECT_MODEL_PREFIXES = ("gpt-4-turbo", "gpt-4-1106", "gpt-4-0125", "gpt-3.5-turbo")
+
+# Give up on a streamed response that has not started a JSON object after this many characters
+MAX_PREAMBLE_CHARS = 400
+
+JSON_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "boolean": bool,
+    "null": type(None)
+}
+
+def schema_errors(value: Any, schema: Dict[str, Any], path: str = "") -> List[str]:
+    """
+    Validate a value against the JSON Schema subset used here (type, properties, required, items).
+
+    Returns:
+        One message per problem, prefixed with its path (empty when valid)
+    """
+    expected = schema.get("type")
+    if expected in ("number", "integer"):
+        valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+    else:
+        valid = expected is None or isinstance(value, JSON_TYPES[expected])
+    if not valid:
+        return [f"{path or 'response'}: expected {expected}, got {type(value).__name__}"]
+
+    errors = []
+    if expected == "object":
+        for key in schema.get("required", []):
+            if key not in value:
+                errors.append(f"{path}.{key}: missing" if path else f"{key}: missing")
+        for key, child in schema.get("properties", {}).items():
+            if key in value:
+                errors.extend(schema_errors(value[key], child, f"{path}.{key}" if path else key))
+    elif expected == "array" and "items" in schema:
+        for index, item in enumerate(value):
+            errors.extend(schema_errors(item, schema["items"], f"{path}[{index}]"))
+    return errors
+
+class IncrementalJSONParser:
+    """
+    Parses the top-level fields of a JSON object while it is streamed.
+
+    Text before the opening brace (such as a markdown fence) is skipped. A field
+    is returned by feed() as soon as its value is closed, so it can be validated
+    and used before the rest of the response arrives.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.position = 0
+        self.started = False
+        self.finished = False
+        self.malformed: List[str] = []  # Raw members that were not valid JSON
+
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member_start = 0
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Add streamed text.
+
+        Returns:
+            (key, value) pairs of the fields completed by this chunk
+        """
+        self.text += chunk
+        completed = []
+        text = self.text
+
+        while self.position < len(text) and not self.finished:
+            char = text[self.position]
+
+            if not self.started:
+                if char == "{":
+                    self.started = True
+                    self._depth = 1
+                    self._member_start = self.position + 1
+            elif self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.finished = True
+                    completed.extend(self._member(text[self._member_start:self.position]))
+            elif char == "," and self._depth == 1:
+                completed.extend(self._member(text[self._member_start:self.position]))
+                self._member_start = self.position + 1
+
+            self.position += 1
+
+        return completed
+
+    @property
+    def preamble_too_long(self) -> bool:
+        """Whether the response has gone on too long without starting a JSON object."""
+
+        return not self.started and len(self.text) > MAX_PREAMBLE_CHARS
+
+    def _member(self, raw: str) -> List[Tuple[str, Any]]:
+        """Parse one '"key": value' member."""
+
+        if not raw.strip():
+            return []
+        try:
+            return list(json.loads("{" + raw + "}").items())
+        except json.JSONDecodeError:
+            self.malformed.append(raw.strip()[:80])
+            return []
+
+class StructuredOutputError(RuntimeError):
+    """
+    Raised when a response is still invalid after the repair attempts, or was
+    cancelled for running past its time budget.
+
+    fields holds the top-level fields that were valid, so a caller can keep them
+    and fill in the rest.
+    """
+
+    def __init__(self, message: str, fields: Optional[Dict[str, Any]] = None, cancelled: bool = False):
+        super().__init__(message)
+        self.fields = fields or {}
+        self.cancelled = cancelled
+
+class StructuredOutput:
+    """
+    Requests JSON that follows a schema and repairs only what is wrong.
+
+    Models that support it are constrained with response_format json_schema.
+    Responses are streamed and parsed field by field, and each field is validated
+    as soon as it closes. A failed response is not discarded: delimited strings
+    in list fields are split locally, and anything else still missing or invalid
+    is asked for again in one small repair request. A streamed generation that
+    runs past its time budget is cancelled, keeping the fields received so far.
+    """
+
+    def __init__(self, name: str, schema: Dict[str, Any], scheduler: Optional[LLMScheduler] = None,
+                 streaming: Optional[bool] = None, repair_attempts: Optional[int] = None,
+                 stream_timeout: Optional[float] = None):
+        self.name = name
+        self.schema = schema
+        self.scheduler = scheduler or get_llm_scheduler()
+        self.streaming = Config.LLM_STREAMING if streaming is None else streaming
+        self.repair_attempts = Config.LLM_REPAIR_ATTEMPTS if repair_attempts is None else repair_attempts
+        self.stream_timeout = Config.LLM_STREAM_TIMEOUT if stream_timeout is None else stream_timeout
+        self.stats: Dict[str, Any] = self._empty_stats()
+
+    async def generate(self, client: openai.AsyncOpenAI, model: str, messages: List[Dict[str, str]],
+                       on_field: Optional[Callable[[str, Any], None]] = None, timeout: Optional[float] = None,
+                       **params) -> Dict[str, Any]:
+        """
+        Get a schema-valid object from the model.
+
+        Args:
+            client: OpenAI client of the caller
+            model: Model name
+            messages: Chat messages (the schema should also be described in the prompt)
+            on_field: Called with (key, value) for each valid top-level field as soon as it is parsed
+            timeout: Seconds before a streamed generation and its repairs are cancelled
+                (default: the configured stream timeout, 0 = no limit)
+            **params: Other create() arguments (max_tokens, temperature, ...)
+
+        Returns:
+            The parsed object with every schema field valid
+
+        Raises:
+            StructuredOutputError: The response is still invalid after the repair attempts,
+                or was cancelled at the timeout with fields still missing
+        """
+        self.stats["requests"] += 1
+        start_time = time.perf_counter()
+        request_params = {**params, **self._response_format(model)}
+        timeout = self.stream_timeout if timeout is None else timeout
+        deadline = start_time + timeout if timeout and self.streaming else None
+
+        fields, raw = await self._request(client, model, messages, request_params, on_field, deadline)
+        errors = self._field_errors(fields)
+        first_pass_valid = not errors
+        if errors:
+            errors = self._coerce(fields, errors, on_field)
+
+        for _ in range(self.repair_attempts):
+            if not errors or (deadline and time.perf_counter() >= deadline):
+                break
+            self.stats["repair_requests"] += 1
+            repair_messages = messages + [
+                {"role": "assistant", "content": raw or "(no JSON object)"},
+                {"role": "user", "content": self._repair_prompt(errors)}
+            ]
+            repaired, raw = await self._request(client, model, repair_messages, request_params, on_field,
+                                                deadline, only=set(errors))
+            fields.update(repaired)
+            errors = self._field_errors(fields)
+
+        elapsed = time.perf_counter() - start_time
+        if errors:
+            valid = {key: value for key, value in fields.items() if key not in errors}
+            if deadline and time.perf_counter() >= deadline:
+                # Running out of time budget is not a parse failure
+                self.stats["cancelled"] += 1
+                raise StructuredOutputError(
+                    f"{self.name} generation cancelled after {elapsed:.1f}s with {len(errors)} field(s) incomplete",
+                    valid, cancelled=True
+                )
+            self.stats["failed"] += 1
+            self.stats["wasted_seconds"] += elapsed
+            raise StructuredOutputError(
+                f"{self.name} response invalid after {self.repair_attempts} repair attempt(s): "
+                + "; ".join(message for field_errors in errors.values() for message in field_errors),
+                valid
+            )
+
+        if not first_pass_valid:
+            self.stats["repaired"] += 1
+        return {key: fields[key] for key in self.schema.get("properties", {}) if key in fields}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get this run's parse statistics.
+
+        Returns:
+            Dictionary with requests, valid_first_pass, repaired, failed,
+            cancelled (generations stopped at the timeout, counted in none of
+            the other outcomes), repair_requests, coerced (fields fixed locally),
+            parse_failure_rate (percent of requests whose first response was
+            invalid), failure_rate (percent still invalid after repair) and
+            wasted_seconds
+        """
+        requests = self.stats["requests"]
+        first_pass_failures = self.stats["repaired"] + self.stats["failed"]
+        return {
+            **self.stats,
+            "valid_first_pass": requests - self.stats["cancelled"] - first_pass_failures,
+            "parse_failure_rate": round(first_pass_failures / requests * 100, 1) if requests else 0.0,
+            "failure_rate": round(self.stats["failed"] / requests * 100, 1) if requests else 0.0,
+            "wasted_seconds": round(self.stats["wasted_seconds"], 2)
+        }
+
+    async def _request(self, client: openai.AsyncOpenAI, model: str, messages: List[Dict[str, str]],
+                       params: Dict[str, Any], on_field: Optional[Callable[[str, Any], None]],
+                       deadline: Optional[float] = None, only: Optional[set] = None) -> Tuple[Dict[str, Any], str]:
+        """
+        Send one request and collect its top-level fields.
+
+        A stream still running at the deadline is closed, which cancels the
+        generation; the fields completed before then are kept.
+
+        Returns:
+            Tuple of (fields, raw response text)
+        """
+        parser = IncrementalJSONParser()
+        fields: Dict[str, Any] = {}
+
+        def accept(completed: List[Tuple[str, Any]]) -> None:
+            for key, value in completed:
+                if key not in self.schema.get("properties", {}) or (only is not None and key not in only):
+                    continue
+                fields[key] = value
+                # Validated as soon as the field closes, so valid sections can be used early
+                if on_field and not schema_errors(value, self.schema["properties"][key], key):
+                    on_field(key, value)
+
+        async def consume() -> None:
+            stream = self.scheduler.stream(client, model, messages, **params)
+            try:
+                async for delta in stream:
+                    # After the closing brace the stream is only read to its end, which
+                    # carries the server's token usage
+                    if parser.finished:
+                        continue
+                    accept(parser.feed(delta))
+                    # Prose instead of JSON: stop paying for it and go straight to repair
+                    if parser.preamble_too_long:
+                        break
+            finally:
+                await stream.aclose()
+
+        if self.streaming:
+            if deadline:
+                try:
+                    await asyncio.wait_for(consume(), max(0.0, deadline - time.perf_counter()))
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await consume()
+        else:
+            response = await self.scheduler.complete(client, model, messages, **params)
+            accept(parser.feed(response.choices[0].message.content or ""))
+
+        return fields, parser.text
+
+    def _field_errors(self, fields: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Get the validation errors of each missing or invalid top-level field."""
+
+        errors: Dict[str, List[str]] = {}
+        for key, child in self.schema.get("properties", {}).items():
+            if key not in fields:
+                if key in self.schema.get("required", []):
+                    errors[key] = [f"{key}: missing"]
+                continue
+            field_errors = schema_errors(fields[key], child, key)
+            if field_errors:
+                errors[key] = field_errors
+        return errors
+
+    def _coerce(self, fields: Dict[str, Any], errors: Dict[str, List[str]],
+                on_field: Optional[Callable[[str, Any], None]]) -> Dict[str, List[str]]:
+        """
+        Fix a string list returned as one delimited string locally instead of asking again.
+
+        Returns:
+            The errors that remain
+        """
+        remaining = {}
+        for key, field_errors in errors.items():
+            child = self.schema["properties"][key]
+            value = fields.get(key)
+            if isinstance(value, str) and child.get("type") == "array" and child.get("items", {}).get("type") == "string":
+                fields[key] = [item.strip() for item in re.split(r"[,;\n]", value) if item.strip()]
+                self.stats["coerced"] += 1
+                if on_field:
+                    on_field(key, fields[key])
+                continue
+            remaining[key] = field_errors
+        return remaining
+
+    def _repair_prompt(self, errors: Dict[str, List[str]]) -> str:
+        """Ask for only the fields that were missing or invalid."""
+
+        subschema = {
+            "type": "object",
+            "properties": {key: self.schema["properties"][key] for key in errors},
+            "required": list(errors)
+        }
+        problems = "\n".join(f"- {message}" for messages in errors.values() for message in messages)
+        return (
+            f"These fields of your response were missing or invalid:\n{problems}\n\n"
+            f"Reply with a JSON object containing only these fields, following this schema exactly:\n"
+            f"{json.dumps(subschema)}"
+        )
+
+    def _response_format(self, model: str) -> Dict[str, Any]:
+        """Strongest response_format the model supports."""
+
+        if model.startswith(JSON_SCHEMA_MODEL_PREFIXES):
+            return {"response_format": {
+                "type": "json_schema",
+                "json_schema": {"name": self.name, "strict": True, "schema": self.schema}
+            }}
+        if model.startswith(JSON_OBJECT_MODEL_PREFIXES):
+            return {"response_format": {"type": "json_object"}}
+        return {}
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        """Zeroed run counters."""
+        return {"requests": 0, "repaired": 0, "failed": 0, "cancelled": 0, "repair_requests": 0, "coerced": 0,
+                "wasted_seconds": 0.0}
+
+@lru_cache(maxsize=1)
+def get_optimization_output() -> StructuredOutput:
+    """Get the structured output handler for resume optimization responses."""
+    return StructuredOutput("resume_optimization", OPTIMIZATION_SCHEMA)
@@ -115,6 +115,30 @@ class SupabaseDatabase:
             print(f"Error getting applications: {e}")
             return []
     
+    def get_applied_jobs(self, page_size: int = 1000) -> List[Dict[str, Any]]:
+        """Get identifying fields of every application that did not fail."""
+        
+        applied_jobs = []
+        offset = 0
+        
+        try:
+            while True:
+                result = self.supabase.table("applications").select(
+                    "job_url, job_title, company_name, job_data"
+                ).neq("application_status", "error").range(offset, offset + page_size - 1).execute()
+                
+                rows = result.data if result.data else []
+                applied_jobs.extend(rows)
+                
+                if len(rows) < page_size:
+                    break
+                offset += page_size
+            
+            return applied_jobs
+        except Exception as e:
+            print(f"Error getting applied jobs: {e}")
+            return applied_jobs
+    
     def get_application_statistics(self, days: int = 30) -> Dict[str, Any]:
         """Get application statistics for the last N days."""
         
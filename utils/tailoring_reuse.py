@@ -0,0 +1,203 @@
+"""
+Tailoring reuse utilities for tailoring a resume once per cluster of near-duplicate job descriptions.
+"""
+
+import os
+import copy
+import json
+import math
+import asyncio
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple
+from config import Config
+from utils.analysis_cache import content_fingerprint
+from utils.applied_job_index import normalize_company_title
+
+def requirement_vector(skill_gaps: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Requirement vector of a job: each required skill weighted by how strongly the JD asks for it.
+
+    Args:
+        skill_gaps: Skill gap analysis (missing_skills and matching_skills carry the
+            required skills with their confidence)
+
+    Returns:
+        Dictionary of lowercased skill to weight
+    """
+    vector = {}
+    for skill in skill_gaps.get("missing_skills", []) + skill_gaps.get("matching_skills", []):
+        weight = skill.get("confidence", skill.get("required_confidence", 0.7))
+        name = skill.get("skill", "").lower()
+        if name:
+            vector[name] = max(weight, vector.get(name, 0))
+    return vector
+
+def cosine_similarity(a: Dict[str, float], b: Dict[str, float]) -> float:
+    """Cosine similarity of two sparse vectors (0 when either is empty)."""
+
+    if not a or not b:
+        return 0.0
+    dot = sum(weight * b[key] for key, weight in a.items() if key in b)
+    norm = math.sqrt(sum(w * w for w in a.values())) * math.sqrt(sum(w * w for w in b.values()))
+    return dot / norm if norm else 0.0
+
+class TailoringReuseIndex:
+    """
+    Clusters of near-duplicate job descriptions that share one tailored resume.
+
+    The same role at the same company is often posted for several locations or on
+    several boards with near-identical descriptions. Jobs are grouped by resume and
+    normalized company and title (tailored content names the role), and within a
+    group a job joins the most similar cluster when the founding job's requirement
+    vector is at least TAILORING_REUSE_THRESHOLD cosine-similar to its own. The
+    founding job is tailored, and when the LLM produced its content every later
+    member gets a copy of it (and so the same content-addressed resume file);
+    fallback content drops the cluster so members tailor themselves. Members
+    arriving while the founding job is still being tailored wait for it. Every
+    decision is appended to the audit log.
+    """
+
+    def __init__(self, threshold: Optional[float] = None, enabled: Optional[bool] = None,
+                 audit_path: Optional[str] = None):
+        self.threshold = Config.TAILORING_REUSE_THRESHOLD if threshold is None else threshold
+        self.enabled = Config.TAILORING_REUSE_ENABLED if enabled is None else enabled
+        self.audit_path = Config.TAILORING_REUSE_AUDIT_PATH if audit_path is None else audit_path
+
+        self._groups: Dict[str, List[Dict[str, Any]]] = {}
+        self.audit: List[Dict[str, Any]] = []
+        self.stats = {"jobs": 0, "clusters": 0, "tailored": 0, "reused": 0}
+
+    async def tailor(self, scope: str, job_title: str, company_name: str, skill_gaps: Dict[str, Any],
+                     build: Callable[[], Awaitable[Dict[str, Any]]], job_description: str = "",
+                     reuse: bool = True) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Get the tailored content for a job, reusing its cluster's content when there is one.
+
+        Args:
+            scope: Identity of the resume being tailored (its content hash)
+            job_title: Target job title
+            company_name: Company name
+            skill_gaps: Skill gap analysis of the job (source of the requirement vector)
+            build: Coroutine function that tailors the resume for this job
+            job_description: Job description text, fingerprinted in the audit log
+            reuse: False tailors this job even when it has a cluster (a forced fresh response)
+
+        Returns:
+            Tuple of the optimized content and the reuse decision (decision, cluster_id,
+            similarity, leader, reason)
+        """
+        vector = requirement_vector(skill_gaps)
+        group_key = normalize_company_title(company_name, job_title)
+        group = self._groups.setdefault(f"{scope}|{group_key}", []) if group_key else None
+
+        if not self.enabled or not reuse or group is None or not vector:
+            reason = ("reuse disabled" if not self.enabled else "fresh response requested" if not reuse
+                      else "no company or title" if group is None else "no requirements extracted")
+            content = await build()
+            return content, self._record("tailored", job_title, company_name, job_description, None, None, reason)
+
+        while True:
+            cluster, similarity = self._nearest(group, vector)
+            if cluster is None or similarity < self.threshold:
+                break
+
+            content = await asyncio.shield(cluster["future"])
+            if content is None:
+                # The founding job failed or fell back and its cluster was dropped; look again
+                continue
+            decision = self._record("reused", job_title, company_name, job_description, cluster, similarity,
+                                    f"{similarity:.3f} similar to {cluster['leader']}")
+            return copy.deepcopy(content), decision
+
+        cluster = {
+            "id": f"{content_fingerprint(scope, group_key)[:8]}-{len(group) + 1}",
+            "leader": f"{job_title} at {company_name}",
+            "vector": vector,
+            "future": asyncio.get_running_loop().create_future()
+        }
+        group.append(cluster)
+        self.stats["clusters"] += 1
+        try:
+            content = await build()
+        except BaseException:
+            self._drop(group, cluster)
+            raise
+
+        if content.get("source") != "ai":
+            # Fallback content (LLM error, timeout, routing skip, budget) is not a tailoring
+            # to share; members tailor themselves
+            self._drop(group, cluster)
+            reason = f"{content.get('source', 'unknown')} content is not shared"
+            return content, self._record("tailored", job_title, company_name, job_description, None, similarity, reason)
+
+        cluster["future"].set_result(copy.deepcopy(content))
+
+        reason = f"nearest cluster {similarity:.3f} similar" if similarity is not None else "first job of its role"
+        return content, self._record("tailored", job_title, company_name, job_description, cluster, similarity, reason)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get this run's reuse counts.
+
+        Returns:
+            Dictionary with jobs, clusters, tailored, reused and reuse_rate
+        """
+        jobs = self.stats["jobs"]
+        return {**self.stats, "reuse_rate": round(self.stats["reused"] / jobs * 100, 1) if jobs else 0.0}
+
+    def clear(self) -> None:
+        """Forget all clusters (the audit log file is kept)."""
+
+        self._groups.clear()
+
+    def _drop(self, group: List[Dict[str, Any]], cluster: Dict[str, Any]) -> None:
+        """Remove a cluster whose founding job produced nothing to share; waiting members look again."""
+
+        group.remove(cluster)
+        self.stats["clusters"] -= 1
+        cluster["future"].set_result(None)
+
+    def _nearest(self, group: List[Dict[str, Any]], vector: Dict[str, float]) -> Tuple[Optional[Dict[str, Any]], Optional[float]]:
+        """Most similar cluster of a group and its similarity."""
+
+        best, best_similarity = None, None
+        for cluster in group:
+            similarity = cosine_similarity(vector, cluster["vector"])
+            if best_similarity is None or similarity > best_similarity:
+                best, best_similarity = cluster, similarity
+        return best, best_similarity
+
+    def _record(self, decision: str, job_title: str, company_name: str, job_description: str,
+                cluster: Optional[Dict[str, Any]], similarity: Optional[float], reason: str) -> Dict[str, Any]:
+        """Count a decision and append it to the audit log."""
+
+        self.stats["jobs"] += 1
+        self.stats[decision] += 1
+        entry = {
+            "timestamp": datetime.now().isoformat(),
+            "decision": decision,
+            "job_title": job_title,
+            "company_name": company_name,
+            "description_hash": content_fingerprint(job_description) if job_description else None,
+            "cluster_id": cluster["id"] if cluster else None,
+            "leader": cluster["leader"] if cluster else None,
+            "similarity": round(similarity, 4) if similarity is not None else None,
+            "threshold": self.threshold,
+            "reason": reason
+        }
+        self.audit.append(entry)
+
+        if self.audit_path:
+            try:
+                os.makedirs(os.path.dirname(self.audit_path) or ".", exist_ok=True)
+                with open(self.audit_path, "a", encoding="utf-8") as file:
+                    file.write(json.dumps(entry) + "\n")
+            except OSError as e:
+                print(f"Warning: Could not write tailoring reuse audit log: {e}")
+        return entry
+
+@lru_cache(maxsize=1)
+def get_tailoring_reuse() -> TailoringReuseIndex:
+    """Get the reuse index configured from the tailoring reuse settings."""
+    return TailoringReuseIndex()
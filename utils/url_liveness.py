@@ -0,0 +1,152 @@
+"""
+Job URL liveness utilities for dropping expired postings before browser automation.
+"""
+
+import asyncio
+import aiohttp
+from typing import Dict, Any, List, Optional, Tuple
+from config import Config
+from job_config import JobConfig
+
+class URLLivenessChecker:
+    """Checks job URLs concurrently with lightweight HTTP requests."""
+
+    # Status codes that mean the posting is gone. Redirects, auth walls (401/403)
+    # and rate limiting (429) say nothing about the posting, so those jobs are kept.
+    DEAD_STATUS_CODES = {404, 410}
+
+    # Phrases job boards show on expired postings (matched case-insensitively)
+    CLOSED_MARKERS = [
+        "no longer accepting applications",
+        "this job is no longer available",
+        "this job has expired",
+        "job has been removed",
+        "position has been filled",
+        "this position is no longer open",
+        "job posting has expired"
+    ]
+
+    # Only the start of the page is scanned for markers
+    MAX_BODY_BYTES = 256 * 1024
+
+    def __init__(self, concurrency: Optional[int] = None, timeout: Optional[float] = None,
+                 check_markers: Optional[bool] = None):
+        self.concurrency = concurrency or Config.JOB_LIVENESS_CONCURRENCY
+        self.timeout = timeout or Config.JOB_LIVENESS_TIMEOUT
+        self.check_markers = Config.JOB_LIVENESS_CHECK_MARKERS if check_markers is None else check_markers
+
+    async def check_urls(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Check a batch of URLs concurrently.
+
+        Args:
+            urls: URLs to check
+
+        Returns:
+            Mapping of URL to its check result
+        """
+        unique_urls = list(dict.fromkeys(url for url in urls if url))
+        if not unique_urls:
+            return {}
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        async with aiohttp.ClientSession(timeout=timeout, headers={'User-Agent': JobConfig.USER_AGENT}) as session:
+
+            async def bounded_check(url: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.check_url(session, url)
+
+            results = await asyncio.gather(*[bounded_check(url) for url in unique_urls])
+
+        return dict(zip(unique_urls, results))
+
+    async def check_url(self, session: aiohttp.ClientSession, url: str) -> Dict[str, Any]:
+        """
+        Check whether a single job URL is still live.
+
+        A HEAD request is used unless closed-posting markers are checked, in which
+        case a GET reads the start of the page. HEAD falls back to GET when the
+        server does not support it.
+
+        Returns:
+            Dictionary with alive flag, status code, method and reason
+        """
+        method = "GET" if self.check_markers else "HEAD"
+
+        try:
+            status, body = await self._request(session, method, url)
+
+            if method == "HEAD" and status in (405, 501):
+                method = "GET"
+                status, body = await self._request(session, method, url)
+
+            if status in self.DEAD_STATUS_CODES:
+                return {"url": url, "alive": False, "status_code": status, "method": method,
+                        "reason": f"HTTP {status}"}
+
+            if body:
+                marker = self._find_closed_marker(body)
+                if marker:
+                    return {"url": url, "alive": False, "status_code": status, "method": method,
+                            "reason": f"Closed posting marker: '{marker}'"}
+
+            return {"url": url, "alive": True, "status_code": status, "method": method, "reason": None}
+
+        except Exception as e:
+            # Network errors are inconclusive - leave the job for the browser to handle
+            return {"url": url, "alive": True, "status_code": None, "method": method,
+                    "reason": f"Check failed: {type(e).__name__}"}
+
+    async def filter_live_jobs(self, jobs: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split jobs into live and dead postings, preserving order.
+
+        Jobs without a URL are kept. Dead jobs get a ``liveness`` entry with the reason.
+
+        Args:
+            jobs: Job dictionaries with a ``url`` key
+
+        Returns:
+            Tuple of (live jobs, dead jobs)
+        """
+        results = await self.check_urls([job.get('url') for job in jobs])
+
+        live_jobs = []
+        dead_jobs = []
+        for job in jobs:
+            result = results.get(job.get('url'))
+            if result and not result["alive"]:
+                dead_jobs.append({**job, "liveness": result})
+            else:
+                live_jobs.append(job)
+
+        return live_jobs, dead_jobs
+
+    async def _request(self, session: aiohttp.ClientSession, method: str, url: str) -> Tuple[int, str]:
+        """Issue a request and return the status and (for GET) the start of the body."""
+
+        async with session.request(method, url, allow_redirects=True) as response:
+            if method == "HEAD" or response.status in self.DEAD_STATUS_CODES:
+                return response.status, ""
+
+            # read(n) returns only what is already buffered; keep reading up to the limit or EOF
+            chunks = []
+            received = 0
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                chunks.append(chunk[:self.MAX_BODY_BYTES - received])
+                received += len(chunks[-1])
+                if received >= self.MAX_BODY_BYTES:
+                    break
+            content = b"".join(chunks)
+            return response.status, content.decode(response.charset or "utf-8", errors="ignore")
+
+    def _find_closed_marker(self, body: str) -> Optional[str]:
+        """Return the first closed-posting marker found in the page body."""
+
+        body_lower = body.lower()
+        for marker in self.CLOSED_MARKERS:
+            if marker in body_lower:
+                return marker
+        return None
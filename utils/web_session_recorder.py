@@ -0,0 +1,186 @@
+"""
+Web session record/replay utilities for offline, deterministic web agent runs.
+"""
+
+import os
+import glob
+import json
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+from playwright.async_api import Page, BrowserContext, Route
+from config import Config
+
+class WebSessionRecorder:
+    """Records browser sessions to HAR/DOM archives and replays them through Playwright routing."""
+
+    MODES = ("live", "record", "replay")
+
+    def __init__(self, agent_name: str, mode: Optional[str] = None, archive_dir: Optional[str] = None):
+        self.agent_name = agent_name
+        self.mode = (mode or Config.WEB_SESSION_MODE or "live").lower()
+
+        if self.mode not in self.MODES:
+            raise ValueError(f"Unsupported web session mode: {self.mode}. Expected one of {', '.join(self.MODES)}")
+
+        self.session_dir = os.path.join(archive_dir or Config.WEB_SESSION_ARCHIVE_DIR, agent_name)
+        self.har_dir = os.path.join(self.session_dir, "har")
+        self.snapshot_dir = os.path.join(self.session_dir, "dom")
+
+        self.phase_timings: Dict[str, List[float]] = {}
+        self.har_files: List[str] = []
+        self.snapshots: List[str] = []
+        self._context_count = 0
+
+    @property
+    def is_recording(self) -> bool:
+        """Whether browser traffic is being captured."""
+        return self.mode == "record"
+
+    @property
+    def is_replaying(self) -> bool:
+        """Whether browser traffic is served from a recorded archive."""
+        return self.mode == "replay"
+
+    def context_options(self) -> Dict[str, Any]:
+        """
+        Get extra keyword arguments for ``browser.new_context``.
+
+        Each recorded context gets its own HAR file, which Playwright writes
+        when the context is closed. The first recorded context clears the
+        session's previous recording, since replay routes every HAR file in
+        the directory.
+
+        Returns:
+            Keyword arguments to merge into the context options
+        """
+        if not self.is_recording:
+            return {}
+
+        if self._context_count == 0:
+            self._clear_recording()
+        os.makedirs(self.har_dir, exist_ok=True)
+        self._context_count += 1
+        har_path = os.path.join(self.har_dir, f"context_{self._context_count:03d}.har")
+        self.har_files.append(har_path)
+
+        return {
+            "record_har_path": har_path,
+            "record_har_content": "embed",
+            "record_har_mode": "full"
+        }
+
+    def _clear_recording(self) -> None:
+        """Remove HAR files and DOM snapshots left by an earlier recording of this session."""
+
+        stale = glob.glob(os.path.join(self.har_dir, "*.har")) + glob.glob(os.path.join(self.snapshot_dir, "*.html"))
+        for path in stale:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    async def attach(self, context: BrowserContext) -> None:
+        """
+        Route a new browser context through the recorded archive when replaying.
+
+        Requests that are not covered by any recording are aborted so a replay
+        never reaches the live site.
+
+        Args:
+            context: Playwright browser context to attach to
+        """
+        if not self.is_replaying:
+            return
+
+        har_files = sorted(glob.glob(os.path.join(self.har_dir, "*.har")))
+        if not har_files:
+            raise FileNotFoundError(f"No recorded HAR files for {self.agent_name} in {self.har_dir}")
+
+        async def abort_unrecorded(route: Route):
+            await route.abort()
+
+        # Routes run in reverse registration order, so the catch-all goes first
+        await context.route("**/*", abort_unrecorded)
+        for har_path in har_files:
+            await context.route_from_har(har_path, not_found="fallback")
+
+    async def snapshot_dom(self, page: Page, label: str) -> Optional[str]:
+        """
+        Save the current page DOM while recording.
+
+        Args:
+            page: Playwright page object
+            label: Short name describing the page state
+
+        Returns:
+            Path of the saved snapshot, or None when not recording
+        """
+        if not self.is_recording or page is None:
+            return None
+
+        try:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            safe_label = "".join(c if c.isalnum() or c in "-_" else "_" for c in label)[:40]
+            snapshot_path = os.path.join(self.snapshot_dir, f"{len(self.snapshots) + 1:03d}_{safe_label}.html")
+
+            content = await page.content()
+            with open(snapshot_path, "w", encoding="utf-8") as f:
+                f.write(content)
+
+            self.snapshots.append(snapshot_path)
+            return snapshot_path
+
+        except Exception:
+            return None
+
+    @asynccontextmanager
+    async def phase(self, name: str):
+        """Time a named workflow phase (login, search, extraction, apply)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_timings.setdefault(name, []).append(time.perf_counter() - start)
+
+    def get_phase_summary(self) -> Dict[str, Dict[str, float]]:
+        """Get count, total, mean, min and max seconds for each timed phase."""
+
+        summary = {}
+        for name, durations in self.phase_timings.items():
+            if not durations:
+                continue
+            summary[name] = {
+                "count": len(durations),
+                "total": round(sum(durations), 4),
+                "mean": round(sum(durations) / len(durations), 4),
+                "min": round(min(durations), 4),
+                "max": round(max(durations), 4)
+            }
+        return summary
+
+    def reset_timings(self) -> None:
+        """Clear collected phase timings."""
+        self.phase_timings = {}
+
+    def save_manifest(self) -> Optional[str]:
+        """Write a manifest describing the recorded session."""
+
+        if not self.is_recording:
+            return None
+
+        os.makedirs(self.session_dir, exist_ok=True)
+        manifest_path = os.path.join(self.session_dir, "manifest.json")
+        manifest = {
+            "agent": self.agent_name,
+            "recorded_at": datetime.now().isoformat(),
+            "har_files": [os.path.relpath(path, self.session_dir) for path in self.har_files],
+            "snapshots": [os.path.relpath(path, self.session_dir) for path in self.snapshots],
+            "phase_timings": self.get_phase_summary()
+        }
+
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+        return manifest_path
@@ -159,6 +159,28 @@ class WebUtils:
         
         return False
     
+    @staticmethod
+    async def query_first(page: Page, selectors: List[str]) -> Optional[Any]:
+        """
+        Return the first element matching any of the selectors, without waiting.
+        
+        Args:
+            page: Playwright page object
+            selectors: List of CSS selectors to try in order
+            
+        Returns:
+            Element if found, None otherwise
+        """
+        for selector in selectors:
+            try:
+                element = await page.query_selector(selector)
+                if element:
+                    return element
+            except Exception:
+                continue
+        
+        return None
+    
     @staticmethod
     async def click_element_smart(page: Page, selectors: List[str], 
                                 timeout: int = None) -> bool: